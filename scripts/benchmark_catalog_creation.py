@@ -0,0 +1,92 @@
+import time
+import tracemalloc
+from typing import Any, Dict, Tuple
+
+import click
+from kedro.io import DataCatalog
+
+from kedro_aim.framework.hooks import AimHook
+
+
+def make_catalog_config(n_datasets: int, n_artifacts: int) -> Dict[str, Any]:
+    """Create the config of a catalog with plain datasets and artifact datasets.
+
+    Args:
+        n_datasets: The number of plain datasets.
+        n_artifacts: The number of artifact datasets.
+
+    Returns:
+        The catalog config.
+    """
+    config: Dict[str, Any] = {
+        f"dataset_{i}": {
+            "type": "pickle.PickleDataSet",
+            "filepath": f"data/dataset_{i}.pkl",
+        }
+        for i in range(n_datasets)
+    }
+    for i in range(n_artifacts):
+        config[f"artifact_{i}"] = {
+            "type": "kedro_aim.io.artifacts.AimArtifactDataSet",
+            "artifact_type": "text",
+            "name": f"artifact_{i}",
+            "data_set": {
+                "type": "text.TextDataSet",
+                "filepath": f"data/artifact_{i}.txt",
+            },
+        }
+    return config
+
+
+def create_catalog(config: Dict[str, Any]) -> Tuple[DataCatalog, float, float]:
+    """Create a catalog and replace its artifact datasets like the `AimHook` does.
+
+    Args:
+        config: The catalog config.
+
+    Returns:
+        - The catalog.
+        - The time it took kedro to create the catalog in seconds.
+        - The time it took the hook to replace the artifact datasets in seconds.
+    """
+    start = time.perf_counter()
+    catalog = DataCatalog.from_config(config)
+    created = time.perf_counter()
+    AimHook().after_catalog_created(
+        catalog=catalog,
+        conf_catalog=config,
+        conf_creds={},
+        feed_dict={},
+        save_version="",
+        load_versions="",
+    )
+    return catalog, created - start, time.perf_counter() - created
+
+
+@click.command()
+@click.option("--datasets", default=5000, help="Number of plain datasets.")
+@click.option("--artifacts", default=500, help="Number of artifact datasets.")
+@click.option("--repeat", default=5, help="Number of timed catalog creations.")
+def main(datasets: int, artifacts: int, repeat: int) -> None:
+    """Measure the time and memory of creating a catalog with artifact datasets."""
+    config = make_catalog_config(datasets, artifacts)
+    create_catalog(config)  # warm up the imports of the dataset classes
+
+    timings = [create_catalog(config)[1:] for _ in range(repeat)]
+
+    tracemalloc.start()
+    catalog, *_ = create_catalog(config)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(catalog.list()) == datasets + artifacts
+
+    click.echo(f"datasets: {datasets}, artifacts: {artifacts}")
+    catalog_time = min(timing[0] for timing in timings)
+    hook_time = min(timing[1] for timing in timings)
+    click.echo(f"catalog creation (best of {repeat}): {catalog_time * 1000:.1f} ms")
+    click.echo(f"artifact replacement (best of {repeat}): {hook_time * 1000:.1f} ms")
+    click.echo(f"memory of the catalog: {memory / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+import click
+import yaml
+from kedro.config import ConfigLoader
+
+from kedro_aim.config import KedroAimConfig
+from kedro_aim.config.utils import AIM_CONFIG_PATTERNS, load_aim_config
+
+
+def best_time(fn: Callable[[], object], repeat: int) -> float:
+    """Measure the fastest of several calls of a function.
+
+    Args:
+        fn: The function.
+        repeat: The number of calls.
+
+    Returns:
+        The time of the fastest call in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@click.command()
+@click.option("--repeat", default=200, help="Number of timed config loads.")
+def main(repeat: int) -> None:
+    """Compare loading the aim config with and without the process-level cache."""
+    with tempfile.TemporaryDirectory() as conf_source:
+        for env in ["base", "local"]:
+            (Path(conf_source) / env).mkdir()
+        template = Path(__file__).parents[1] / "src/kedro_aim/template/config/aim.yml"
+        (Path(conf_source) / "base" / "aim.yml").write_text(template.read_text())
+        (Path(conf_source) / "local" / "aim.yml").write_text(
+            yaml.dump({"run": {"experiment": "benchmark"}})
+        )
+
+        def uncached() -> KedroAimConfig:
+            loader = ConfigLoader(conf_source)
+            return KedroAimConfig.parse_obj(loader.get(*AIM_CONFIG_PATTERNS))
+
+        def cached() -> KedroAimConfig:
+            return load_aim_config(ConfigLoader(conf_source))
+
+        uncached_time = best_time(uncached, repeat)
+        cached_time = best_time(cached, repeat)
+
+    click.echo(f"uncached (best of {repeat}): {uncached_time * 1000:.2f} ms")
+    click.echo(f"cached (best of {repeat}): {cached_time * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
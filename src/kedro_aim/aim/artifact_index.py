@@ -0,0 +1,132 @@
+import hashlib
+import json
+import os
+from logging import getLogger
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from aim.storage.object import CustomObject
+
+LOGGER = getLogger(__name__)
+
+
+def content_hash(value: Union["CustomObject", List["CustomObject"]]) -> str:
+    """Compute a hash of the content of an aim object, e.g. of an `aim.Image`.
+
+    The hash is only needed for artifacts whose raw data cannot be hashed before
+    they are encoded, e.g. figures.
+
+    Args:
+        value: The aim object or a list of aim objects which are tracked as one step.
+
+    Returns:
+        The hex digest of the types and the stored content of the objects.
+    """
+    from aim.storage.utils import BLOB
+
+    digest = hashlib.blake2b(type(value).__name__.encode(), digest_size=20)
+    for obj in value if isinstance(value, list) else [value]:
+        digest.update(type(obj).__name__.encode())
+        for key, item in sorted(obj.storage.items()):
+            if isinstance(item, BLOB):
+                item = item.load()
+            if isinstance(item, str):
+                item = item.encode()
+            elif not isinstance(item, bytes):
+                item = repr(item).encode()
+            digest.update(key.encode())
+            digest.update(item)
+    return digest.hexdigest()
+
+
+class ArtifactIndex:
+    """An index from the content hash of an artifact to the run which stores it.
+
+    The content hash is computed from the raw data of the artifact, so that known
+    artifacts are neither encoded nor tracked again. Artifacts whose raw data cannot
+    be hashed are hashed after they are encoded with `content_hash`.
+
+    The index is shared by all runs of a repository and is stored as a JSON file next
+    to the data of the repository. Each entry is a reference to the stored copy of an
+    artifact with the keys `run_hash`, `name`, `context` and `step`. The `run_hash` of
+    entries which were added during the current run is only known once the run was
+    created, so it is `None` for lazily created runs until the index is saved.
+
+    Args:
+        path: The path of the JSON file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries = self._read()
+        self._added: Dict[str, Dict[str, Any]] = {}
+        self._lock = Lock()
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Look up the reference of the artifact with the given content hash.
+
+        Args:
+            digest: The content hash of the artifact.
+
+        Returns:
+            The reference to the stored copy or None if the content is unknown.
+        """
+        with self._lock:
+            return self._entries.get(digest)
+
+    def add(self, digest: str, reference: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Add the reference of a stored artifact if its content is unknown.
+
+        The reference should only be added after the artifact was tracked, so that
+        a failed write does not leave an entry behind. Several threads which track
+        the same content at the same time may therefore all store it, but only the
+        reference of the first one is kept.
+
+        Args:
+            digest: The content hash of the artifact.
+            reference: The reference to the stored copy.
+
+        Returns:
+            The reference which was already known for the content or None if the
+            reference was added.
+        """
+        with self._lock:
+            known = self._entries.get(digest)
+            if known is None:
+                self._entries[digest] = reference
+                self._added[digest] = reference
+            return known
+
+    def save(self, run_hash: Optional[str]) -> None:
+        """Write the entries that were added to the JSON file.
+
+        The file is read again before it is written, so that the entries of runs
+        which saved the index in the meantime are kept.
+
+        Args:
+            run_hash: The hash of the current run which stores the added artifacts.
+        """
+        with self._lock:
+            if not self._added:
+                return
+            entries = self._read()
+            for digest, reference in self._added.items():
+                entries.setdefault(digest, {**reference, "run_hash": run_hash})
+            self._added = {}
+
+            # replace the file atomically, so that readers never see partial writes
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(entries))
+            os.replace(tmp_path, self.path)
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text())
+        except ValueError:
+            LOGGER.warning(f"Ignoring the corrupt artifact index `{self.path}`.")
+            return {}
@@ -0,0 +1,105 @@
+import inspect
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Tuple, Type
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from aim import Distribution
+
+
+def iter_chunks(data: Any, chunk_size: int) -> Iterator[np.ndarray]:
+    """Iterate over the finite values of an array in flat chunks.
+
+    The array is split along its first axis, so memory-mapped arrays are read one
+    chunk at a time and only a chunk is held in memory.
+
+    Args:
+        data: An array-like object, e.g. a numpy array or a `np.memmap`.
+        chunk_size: The approximate number of values in each chunk.
+
+    Yields:
+        The finite values of each chunk as flat array.
+    """
+    array = np.asanyarray(data)
+    if array.ndim == 0:
+        array = array.reshape(1)
+    row_size = max(1, array[:1].size)
+    rows = max(1, chunk_size // row_size)
+    for start in range(0, len(array), rows):
+        chunk = np.asarray(array[start : start + rows], dtype=float).ravel()
+        yield chunk[np.isfinite(chunk)]
+
+
+def value_range(data: Any, chunk_size: int) -> Tuple[float, float]:
+    """Compute the range of the finite values of an array chunk by chunk.
+
+    Args:
+        data: An array-like object.
+        chunk_size: The approximate number of values in each chunk.
+
+    Returns:
+        The minimum and maximum. Like `np.histogram`, the range is widened by 0.5 on
+        both sides if all values are equal and is `(0, 1)` if there are no values.
+    """
+    low, high = np.inf, -np.inf
+    for chunk in iter_chunks(data, chunk_size):
+        if chunk.size:
+            low, high = min(low, chunk.min()), max(high, chunk.max())
+    if low > high:
+        return 0.0, 1.0
+    if low == high:
+        return low - 0.5, high + 0.5
+    return float(low), float(high)
+
+
+def make_distribution(
+    data: Any,
+    bin_count: int = 64,
+    bin_range: Optional[Tuple[float, float]] = None,
+    chunk_size: int = 1_000_000,
+) -> "Distribution":
+    """Create an aim distribution from the histogram of a potentially huge array.
+
+    The histogram is accumulated chunk by chunk, so only the bin counts are passed
+    to aim and the values are never copied as a whole. Non-finite values are
+    ignored.
+
+    Args:
+        data: An array-like object, e.g. a numpy array or a `np.memmap`.
+        bin_count: The number of bins. Defaults to 64.
+        bin_range: The range `(start, end)` of the bins. Defaults to None, in which
+            case the range of the values is computed in an additional pass.
+        chunk_size: The approximate number of values in each chunk. Defaults to
+            1_000_000.
+
+    Returns:
+        The aim distribution.
+    """
+    from aim import Distribution
+
+    if bin_range is None:
+        bin_range = value_range(data, chunk_size)
+    hist = np.zeros(bin_count, dtype=np.int64)
+    for chunk in iter_chunks(data, chunk_size):
+        hist += np.histogram(chunk, bins=bin_count, range=bin_range)[0]
+    if not _accepts_histogram(Distribution):
+        # the pinned aim 3.14 only creates distributions from the values, so the bin
+        # counts are set on an empty distribution with the same number of bins
+        distribution = Distribution(np.empty(0), bin_count=bin_count)
+        distribution._from_np_histogram((hist, np.array(bin_range, dtype=float)))
+        return distribution
+    return Distribution(hist=hist, bin_range=bin_range)  # type: ignore
+
+
+def _accepts_histogram(distribution_cls: Type["Distribution"]) -> bool:
+    """Check if a version of `aim.Distribution` can be created from bin counts.
+
+    Args:
+        distribution_cls: The `aim.Distribution` class.
+
+    Returns:
+        True if the constructor accepts `hist` and `bin_range`, as in later
+        versions of aim.
+    """
+    parameters = inspect.signature(distribution_cls.__init__).parameters
+    return "hist" in parameters and "bin_range" in parameters
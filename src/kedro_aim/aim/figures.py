@@ -0,0 +1,86 @@
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from aim import Image
+
+
+class RasterRenderer:
+    """Renders matplotlib figures to pixel arrays with one shared Agg canvas.
+
+    The canvas is attached to each figure only while it is drawn, so the figures keep
+    their own canvas. The Agg renderer of the canvas is reused as long as the figures
+    have the same size in pixels, which is the common case for the figures of one
+    dataset. matplotlib is only imported when the renderer is created, since it is
+    not a dependency of this plugin.
+    """
+
+    def __init__(self) -> None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self._canvas = FigureCanvasAgg(Figure())
+        self._lock = Lock()
+
+    def render(self, figure: Any, dpi: Optional[float] = None) -> np.ndarray:
+        """Draw a figure and return its pixels.
+
+        Args:
+            figure: The matplotlib figure.
+            dpi: The resolution of the rendered figure. Defaults to None, in which case
+                the resolution of the figure is used.
+
+        Returns:
+            The pixels as `uint8` array of shape `(H, W, 3)`, or `(H, W, 4)` if the
+            figure is not fully opaque.
+        """
+        with self._lock:
+            canvas, original_canvas, original_dpi = (
+                self._canvas,
+                figure.canvas,
+                figure.dpi,
+            )
+            canvas.figure = figure
+            figure.set_canvas(canvas)
+            try:
+                if dpi is not None:
+                    figure.dpi = dpi
+                canvas.draw()
+                pixels = np.asarray(canvas.buffer_rgba())
+                if (pixels[..., 3] == 255).all():
+                    return pixels[..., :3].copy()
+                return pixels.copy()
+            finally:
+                figure.dpi = original_dpi
+                figure.set_canvas(original_canvas)
+
+
+_RENDERER: Optional[RasterRenderer] = None
+_RENDERER_LOCK = Lock()
+
+
+def make_raster_figure(
+    figure: Any, dpi: Optional[float] = None, **kwargs: Any
+) -> "Image":
+    """Create an aim image of a matplotlib figure without converting it to plotly.
+
+    The figure is drawn by the Agg backend and the pixels are encoded only once.
+
+    Args:
+        figure: The matplotlib figure.
+        dpi: The resolution of the image. Defaults to None, in which case the
+            resolution of the figure is used.
+        **kwargs: Additional arguments of `aim.Image`, e.g. `format` or `optimize`.
+
+    Returns:
+        The aim image of the figure.
+    """
+    from aim import Image
+
+    global _RENDERER
+    with _RENDERER_LOCK:
+        if _RENDERER is None:
+            _RENDERER = RasterRenderer()
+    return Image(_RENDERER.render(figure, dpi), **kwargs)
@@ -0,0 +1,173 @@
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Union
+
+import numpy as np
+from PIL import Image as PILImage
+
+if TYPE_CHECKING:
+    from aim import Image
+
+
+def is_image_batch(data: Any) -> bool:
+    """Check if the data is a batch of images.
+
+    A batch is either a list or tuple of images or a numpy array of shape
+    `(N, H, W, C)`.
+
+    Args:
+        data: The data of an image artifact.
+
+    Returns:
+        True if the data contains several images.
+    """
+    if isinstance(data, (list, tuple)):
+        return True
+    return isinstance(data, np.ndarray) and data.ndim == 4
+
+
+def sample_indices(n_items: int, max_items: Optional[int]) -> np.ndarray:
+    """Select at most `max_items` evenly spaced indices of a batch.
+
+    The selection is deterministic, so the same batch always results in the same
+    images.
+
+    Args:
+        n_items: The number of items in the batch.
+        max_items: The maximum number of selected items or None to select all.
+
+    Returns:
+        The sorted indices of the selected items.
+    """
+    if max_items is None or n_items <= max_items:
+        return np.arange(n_items)
+    return np.unique(np.linspace(0, n_items - 1, max_items).round().astype(int))
+
+
+def to_uint8(batch: np.ndarray) -> np.ndarray:
+    """Convert a batch of images to `uint8` in one vectorized operation.
+
+    Floating point and boolean images are expected to be in the range `[0, 1]`, all
+    other images in the range `[0, 255]`. Values outside of the range are clipped.
+
+    Args:
+        batch: The images.
+
+    Returns:
+        The images as `uint8` array.
+    """
+    if batch.dtype == np.uint8:
+        return batch
+    if batch.dtype == np.bool_ or np.issubdtype(batch.dtype, np.floating):
+        batch = np.clip(batch, 0.0, 1.0) * 255.0
+        return np.rint(batch).astype(np.uint8)
+    return np.clip(batch, 0, 255).astype(np.uint8)
+
+
+def downscale_factor(height: int, width: int, max_size: Optional[int]) -> int:
+    """Compute the smallest integer factor which fits an image into `max_size`.
+
+    Args:
+        height: The height of the image.
+        width: The width of the image.
+        max_size: The maximum length of the longer side or None to keep the size.
+
+    Returns:
+        The factor by which both sides are reduced.
+    """
+    if max_size is None:
+        return 1
+    return max(1, -(-max(height, width) // max_size))
+
+
+def downscale(
+    images: np.ndarray, max_size: Optional[int], batch: bool = False
+) -> np.ndarray:
+    """Reduce the resolution of images by taking every k-th pixel.
+
+    The result is a strided view of the array, so no pixels are copied before they
+    are encoded. Taking pixels instead of averaging them also keeps the labels of
+    segmentation masks intact.
+
+    Args:
+        images: An image of shape `(H, W[, C])` or a batch of shape `(N, H, W, C)`.
+        max_size: The maximum length of the longer side or None to keep the size.
+        batch: Whether the array is a batch of images. Defaults to False.
+
+    Returns:
+        The downscaled image or batch.
+    """
+    height, width = images.shape[1:3] if batch else images.shape[:2]
+    factor = downscale_factor(height, width, max_size)
+    if factor == 1:
+        return images
+    if batch:
+        return images[:, ::factor, ::factor]
+    return images[::factor, ::factor]
+
+
+def make_image(data: Any, max_size: Optional[int] = None, **kwargs: Any) -> "Image":
+    """Create an aim image which is downscaled to `max_size` before it is encoded.
+
+    Args:
+        data: The image of any type that is supported by `aim.Image`.
+        max_size: The maximum length of the longer side. Defaults to None.
+        **kwargs: Additional arguments of `aim.Image`, e.g. `format` or `quality`.
+
+    Returns:
+        The aim image.
+    """
+    from aim import Image
+
+    if isinstance(data, np.ndarray):
+        data = downscale(data, max_size)
+    elif isinstance(data, PILImage.Image):
+        factor = downscale_factor(data.height, data.width, max_size)
+        if factor > 1:
+            data = data.reduce(factor)
+    return Image(data, **kwargs)
+
+
+def make_images(
+    data: Union[np.ndarray, Sequence[Any]],
+    max_items: Optional[int] = None,
+    max_size: Optional[int] = None,
+    **kwargs: Any,
+) -> List["Image"]:
+    """Create the aim images of a batch which is tracked as one step.
+
+    Batches of numpy arrays are sampled, downscaled, normalized and converted to
+    `uint8` as a whole before the individual images are encoded. Lists of arrays with
+    different shapes and lists of other images are converted item by item.
+
+    Args:
+        data: A numpy array of shape `(N, H, W, C)` or a list of images of any type
+            that is supported by `aim.Image`.
+        max_items: The maximum number of tracked images. Defaults to None.
+        max_size: The maximum length of the longer side of the images. Defaults to
+            None.
+        **kwargs: Additional arguments of `aim.Image`.
+
+    Returns:
+        The aim images.
+    """
+    from aim import Image
+
+    indices = sample_indices(len(data), max_items)
+    items = [data[i] for i in indices]
+    if isinstance(data, np.ndarray):
+        batch = downscale(data, max_size, batch=True)[indices]
+    elif all(isinstance(item, np.ndarray) for item in items) and (
+        len({(item.shape, item.dtype) for item in items}) == 1
+    ):
+        batch = np.stack([downscale(item, max_size) for item in items])
+    else:
+        return [
+            make_image(
+                to_uint8(downscale(item, max_size))
+                if isinstance(item, np.ndarray)
+                else item,
+                max_size,
+                **kwargs,
+            )
+            for item in items
+        ]
+    return [Image(image, **kwargs) for image in to_uint8(batch)]
@@ -0,0 +1,110 @@
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
+
+if TYPE_CHECKING:
+    from aim import Run
+
+
+class LazyRun:
+    """A handle of an `aim.Run` which creates the run on first access.
+
+    The handle behaves like the run it stands for. The run is created by calling
+    `factory` as soon as any attribute of the run is accessed. Writes which should not
+    cause the creation of the run can be buffered with `defer`. They are applied
+    right after the run is created and are dropped if the run is never created.
+    Assignments of public attributes, e.g. `run.name = ...`, are deferred as well.
+
+    Args:
+        factory: A function that creates the run.
+    """
+
+    def __init__(self, factory: Callable[[], "Run"]) -> None:
+        self._factory = factory
+        self._run: Optional["Run"] = None
+        self._deferred: List[Callable[["Run"], None]] = []
+        self._lock = RLock()
+
+    @property
+    def created(self) -> bool:
+        """Whether the run was already created.
+
+        Returns:
+            True if the run exists.
+        """
+        return self._run is not None
+
+    @property
+    def run(self) -> "Run":
+        """The run. It is created and the deferred writes are applied if necessary.
+
+        Returns:
+            The run.
+        """
+        if self._run is None:
+            with self._lock:
+                if self._run is None:
+                    run = self._factory()
+                    for fn in self._deferred:
+                        fn(run)
+                    self._deferred.clear()
+                    self._run = run
+        return self._run
+
+    def defer(self, fn: Callable[["Run"], None]) -> bool:
+        """Buffer a write until the run is created.
+
+        Args:
+            fn: A function that writes to the run.
+
+        Returns:
+            True if the write was buffered. False if the run already exists, in which
+            case the caller is responsible for applying the write.
+        """
+        with self._lock:
+            if self._run is None:
+                self._deferred.append(fn)
+                return True
+        return False
+
+    def __setitem__(self, key: str, val: Any) -> None:
+        """Set a top-level run parameter."""
+        self.run[key] = val
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a public attribute of the run, e.g. its `name`.
+
+        The assignment is deferred until the run is created. Private attributes are
+        set on the handle itself.
+        """
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+        elif not self.defer(lambda run: setattr(run, name, value)):
+            setattr(self.run, name, value)
+
+    def __getitem__(self, key: str) -> Any:
+        """Read a top-level run parameter.
+
+        Args:
+            key: The name of the parameter.
+
+        Returns:
+            The value of the parameter.
+        """
+        return self.run[key]
+
+    def __getattr__(self, name: str) -> Any:
+        """Read an attribute of the run.
+
+        Args:
+            name: The name of the attribute.
+
+        Raises:
+            AttributeError: If a private attribute is requested.
+
+        Returns:
+            The attribute of the run.
+        """
+        # private names are not forwarded to avoid recursion during unpickling
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.run, name)
@@ -0,0 +1,128 @@
+from typing import TYPE_CHECKING, Any, Optional, Set
+
+from kedro_aim.aim.utils import SequenceKey, sequence_key
+from kedro_aim.aim.writer import AsyncRunWriter
+
+if TYPE_CHECKING:
+    from aim import Run
+    from aim.sdk.types import AimObject
+
+
+class RunProxy:
+    """A stand-in for `aim.Run` which forwards all writes to an `AsyncRunWriter`.
+
+    The proxy exposes the writing part of the `aim.Run` interface. Calls to
+    `track`, `set`, `add_tag`, `remove_tag`, item assignment and the assignment of
+    public attributes, e.g. `run.name = ...`, return immediately and are applied to
+    the run by the writer thread. All other attributes are read
+    from the run after the pending writes have been flushed.
+
+    Tracked values are applied later, so they should not be mutated after they were
+    passed to the proxy.
+
+    If the writer uses the queue of a multiprocessing manager, the proxy can be
+    pickled and used in worker processes, e.g. of the `ParallelRunner`. Its writes
+    are then applied by the writer in the main process. Reading from the run is only
+    possible in the main process.
+
+    Args:
+        writer: The writer which applies the writes to the run.
+        sequences: A set to which the keys of the tracked sequences are added.
+            Defaults to None.
+    """
+
+    def __init__(
+        self, writer: AsyncRunWriter, sequences: Optional[Set[SequenceKey]] = None
+    ) -> None:
+        self._writer = writer
+        self._sequences = sequences
+
+    def track(
+        self,
+        value: Any,
+        name: Optional[str] = None,
+        step: Optional[int] = None,
+        epoch: Optional[int] = None,
+        *,
+        context: "AimObject" = None,
+    ) -> None:
+        """Queue tracking of a value. See `aim.Run.track` for the arguments."""
+        if self._sequences is not None:
+            # a dict of values is tracked as one sequence per key
+            names = value if name is None and isinstance(value, dict) else [name]
+            self._sequences.update(
+                sequence_key(key, context) for key in names if key is not None
+            )
+        self._writer.submit(
+            "track", value, name=name, step=step, epoch=epoch, context=context
+        )
+
+    def set(self, key: Any, val: "AimObject", strict: bool = True) -> None:
+        """Queue setting of a run parameter. See `aim.Run.set` for the arguments."""
+        self._writer.submit("set", key, val, strict=strict)
+
+    def add_tag(self, value: str) -> None:
+        """Queue adding a tag to the run. See `aim.Run.add_tag` for the arguments."""
+        self._writer.submit("add_tag", value)
+
+    def remove_tag(self, tag_name: str) -> None:
+        """Queue removing a tag. See `aim.Run.remove_tag` for the arguments."""
+        self._writer.submit("remove_tag", tag_name)
+
+    def __setitem__(self, key: str, val: "AimObject") -> None:
+        """Queue setting of a top-level run parameter."""
+        self._writer.submit("__setitem__", key, val)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Queue setting of a public attribute of the run, e.g. its `name`.
+
+        Private attributes are set on the proxy itself.
+        """
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+        else:
+            self._writer.submit("__setattr__", name, value)
+
+    def __getitem__(self, key: str) -> Any:
+        """Read a top-level run parameter after all pending writes are applied.
+
+        Args:
+            key: The name of the parameter.
+
+        Returns:
+            The value of the parameter.
+        """
+        return self._synced_run()[key]
+
+    def __getattr__(self, name: str) -> Any:
+        """Read an attribute of the run after all pending writes are applied.
+
+        Args:
+            name: The name of the attribute.
+
+        Raises:
+            AttributeError: If a private attribute is requested.
+
+        Returns:
+            The attribute of the run.
+        """
+        # private names are not forwarded to avoid recursion during unpickling
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._synced_run(), name)
+
+    def _synced_run(self) -> "Run":
+        """Return the run after all pending writes are applied.
+
+        Raises:
+            RuntimeError: If the proxy is used in another process than the writer.
+
+        Returns:
+            The run of the writer.
+        """
+        self._writer.flush()
+        if self._writer.run is None:
+            raise RuntimeError(
+                "The aim run can only be read in the process that created it."
+            )
+        return self._writer.run
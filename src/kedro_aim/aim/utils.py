@@ -1,11 +1,15 @@
-from typing import Generator
+from typing import TYPE_CHECKING, Generator, Tuple
 
-from aim import Run
-from aim.sdk.query_utils import SequenceView
-from aim.sdk.sequence import Sequence
+if TYPE_CHECKING:
+    from aim import Run
+    from aim.sdk.query_utils import SequenceView
+    from aim.sdk.types import AimObject
 
+# identifies a sequence of a run by its name and the hash of its context
+SequenceKey = Tuple[str, int]
 
-def list_metrics_in_run(run: Run) -> Generator[SequenceView, None, None]:
+
+def list_metrics_in_run(run: "Run") -> Generator["SequenceView", None, None]:
     """List all metrics in the run.
 
     HACK: This is a workaround for the `metrics` property of `aim.Run` which is broken.
@@ -17,18 +21,37 @@ def list_metrics_in_run(run: Run) -> Generator[SequenceView, None, None]:
     Yields:
         The metrics that are contained in the run.
     """
+    from aim.sdk.sequence import Sequence
+
     for seq_name, ctx, run in run.iter_sequence_info_by_type("*"):
         yield Sequence(seq_name, ctx, run)  # type: ignore
 
 
-def list_metrics_names_in_run(run: Run) -> Generator[str, None, None]:
-    """List the names of all metrics in the run.
+def sequence_key(name: str, context: "AimObject" = None) -> SequenceKey:
+    """Create the key which identifies a sequence in a run.
+
+    Args:
+        name: The name of the sequence.
+        context: The context of the sequence.
+
+    Returns:
+        The name of the sequence and the hash of its context.
+    """
+    from aim.storage.context import Context
+
+    return name, Context(context).idx
+
+
+def list_sequence_keys_in_run(run: "Run") -> Generator[SequenceKey, None, None]:
+    """List the keys of all sequences in the run.
+
+    In contrast to `list_metrics_in_run`, no `Sequence` objects are created.
 
     Args:
         run: A aim run object.
 
     Yields:
-        The names of the metrics that are contained in the run.
+        The keys of the sequences that are contained in the run.
     """
-    for metric in list_metrics_in_run(run):
-        yield metric.name
+    for seq_name, ctx, _ in run.iter_sequence_info_by_type("*"):
+        yield seq_name, ctx.idx
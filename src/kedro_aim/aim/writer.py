@@ -0,0 +1,163 @@
+import os
+from collections import deque
+from logging import getLogger
+from queue import Queue
+from threading import Lock, Thread, local
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from aim import Run
+
+LOGGER = getLogger(__name__)
+
+# marker which tells the writer thread to stop after the pending writes. It has to
+# survive pickling, since it may be sent through the queue of a multiprocessing manager
+_STOP = None
+
+
+class AsyncRunWriter:
+    """Applies writes to an aim run from a dedicated background thread.
+
+    Writes are submitted as method calls on the run. Each submitting thread collects
+    its writes in a buffer of its own and hands them to a bounded queue in batches,
+    so that threads do not contend for the queue on every write. The writer thread is
+    the only thread which writes to the run. It applies the batches in the order in
+    which they were queued, so the writes of each thread are applied in the order in
+    which they were submitted. If a call fails, the error is raised in a submitting
+    thread on the next call to `submit`, `flush` or `close`.
+
+    If the writer is created with the queue of a multiprocessing manager, it can be
+    pickled and sent to other processes. Only the queue is shared with the copies, so
+    their writes are applied by the writer thread of the original process and the
+    copies have no access to the run.
+
+    Args:
+        run: The run to which the writes are applied.
+        queue_size: Maximum number of pending batches before `submit` blocks.
+        batch_size: Number of writes a thread buffers before it queues them.
+        queue: A queue which is used instead of creating a new one, e.g. the queue
+            of a multiprocessing manager. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        run: "Run",
+        queue_size: int = 10000,
+        batch_size: int = 100,
+        queue: Optional["Queue[Any]"] = None,
+    ):
+        self.run: Optional["Run"] = run
+        self.batch_size = batch_size
+        self._queue: "Queue[Any]" = (
+            Queue(maxsize=queue_size) if queue is None else queue
+        )
+        self._error: Optional[BaseException] = None
+        # buffers of the submitting threads. Only used in the process of the writer
+        self._pid: Optional[int] = os.getpid()
+        self._local = local()
+        self._buffers: List[Deque[Any]] = []
+        self._buffers_lock = Lock()
+        self._thread: Optional[Thread] = Thread(
+            target=self._work, name="kedro-aim-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state which is shared with copies in other processes.
+
+        Returns:
+            The batch size and the queue of the writer.
+        """
+        return {"batch_size": self.batch_size, "_queue": self._queue}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a copy which submits its writes to the queue of the original.
+
+        Args:
+            state: The state returned by `__getstate__`.
+        """
+        self.__dict__.update(state)
+        self.run = None
+        self._error = None
+        self._pid = None
+        self._thread = None
+
+    def submit(self, method: str, *args: Any, **kwargs: Any) -> None:
+        """Queue a call of `method` on the run.
+
+        Args:
+            method: The name of the run method, e.g. `track` or `__setitem__`.
+            *args: Positional arguments of the call.
+            **kwargs: Keyword arguments of the call.
+        """
+        self._raise_error()
+        op = (method, args, kwargs)
+        if self._pid != os.getpid():
+            # copies in other processes send every write to the original directly
+            self._queue.put([op])
+            return
+        buffer = self._thread_buffer()
+        buffer.append(op)
+        if len(buffer) >= self.batch_size:
+            self._queue_buffer(buffer)
+
+    def flush_thread(self) -> None:
+        """Queue the buffered writes of the calling thread without waiting for them."""
+        if self._pid == os.getpid():
+            self._queue_buffer(self._thread_buffer())
+
+    def flush(self) -> None:
+        """Block until all writes submitted by the calling thread are applied."""
+        self.flush_thread()
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Apply the writes of all threads and stop the writer thread."""
+        if self._thread is not None and self._thread.is_alive():
+            for buffer in self._buffers:
+                self._queue_buffer(buffer)
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._raise_error()
+
+    def _thread_buffer(self) -> Deque[Any]:
+        buffer: Optional[Deque[Any]] = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._local.buffer = deque()
+            with self._buffers_lock:
+                self._buffers.append(buffer)
+        return buffer
+
+    def _queue_buffer(self, buffer: Deque[Any]) -> None:
+        # `popleft` is atomic, so a buffer can be drained while its thread appends
+        batch = []
+        while buffer:
+            batch.append(buffer.popleft())
+        if batch:
+            self._queue.put(batch)
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _work(self) -> None:
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is _STOP:
+                    return
+                for op in batch:
+                    self._apply(op)
+            finally:
+                self._queue.task_done()
+
+    def _apply(self, op: Tuple[str, Tuple[Any, ...], Any]) -> None:
+        method, args, kwargs = op
+        try:
+            getattr(self.run, method)(*args, **kwargs)
+        except Exception as e:
+            LOGGER.error(f"Failed to apply `{method}` to the aim run: {e}")
+            if self._error is None:
+                self._error = e
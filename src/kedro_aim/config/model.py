@@ -1,8 +1,11 @@
 from typing import List, Optional
 
-from aim.ext.resource import DEFAULT_SYSTEM_TRACKING_INT
 from pydantic import BaseModel, Extra, Field
 
+# the default of `aim.ext.resource`. It is not imported from aim, so that the config
+# can be read without the cost of importing aim
+DEFAULT_SYSTEM_TRACKING_INT = 10
+
 
 class UiOptions(BaseModel):
     """Options for the ui command."""
@@ -12,6 +15,15 @@ class Config:
 
     port: int = Field(default=43800, description="Port to run the aim UI on.")
     host: str = Field(default="127.0.0.1", description="Host to run the aim UI on.")
+    workers: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Number of worker processes of the aim UI. Default of aim if None.",
+    )
+    dev: bool = Field(
+        default=False,
+        description="Enable/Disable the development mode of the aim UI.",
+    )
 
 
 class RunOptions(BaseModel):
@@ -54,6 +66,13 @@ class Config:
     tags: List[str] = Field(
         default_factory=list, description="List of tags for the run."
     )
+    lazy: bool = Field(
+        default=False,
+        description=(
+            "Enable/Disable lazy creation of the run. If enabled, the run is only "
+            "created when it is used by a node or an artifact dataset."
+        ),
+    )
 
 
 class RepositoryOptions(BaseModel):
@@ -74,12 +93,124 @@ class Config:
     )
 
 
+class TrackingOptions(BaseModel):
+    """Options for how values are written to the run."""
+
+    class Config:
+        extra = Extra.forbid
+
+    asynchronous: bool = Field(
+        default=False,
+        description=(
+            "Enable/Disable tracking through a background writer thread. If enabled, "
+            "nodes receive a proxy of the run which queues writes instead of "
+            "blocking on the repository. Enabled automatically for the `ThreadRunner`."
+        ),
+    )
+    multiprocess: bool = Field(
+        default=False,
+        description=(
+            "Enable/Disable tracking from worker processes. If enabled, nodes receive "
+            "a picklable proxy of the run which sends all writes to the main process. "
+            "Implies `asynchronous` and is enabled automatically for the "
+            "`ParallelRunner`."
+        ),
+    )
+    queue_size: int = Field(
+        default=10000,
+        gt=0,
+        description=(
+            "Maximum number of pending batches of writes before tracking calls block. "
+            "Only used if `asynchronous` or `multiprocess` is enabled."
+        ),
+    )
+    batch_size: int = Field(
+        default=100,
+        gt=0,
+        description=(
+            "Number of writes a thread buffers before it hands them to the background "
+            "writer. "
+            "Only used if `asynchronous` or `multiprocess` is enabled."
+        ),
+    )
+    artifact_workers: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Number of threads which create and track the aim objects of artifacts "
+            "while the wrapped datasets save the data. Set to 0 to track artifacts "
+            "synchronously. Implies `asynchronous` if greater than 0."
+        ),
+    )
+    deduplicate_artifacts: bool = Field(
+        default=False,
+        description=(
+            "Enable/Disable content-addressed artifacts. If enabled, an artifact whose "
+            "content was already stored in the repository is not stored again. "
+            "Instead, a reference to the stored copy is added to the "
+            "`artifact_references` of the run."
+        ),
+    )
+
+
+class InstrumentationOptions(BaseModel):
+    """Options for the instrumentation of the pipeline."""
+
+    class Config:
+        extra = Extra.forbid
+
+    nodes: bool = Field(
+        default=False,
+        description=(
+            "Enable/Disable tracking of the wall time, CPU time, input and output "
+            "counts and the approximate output size of each node as metrics. "
+            "The metrics are tracked in one batch at the end of the pipeline."
+        ),
+    )
+    datasets: bool = Field(
+        default=False,
+        description=(
+            "Enable/Disable tracking of the load and save latency of each dataset as "
+            "metrics. The latencies are aggregated in memory and tracked at the end "
+            "of the pipeline."
+        ),
+    )
+    dataset_sizes: bool = Field(
+        default=False,
+        description=(
+            "Enable/Disable tracking of the size of the file of each dataset if "
+            "`datasets` is enabled. The size is requested from the filesystem after "
+            "each load and save, which is an extra request on remote filesystems."
+        ),
+    )
+
+
 class DisableOptions(BaseModel):
     """Options for the disable command."""
 
     pipelines: List[str] = Field(
         default_factory=list,
-        description="List of pipelines in which tracking with aim will be disabled.",
+        description="List of pipelines in which tracking with aim will be disabled. "
+        "Entries are glob patterns or regular expressions prefixed with `re:`.",
+    )
+    nodes: List[str] = Field(
+        default_factory=list,
+        description="List of node names for which parameter logging and artifact "
+        "tracking will be disabled. Entries are glob patterns or regular expressions "
+        "prefixed with `re:`.",
+    )
+    tags: List[str] = Field(
+        default_factory=list,
+        description="List of node tags for which parameter logging and artifact "
+        "tracking will be disabled. Entries are glob patterns or regular expressions "
+        "prefixed with `re:`.",
+    )
+    namespaces: List[str] = Field(
+        default_factory=list,
+        description="List of namespaces of modular pipelines for which parameter "
+        "logging and artifact tracking will be disabled, including their nested "
+        "namespaces. Entries are glob patterns or regular expressions prefixed with "
+        "`re:`.",
     )
 
 
@@ -94,6 +225,12 @@ class Config:
     repository: RepositoryOptions = Field(
         RepositoryOptions(), description="Configurations for the aim repository."
     )
+    tracking: TrackingOptions = Field(
+        TrackingOptions(), description="Options for writing values to the run."
+    )
+    instrumentation: InstrumentationOptions = Field(
+        InstrumentationOptions(), description="Options for instrumenting the pipeline."
+    )
     disable: DisableOptions = Field(
         DisableOptions(), description="Options for disabling aim tracking."
     )
@@ -1,11 +1,22 @@
-from typing import Optional
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple
 
-from aim.sdk.repo import Repo
+from kedro_aim.config.model import KedroAimConfig, RepositoryOptions
 
-from kedro_aim.config.model import RepositoryOptions
+if TYPE_CHECKING:
+    from aim.sdk.repo import Repo
 
+# patterns of the files which contain the config of this plugin
+AIM_CONFIG_PATTERNS = ["aim*", "aim*/**"]
 
-def load_repository(cfg: RepositoryOptions) -> Optional[Repo]:
+# the parsed configs of this process, keyed on the config loader. Each entry holds the
+# state of the config files from which the config was parsed
+_CONFIG_CACHE: Dict[Hashable, Tuple[Hashable, KedroAimConfig]] = {}
+_CONFIG_CACHE_LOCK = Lock()
+
+
+def load_repository(cfg: RepositoryOptions) -> Optional["Repo"]:
     """Load the a aim repository from the config options.
 
     Args:
@@ -17,4 +28,85 @@ def load_repository(cfg: RepositoryOptions) -> Optional[Repo]:
     if cfg.path is None:
         return None
     else:
+        from aim.sdk.repo import Repo
+
         return Repo(path=cfg.path, read_only=cfg.read_only, init=cfg.init)
+
+
+def local_repository_path(cfg: RepositoryOptions) -> Optional[Path]:
+    """Get the path of the folder in which a local repository stores its data.
+
+    Args:
+        cfg: Config for the repository.
+
+    Returns:
+        The path of the `.aim` folder or None if the repository is remote.
+    """
+    from aim.sdk.configs import get_aim_repo_name
+    from aim.sdk.repo import Repo
+    from aim.sdk.utils import clean_repo_path
+
+    path = cfg.path if cfg.path is not None else Repo.default_repo_path()
+    if Repo.is_remote_path(path):
+        return None
+    return Path(clean_repo_path(path)) / get_aim_repo_name()
+
+
+def config_files_state(conf_paths: List[str]) -> Tuple[Tuple[str, int, int], ...]:
+    """Get the paths, modification times and sizes of the files of the aim config.
+
+    Args:
+        conf_paths: The config folders of the environments of the project.
+
+    Returns:
+        A tuple with the path, the modification time in nanoseconds and the size of
+        each file which matches the patterns of the aim config, i.e. of the `aim*`
+        files and of all files in `aim*` folders.
+    """
+    state = []
+    for conf_path in conf_paths:
+        for match in sorted(Path(conf_path).glob("aim*")):
+            # `glob` only yields the folders for the `aim*/**` pattern
+            paths = sorted(match.rglob("*")) if match.is_dir() else [match]
+            for path in paths:
+                if path.is_file():
+                    stat = path.stat()
+                    state.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(state)
+
+
+def load_aim_config(config_loader: Any) -> KedroAimConfig:
+    """Load the aim config with the config loader of a Kedro context.
+
+    The parsed config is cached for the lifetime of the process. It is parsed again
+    if a config file was added, removed or modified or if the config loader uses
+    other environments or parameters. Config loaders without `conf_paths` are not
+    cached. Like the config loader, it raises a `MissingConfigException` if no
+    config file is found.
+
+    Args:
+        config_loader: The config loader of the context.
+
+    Returns:
+        A copy of the cached config, which may be modified by the caller.
+    """
+    conf_paths = getattr(config_loader, "conf_paths", None)
+    if conf_paths is None:
+        return KedroAimConfig.parse_obj(config_loader.get(*AIM_CONFIG_PATTERNS))
+
+    key = (
+        type(config_loader),
+        tuple(conf_paths),
+        repr(getattr(config_loader, "runtime_params", None)),
+        repr(getattr(config_loader, "_config_mapping", None)),
+    )
+    state = config_files_state(conf_paths)
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(key)
+    if cached is None or cached[0] != state:
+        config = KedroAimConfig.parse_obj(config_loader.get(*AIM_CONFIG_PATTERNS))
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE[key] = (state, config)
+    else:
+        config = cached[1]
+    return config.copy(deep=True)
@@ -6,11 +6,12 @@
 import click
 from click.core import Command, Context
 from kedro.framework.project import settings
-from kedro.framework.session import KedroSession
 from kedro.framework.startup import _is_project, bootstrap_project
 
-from kedro_aim.config import KedroAimConfig
-from kedro_aim.framework.cli.cli_utils import write_jinja_template
+from kedro_aim.framework.cli.cli_utils import (
+    load_project_aim_config,
+    write_jinja_template,
+)
 
 LOGGER = getLogger(__name__)
 TEMPLATE_FOLDER_PATH = Path(__file__).parent.parent.parent / "template" / "config"
@@ -174,31 +175,41 @@ def init(env: str, force: bool, silent: bool) -> None:
         "server from other machines."
     ),
 )
-def ui(env: str, port: int, host: str) -> None:
+@click.option(
+    "--workers",
+    "-w",
+    required=False,
+    type=int,
+    help="The number of worker processes of the UI server.",
+)
+@click.option(
+    "--dev",
+    is_flag=True,
+    default=False,
+    help="Run the UI server in development mode with auto reload.",
+)
+def ui(
+    env: str, port: Optional[int], host: str, workers: Optional[int], dev: bool
+) -> None:
     """Start the aim UI.
 
     Opens the aim user interface with the project-specific settings of aim.yml.
-    This interface enables to browse and compares runs.
+    This interface enables to browse and compares runs. Only the aim config of the
+    environment is read, no Kedro session is created.
     """
     project_path = Path().cwd()
     bootstrap_project(project_path)
-    with KedroSession.create(
-        project_path=project_path,
-        env=env,
-    ) as session:
-
-        context = session.load_context()
-        aim_config: KedroAimConfig = context.aim  # type: ignore
-        host = host or aim_config.ui.host
-        port = port or aim_config.ui.port
-
-        subprocess.call(
-            [
-                "aim",
-                "up",
-                "--port",
-                str(port),
-                "--host",
-                host,
-            ]
-        )
+    aim_config = load_project_aim_config(project_path, env)
+    host = host or aim_config.ui.host
+    port = port or aim_config.ui.port
+    workers = workers or aim_config.ui.workers
+    dev = dev or aim_config.ui.dev
+
+    command = ["aim", "up", "--port", str(port), "--host", host]
+    if aim_config.repository.path is not None:
+        command += ["--repo", aim_config.repository.path]
+    if workers is not None:
+        command += ["--workers", str(workers)]
+    if dev:
+        command.append("--dev")
+    subprocess.call(command)
@@ -1,7 +1,15 @@
+from logging import getLogger
 from pathlib import Path
 from typing import Any, Union
 
 from jinja2 import Environment, FileSystemLoader
+from kedro.config import MissingConfigException
+from kedro.framework.project import settings
+
+from kedro_aim.config import KedroAimConfig
+from kedro_aim.config.utils import load_aim_config
+
+LOGGER = getLogger(__name__)
 
 
 def render_jinja_template(
@@ -59,3 +67,29 @@ def write_jinja_template(
     parsed_template = render_jinja_template(src, **kwargs)
     with open(dst, "w") as file_handler:
         file_handler.write(parsed_template)
+
+
+def load_project_aim_config(project_path: Path, env: str) -> KedroAimConfig:
+    """Load the aim config of a project without creating a session or a context.
+
+    Only the config loader of the project settings is created, so that no hooks,
+    catalog or parameters are loaded. The project must be bootstrapped before.
+
+    Args:
+        project_path: The path of the Kedro project.
+        env: The environment of the config.
+
+    Returns:
+        The aim config or the default config if no `aim.yml` exists.
+    """
+    config_loader = settings.CONFIG_LOADER_CLASS(  # type: ignore
+        conf_source=str(project_path / settings.CONF_SOURCE),  # type: ignore
+        env=env,
+        runtime_params={},
+        **settings.CONFIG_LOADER_ARGS,  # type: ignore
+    )
+    try:
+        return load_aim_config(config_loader)
+    except MissingConfigException:
+        LOGGER.warning("No 'aim.yml' config file found in environment")
+        return KedroAimConfig()
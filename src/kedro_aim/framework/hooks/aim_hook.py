@@ -1,8 +1,13 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import partial
 from logging import getLogger
-from typing import Any, Dict, Optional
+from multiprocessing import Manager
+from multiprocessing.managers import SyncManager
+from threading import Lock, local
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set, Tuple, Union
 
-from aim import Run
 from kedro.config import MissingConfigException
 from kedro.framework.context import KedroContext
 from kedro.framework.hooks import hook_impl
@@ -10,10 +15,38 @@
 from kedro.pipeline import Pipeline
 from kedro.pipeline.node import Node
 
+from kedro_aim.aim.artifact_index import ArtifactIndex
+from kedro_aim.aim.lazy import LazyRun
+from kedro_aim.aim.proxy import RunProxy
+from kedro_aim.aim.utils import SequenceKey, list_sequence_keys_in_run
+from kedro_aim.aim.writer import AsyncRunWriter
 from kedro_aim.config import KedroAimConfig
-from kedro_aim.config.utils import load_repository
-from kedro_aim.framework.hooks.utils import check_aim_enabled
-from kedro_aim.io.artifacts import AimArtifactDataSet, make_run_dataset
+from kedro_aim.config.utils import (
+    load_aim_config,
+    load_repository,
+    local_repository_path,
+)
+from kedro_aim.framework.hooks.instrumentation import (
+    DatasetProfiler,
+    NodeProfiler,
+    track_dataset_stats,
+    track_node_stats,
+)
+from kedro_aim.framework.hooks.utils import (
+    DisableMatcher,
+    select_changed_params,
+    uses_multiprocessing,
+    uses_threading,
+)
+from kedro_aim.io.artifacts import (
+    AimArtifactDataSet,
+    AimArtifactDataSetChild,
+    make_run_dataset,
+)
+from kedro_aim.io.metrics import AimMetricsDataSet, make_metrics_dataset
+
+if TYPE_CHECKING:
+    from aim import Run
 
 LOGGER = getLogger(__name__)
 
@@ -32,10 +65,44 @@ class AimHook:
 
     - Creating the Aim run before the pipeline is run.
     - Adding the Aim run to the catlog.
+
+    If the run is created lazily, the catalog contains a `LazyRun` which creates the
+    run on first use. If asynchronous tracking is enabled, the catalog contains a
+    `RunProxy` instead of the run and all writes are applied by a background
+    `AsyncRunWriter`. For worker processes, e.g. of the `ParallelRunner`, the writer
+    receives the writes through the queue of a multiprocessing manager.
+
+    The hook and the artifact datasets are safe to use with the `ThreadRunner`. For
+    this runner asynchronous tracking is always enabled, so that the writer thread is
+    the only thread which writes to the run. The writes of a node are applied in the
+    order in which they were made.
     """
 
-    run: Optional[Run] = None
+    run: Optional["Run"] = None
+    lazy_run: Optional[LazyRun] = None
+    run_proxy: Optional[RunProxy] = None
+    writer: Optional[AsyncRunWriter] = None
     aim_confg: KedroAimConfig
+    disable_matcher: Optional[DisableMatcher] = None
+    node_profiler: Optional[NodeProfiler] = None
+    dataset_profiler: Optional[DatasetProfiler] = None
+
+    def __init__(self) -> None:
+        # fingerprints of the parameters that were logged to the current run
+        self._param_fingerprints: Dict[str, str] = {}
+        self._param_lock = Lock()
+        # keys of the sequences that were tracked to the current run
+        self.tracked_sequences: Set[SequenceKey] = set()
+        # the pool which tracks artifacts in the background and its first error
+        self._artifact_pool: Optional[ThreadPoolExecutor] = None
+        self._artifact_error: Optional[BaseException] = None
+        # the index of the stored artifacts if they are deduplicated
+        self.artifact_index: Optional[ArtifactIndex] = None
+        # the process which runs the pipeline and the manager for its worker processes
+        self._main_pid: Optional[int] = None
+        self._manager: Optional[SyncManager] = None
+        # whether tracking is disabled for the node which the thread currently runs
+        self._node_scope = local()
 
     @hook_impl
     def after_context_created(
@@ -52,17 +119,17 @@ def after_context_created(
         """
         # Find the AimConfig in the context
         try:
-            conf_aim_yml = context.config_loader.get("aim*", "aim*/**")
+            aim_config = load_aim_config(context.config_loader)
         except MissingConfigException:
             LOGGER.warning("No 'aim.yml' config file found in environment")
-            conf_aim_yml = {}
-        aim_config = KedroAimConfig.parse_obj(conf_aim_yml)
+            aim_config = KedroAimConfig()
 
         # store in context for interactive use
         context.__setattr__("aim", aim_config)
 
         # store for further reuse
         self.aim_config = aim_config
+        self.disable_matcher = DisableMatcher(aim_config.disable)
 
     @hook_impl
     def after_catalog_created(
@@ -77,7 +144,8 @@ def after_catalog_created(
         """Hooks to be invoked after a data catalog is created.
 
         Im this hook we go through all the datasets in the catalog an replace the
-        datasets that are of type `AimArtifactDataSet` with a special aim dataset.
+        datasets that are of type `AimArtifactDataSet` or `AimMetricsDataSet` with a
+        special aim dataset.
 
         Args:
             catalog: The catalog that was created.
@@ -89,11 +157,14 @@ def after_catalog_created(
             load_versions: The load_versions used in `load` operations
                 for each dataset in the catalog.
         """
-        # HACK: Replace all AimArtifactDataSet with a AimArtifactDataSetChild dataset.
+        # HACK: Replace all AimArtifactDataSet with a AimArtifactDataSetChild dataset
+        # and all AimMetricsDataSet with a AimMetricsDataSetChild dataset.
         # This is needed to pass a reference of the run to the dataset.
         for name, dataset in catalog._data_sets.items():
             if isinstance(dataset, AimArtifactDataSet):
                 catalog._data_sets[name] = make_run_dataset(self, dataset)
+            elif isinstance(dataset, AimMetricsDataSet):
+                catalog._data_sets[name] = make_metrics_dataset(self, dataset)
 
     @hook_impl
     def before_pipeline_run(
@@ -103,6 +174,8 @@ def before_pipeline_run(
 
         Before the pipeline runs, we create the Aim run and add it to the catalog
         under the name `run`. This allows us to access the run in the pipeline.
+        If `run.lazy` is enabled, a `LazyRun` is added instead which only creates the
+        run when it is used.
 
         Args:
             run_params: The params used to run the pipeline.
@@ -129,28 +202,94 @@ def before_pipeline_run(
             pipeline: The `Pipeline` that will be run.
             catalog: The `DataCatalog` to be used during the run.
         """
-        if check_aim_enabled(run_params["pipeline_name"], self.aim_config):
-            # Create the Aim Run
-            self.run = Run(
-                run_hash=self.aim_config.run.run_hash,
-                repo=load_repository(self.aim_config.repository),
-                experiment=self.aim_config.run.experiment,
-                system_tracking_interval=self.aim_config.run.system_tracking_interval,
-                log_system_params=self.aim_config.run.log_system_params,
-                capture_terminal_logs=self.aim_config.run.capture_terminal_logs,
+        matcher = self.disable_matcher
+        if matcher is None or not matcher.pipeline_disabled(
+            run_params["pipeline_name"]
+        ):
+            self._param_fingerprints = {}
+            self.tracked_sequences = set()
+            self._main_pid = os.getpid()
+
+            # Create the Aim Run, or a handle which creates it on first use
+            create_run = partial(self._create_run, run_params)
+            if self.aim_config.run.lazy:
+                self.run = None
+                self.lazy_run = LazyRun(create_run)
+            else:
+                create_run()
+
+            # route all writes through a background writer if enabled or if nodes or
+            # artifacts are tracked concurrently, so that only the writer thread
+            # writes to the run
+            tracking = self.aim_config.tracking
+            multiprocess = tracking.multiprocess or uses_multiprocessing(run_params)
+            concurrent = (
+                uses_threading(run_params)
+                or tracking.artifact_workers > 0
+                or any(
+                    isinstance(dataset, AimArtifactDataSetChild)
+                    and dataset.uses_threads
+                    for dataset in catalog._data_sets.values()
+                )
             )
-
-            # log run paramerters
-            self.run["kedro"] = run_params
-
-            # add tags
-            for tag in self.aim_config.run.tags:
-                self.run.add_tag(tag)
+            if tracking.asynchronous or multiprocess or concurrent:
+                # writes of worker processes are sent through the queue of a manager
+                queue = None
+                if multiprocess:
+                    self._manager = Manager()
+                    queue = self._manager.Queue(maxsize=tracking.queue_size)
+
+                self.writer = AsyncRunWriter(
+                    self.tracking_run,  # type: ignore
+                    queue_size=tracking.queue_size,
+                    batch_size=tracking.batch_size,
+                    queue=queue,
+                )
+                self.run_proxy = RunProxy(self.writer, self.tracked_sequences)
+
+            # the reservoirs of the copies in worker processes are never drained
+            if multiprocess:
+                reservoirs = [
+                    name
+                    for name, dataset in catalog._data_sets.items()
+                    if isinstance(dataset, AimArtifactDataSetChild)
+                    and dataset.uses_reservoir
+                ]
+                if reservoirs:
+                    LOGGER.warning(
+                        "The `reservoir` sampling of the datasets "
+                        f"{', '.join(reservoirs)} only applies to saves in the main "
+                        "process."
+                    )
+
+            # look up the stored artifacts of the repository if enabled
+            if tracking.deduplicate_artifacts:
+                self.artifact_index = self._load_artifact_index()
+
+            # track artifacts in the background if enabled
+            if tracking.artifact_workers > 0:
+                self._artifact_pool = ThreadPoolExecutor(
+                    max_workers=tracking.artifact_workers,
+                    thread_name_prefix="kedro-aim-artifact",
+                )
+
+            # measure the nodes if enabled
+            instrumentation = self.aim_config.instrumentation
+            if instrumentation.nodes:
+                self.node_profiler = NodeProfiler()
+            if instrumentation.datasets:
+                if multiprocess:
+                    LOGGER.warning(
+                        "The datasets of worker processes are not instrumented."
+                    )
+                self.dataset_profiler = DatasetProfiler(
+                    catalog, sizes=instrumentation.dataset_sizes
+                )
 
             # save run in catalog
             assert not catalog.exists("run"), "catalog already contains a 'run' dataset"
             catalog.add("run", MemoryDataSet(copy_mode="assign"))
-            catalog.save("run", self.run)
+            catalog.save("run", self.tracking_run)
 
     @hook_impl
     def before_node_run(
@@ -163,7 +302,12 @@ def before_node_run(
     ) -> None:
         """Hook to be invoked before a node runs.
 
-        All `parameters` that are passed to the node are logged to the run.
+        All `parameters` that are passed to the node are logged to the run. Parameters
+        which were already logged with the same value are skipped, so that a parameter
+        tree consumed by many nodes is only written once. Nothing is logged for nodes
+        which are disabled in the `disable` section of the config. If
+        `instrumentation.nodes` is enabled, the measurement of the node starts after
+        the parameters are logged.
 
         Args:
             node: The `Node` to run.
@@ -174,13 +318,150 @@ def before_node_run(
             is_async: Whether the node was run in `async` mode.
             session_id: The id of the session.
         """
-        if self.run is not None:
+        if self._enter_node(node):
+            return
+        run = self.tracking_run
+        if run is None:
+            # spawned worker processes of the `ParallelRunner` have no run of their
+            # own, but the catalog contains the proxy of the run in the main process
+            run = _load_run_proxy(catalog)
+        if run is not None:
             # only parameters will be logged.
+            params = {}
             for k, v in inputs.items():
                 if k.startswith("params:"):
-                    self.run[k[7:]] = v
+                    params[k[7:]] = v
                 elif k == "parameters":
-                    self.run[k] = v
+                    params[k] = v
+
+            # only write the parameters that changed since they were last logged
+            with self._param_lock:
+                changed = select_changed_params(params, self._param_fingerprints)
+
+            # buffer the parameters if the run was not yet created
+            if changed and not self._defer(partial(_set_params, params=changed)):
+                _set_params(run, changed)
+
+        if self.node_profiler is not None:
+            self.node_profiler.start()
+
+    @hook_impl
+    def after_node_run(
+        self,
+        node: Node,
+        catalog: DataCatalog,
+        inputs: Dict[str, Any],
+        outputs: Dict[str, Any],
+        is_async: bool,
+        session_id: str,
+    ) -> None:
+        """Hook to be invoked after a node runs.
+
+        The statistics of the node are buffered if `instrumentation.nodes` is enabled.
+        Worker processes of the `ParallelRunner` send them to the run right away.
+        The writes which the node buffered in its thread are handed to the writer.
+
+        Args:
+            node: The `Node` that ran.
+            catalog: A `DataCatalog` containing the node's inputs and outputs.
+            inputs: The dictionary of inputs dataset.
+            outputs: The dictionary of outputs dataset.
+            is_async: Whether the node was run in `async` mode.
+            session_id: The id of the session.
+        """
+        if self.node_profiler is not None:
+            stats = self.node_profiler.stop(node, inputs, outputs)
+            if stats is not None and self._main_pid != os.getpid():
+                run = _load_run_proxy(catalog)
+                if run is not None:
+                    track_node_stats(run, self.node_profiler.pop_stats())
+        self._leave_node()
+        self._flush_thread()
+
+    @hook_impl
+    def before_dataset_loaded(self, dataset_name: str, node: Node) -> None:
+        """Hook to be invoked before a dataset is loaded from the catalog.
+
+        Artifact datasets which are loaded by a disabled node skip their tracking.
+        The measurement of the load starts if `instrumentation.datasets` is enabled.
+
+        Args:
+            dataset_name: The name of the dataset to be loaded.
+            node: The node which loads the dataset.
+        """
+        self._enter_node(node)
+        if self.dataset_profiler is not None:
+            self.dataset_profiler.start(dataset_name)
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name: str, data: Any, node: Node) -> None:
+        """Hook to be invoked after a dataset is loaded from the catalog.
+
+        Args:
+            dataset_name: The name of the dataset that was loaded.
+            data: The actual data that was loaded.
+            node: The node which loaded the dataset.
+        """
+        if self.dataset_profiler is not None:
+            self.dataset_profiler.stop(dataset_name, "load")
+        self._leave_node()
+
+    @hook_impl
+    def before_dataset_saved(self, dataset_name: str, data: Any, node: Node) -> None:
+        """Hook to be invoked before a dataset is saved to the catalog.
+
+        Artifact datasets which are saved by a disabled node skip their tracking.
+        The measurement of the save starts if `instrumentation.datasets` is enabled.
+
+        Args:
+            dataset_name: The name of the dataset to be saved.
+            data: The actual data to be saved.
+            node: The node which saves the dataset.
+        """
+        self._enter_node(node)
+        if self.dataset_profiler is not None:
+            self.dataset_profiler.start(dataset_name)
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name: str, data: Any) -> None:
+        """Hook to be invoked after a dataset is saved in the catalog.
+
+        The artifacts which were tracked while saving the dataset are handed to the
+        writer, so that they are visible to the nodes which load the dataset.
+
+        Args:
+            dataset_name: The name of the dataset that was saved.
+            data: The actual data that was saved.
+        """
+        if self.dataset_profiler is not None:
+            self.dataset_profiler.stop(dataset_name, "save")
+        self._leave_node()
+        self._flush_thread()
+
+    @hook_impl
+    def on_node_error(
+        self,
+        error: Exception,
+        node: Node,
+        catalog: DataCatalog,
+        inputs: Dict[str, Any],
+        is_async: bool,
+        session_id: str,
+    ) -> None:
+        """Hook to be invoked if a node run throws an uncaught error.
+
+        The writes which the node buffered in its thread are handed to the writer.
+
+        Args:
+            error: The uncaught exception thrown during the node run.
+            node: The `Node` that failed.
+            catalog: A `DataCatalog` containing the node's inputs and outputs.
+            inputs: The dictionary of inputs dataset.
+            is_async: Whether the node was run in `async` mode.
+            session_id: The id of the session.
+        """
+        self._leave_node()
+        self._flush_thread()
 
     @hook_impl
     def after_pipeline_run(
@@ -191,7 +472,8 @@ def after_pipeline_run(
     ) -> None:
         """Hook to be invoked after a pipeline runs.
 
-        After the pipeline runs, we close the Aim run and add `StatusTag.SUCCESS` tag.
+        After the pipeline runs, we track the buffered statistics of the nodes and
+        datasets, close the Aim run and add `StatusTag.SUCCESS` tag.
 
         Args:
             run_params: The params used to run the pipeline.
@@ -217,11 +499,28 @@ def after_pipeline_run(
 
             pipeline: The `Pipeline` that was run.
             catalog: The `DataCatalog` used during the run.
+
+        Raises:
+            error: The first error of tracking an artifact in the background or of
+                applying a write of the background writer.
         """
-        if self.run is not None:
-            self.run.add_tag(StatusTag.SUCCESS)
-            self.run.finalize()
-            self.run.close()
+        # the run is marked as failed if an artifact or a write could not be tracked,
+        # but it is always closed before the error is raised
+        error: Optional[BaseException] = None
+        try:
+            self._track_node_stats()
+            self._track_dataset_stats()
+            self._track_sampled_artifacts(catalog)
+            self._wait_for_artifacts()
+        except Exception as e:
+            error = e
+        try:
+            self._close_writer()
+        except Exception as e:
+            error = error or e
+        self._end_run(StatusTag.SUCCESS if error is None else StatusTag.FAILURE)
+        if error is not None:
+            raise error
 
     @hook_impl
     def on_pipeline_error(
@@ -260,10 +559,292 @@ def on_pipeline_error(
             pipeline: The ``Pipeline`` that will was run.
             catalog: The ``DataCatalog`` used during the run.
         """
+        steps: Tuple[Callable[[], None], ...] = (
+            self._track_node_stats,
+            self._track_dataset_stats,
+            partial(self._track_sampled_artifacts, catalog),
+            self._wait_for_artifacts,
+            self._close_writer,
+        )
+        for finish in steps:
+            try:
+                finish()
+            except Exception as e:  # pragma: no cover
+                LOGGER.error(f"Failed to write pending values to the aim run: {e}")
+        self._end_run(StatusTag.FAILURE)
+
+    @property
+    def tracking_run(self) -> Optional[Union["Run", LazyRun, RunProxy]]:
+        """The object through which values are written to the run.
+
+        Returns:
+            The `RunProxy` if asynchronous tracking is enabled, the `LazyRun` if the run
+            is created lazily and the run itself otherwise. `None` if no run is active.
+        """
+        if self.run_proxy is not None:
+            return self.run_proxy
+        if self.lazy_run is not None:
+            return self.lazy_run
+        return self.run
+
+    @property
+    def node_tracking_disabled(self) -> bool:
+        """Whether tracking is disabled for the node which the calling thread runs.
+
+        Returns:
+            True if the node matches one of the rules of the `disable` section.
+        """
+        return getattr(self._node_scope, "disabled", False)
+
+    @property
+    def run_hash(self) -> Optional[str]:
+        """The hash of the run.
+
+        Returns:
+            The hash of the run or None if the run was not yet created.
+        """
+        return self.run.hash if self.run is not None else None
+
+    def resolve_run_hash(self) -> Optional[str]:
+        """Get the hash of the run and create a lazy run first if necessary.
+
+        Returns:
+            The hash of the run or None if no run is active.
+        """
+        if self.lazy_run is not None and self._main_pid == os.getpid():
+            self.lazy_run.run  # creates the run
+        return self.run_hash
+
+    def sequence_tracked(self, key: SequenceKey) -> bool:
+        """Check if a sequence was already tracked to the run.
+
+        The sequences of a resumed run are only listed when the run is created. So a
+        lazy run which resumes an existing run is created before the first check.
+
+        Args:
+            key: The key of the sequence.
+
+        Returns:
+            True if the sequence is contained in the run.
+        """
+        if (
+            self.lazy_run is not None
+            and self.aim_config.run.run_hash is not None
+            and self._main_pid == os.getpid()
+        ):
+            self.lazy_run.run  # creates the run and lists its sequences
+        return key in self.tracked_sequences
+
+    def submit_artifact(self, track: Callable[[], None]) -> None:
+        """Track an artifact in the background if `tracking.artifact_workers` is set.
+
+        Errors of the background tracking are raised at the end of the pipeline.
+
+        Args:
+            track: A function that creates the aim object and tracks it to the run.
+        """
+        if self._artifact_pool is None:
+            track()
+        else:
+            self._artifact_pool.submit(self._track_artifact, track)
+
+    def _track_artifact(self, track: Callable[[], None]) -> None:
+        """Track an artifact in a thread of the artifact pool.
+
+        Args:
+            track: A function that creates the aim object and tracks it to the run.
+        """
+        try:
+            track()
+        except Exception as e:
+            LOGGER.error(f"Failed to track artifact: {e}")
+            if self._artifact_error is None:
+                self._artifact_error = e
+        finally:
+            self._flush_thread()
+
+    def _track_sampled_artifacts(self, catalog: DataCatalog) -> None:
+        """Track the artifacts which were kept in the reservoirs of their datasets.
+
+        Args:
+            catalog: The `DataCatalog` used during the run.
+        """
+        for dataset in catalog._data_sets.values():
+            if isinstance(dataset, AimArtifactDataSetChild):
+                dataset.flush_samples()
+
+    def _track_node_stats(self) -> None:
+        """Track the buffered statistics of the nodes in one batch if enabled."""
+        if self.node_profiler is None:
+            return
+        profiler, self.node_profiler = self.node_profiler, None
+        stats = profiler.pop_stats()
+        run = self.tracking_run
+        if stats and run is not None:
+            # statistics alone do not create a lazy run
+            if not self._defer(partial(track_node_stats, stats=stats)):
+                track_node_stats(run, stats)
+
+    def _track_dataset_stats(self) -> None:
+        """Track the aggregated statistics of the datasets if enabled."""
+        if self.dataset_profiler is None:
+            return
+        profiler, self.dataset_profiler = self.dataset_profiler, None
+        stats = profiler.pop_stats()
+        run = self.tracking_run
+        if stats and run is not None:
+            # statistics alone do not create a lazy run
+            if not self._defer(partial(track_dataset_stats, stats=stats)):
+                track_dataset_stats(run, stats)
+
+    def _wait_for_artifacts(self) -> None:
+        """Wait until the artifact pool tracked all artifacts and stop it if present.
+
+        Raises:
+            error: The first error which occured in the artifact pool.
+        """
+        if self._artifact_pool is not None:
+            pool, self._artifact_pool = self._artifact_pool, None
+            pool.shutdown(wait=True)
+        if self._artifact_error is not None:
+            error, self._artifact_error = self._artifact_error, None
+            raise error
+
+    def _load_artifact_index(self) -> Optional[ArtifactIndex]:
+        """Load the index of the artifacts which are stored in the repository.
+
+        Returns:
+            The index or None if the repository is remote.
+        """
+        path = local_repository_path(self.aim_config.repository)
+        if path is None:
+            LOGGER.warning("Artifacts of remote repositories are not deduplicated.")
+            return None
+        return ArtifactIndex(path / "kedro_aim_artifacts.json")
+
+    def _create_run(self, run_params: Dict[str, Any]) -> "Run":
+        """Create the Aim run and log the run parameters and tags.
+
+        Args:
+            run_params: The params used to run the pipeline.
+
+        Returns:
+            The created run.
+        """
+        from aim import Run
+
+        self.run = Run(
+            run_hash=self.aim_config.run.run_hash,
+            repo=load_repository(self.aim_config.repository),
+            experiment=self.aim_config.run.experiment,
+            system_tracking_interval=self.aim_config.run.system_tracking_interval,
+            log_system_params=self.aim_config.run.log_system_params,
+            capture_terminal_logs=self.aim_config.run.capture_terminal_logs,
+        )
+
+        # the sequences of a resumed run are only listed once
+        if self.aim_config.run.run_hash is not None:
+            self.tracked_sequences.update(list_sequence_keys_in_run(self.run))
+
+        # log run paramerters
+        self.run["kedro"] = run_params
+
+        # add tags
+        for tag in self.aim_config.run.tags:
+            self.run.add_tag(tag)
+
+        return self.run
+
+    def _enter_node(self, node: Node) -> bool:
+        """Record whether tracking is disabled for the node of the calling thread.
+
+        Args:
+            node: The node which the calling thread runs.
+
+        Returns:
+            True if tracking is disabled for the node.
+        """
+        matcher = self.disable_matcher
+        disabled = (
+            self._node_scope.disabled
+        ) = matcher is not None and matcher.node_disabled(node)
+        return disabled
+
+    def _leave_node(self) -> None:
+        """Reset the node of the calling thread after the node used the catalog."""
+        self._node_scope.disabled = False
+
+    def _defer(self, fn: Callable[["Run"], None]) -> bool:
+        """Buffer a write if the run is created lazily and does not exist yet.
+
+        Args:
+            fn: A function that writes to the run.
+
+        Returns:
+            True if the write was buffered and False if it has to be applied now.
+        """
+        # copies of the lazy run in worker processes can not create the run
+        return (
+            self.lazy_run is not None
+            and self._main_pid == os.getpid()
+            and self.lazy_run.defer(fn)
+        )
+
+    def _end_run(self, status: StatusTag) -> None:
+        """Tag the run with its status and close it if it was created.
+
+        Args:
+            status: The status of the pipeline run.
+        """
+        self.lazy_run = None
+        if self.artifact_index is not None:
+            self.artifact_index.save(self.run_hash)
+            self.artifact_index = None
         if self.run is not None:
-            self.run.add_tag(StatusTag.FAILURE)
+            self.run.add_tag(status)
             self.run.finalize()
             self.run.close()
 
+    def _flush_thread(self) -> None:
+        """Hand the writes buffered by the calling thread to the writer if present."""
+        if self.writer is not None:
+            self.writer.flush_thread()
+
+    def _close_writer(self) -> None:
+        """Apply all pending writes and stop the background writer if present."""
+        try:
+            if self.writer is not None:
+                writer, self.writer, self.run_proxy = self.writer, None, None
+                writer.close()
+        finally:
+            if self._manager is not None:
+                self._manager.shutdown()
+                self._manager = None
+
+
+def _load_run_proxy(catalog: DataCatalog) -> Optional[RunProxy]:
+    """Load the proxy of the run from the catalog if it contains one.
+
+    Args:
+        catalog: The catalog of the node.
+
+    Returns:
+        The proxy of the run or None if the catalog contains no proxy.
+    """
+    run_dataset = catalog._data_sets.get("run")
+    run = run_dataset.load() if run_dataset is not None else None
+    return run if isinstance(run, RunProxy) else None
+
+
+def _set_params(run: Any, params: Dict[str, Any]) -> None:
+    """Write parameters to a run.
+
+    Args:
+        run: The run or a stand-in for the run.
+        params: Mapping from the name of the parameter to its value.
+    """
+    for k, v in params.items():
+        run[k] = v
+
 
 aim_hook = AimHook()
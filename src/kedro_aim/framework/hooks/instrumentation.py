@@ -0,0 +1,301 @@
+import sys
+from threading import Lock, local
+from time import perf_counter, thread_time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from kedro.io import AbstractDataSet, DataCatalog
+from kedro.pipeline.node import Node
+
+from kedro_aim.io.artifacts import AimArtifactDataSetChild
+from kedro_aim.io.artifacts.spill import file_location
+
+
+def approximate_size(data: Any) -> int:
+    """Estimate the size of a value in memory without traversing its content.
+
+    Arrays and pandas series report the size of their buffers, data frames the
+    sum of the buffers of their blocks and all other values the size of the object
+    itself as reported by `sys.getsizeof`. So the outputs of a node are never copied
+    or traversed when it is measured.
+
+    Args:
+        data: The value.
+
+    Returns:
+        The approximate size in bytes.
+    """
+    nbytes = getattr(data, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    # the block manager of a `DataFrame`, which is much cheaper than `memory_usage`
+    blocks = getattr(getattr(data, "_mgr", None), "blocks", None)
+    if blocks is not None:
+        return sum(block.values.nbytes for block in blocks)
+    try:
+        return sys.getsizeof(data)
+    except TypeError:
+        return 0
+
+
+class NodeStats(NamedTuple):
+    """The statistics of one node run."""
+
+    node: str
+    namespace: Optional[str]
+    wall_time: float
+    cpu_time: float
+    inputs: int
+    outputs: int
+    output_bytes: int
+
+    @property
+    def context(self) -> Dict[str, Any]:
+        """The context with which the metrics of the node are tracked.
+
+        Returns:
+            The name and the namespace of the node.
+        """
+        return {"node": self.node, "namespace": self.namespace}
+
+    def metrics(self) -> Dict[str, float]:
+        """The metrics of the node run.
+
+        Returns:
+            Mapping from the name of the metric to its value.
+        """
+        metrics: Dict[str, float] = {
+            "node_wall_time": self.wall_time,
+            "node_cpu_time": self.cpu_time,
+            "node_inputs": self.inputs,
+            "node_outputs": self.outputs,
+            "node_output_bytes": self.output_bytes,
+        }
+        if self.wall_time > 0:
+            metrics["node_throughput"] = self.output_bytes / self.wall_time
+        return metrics
+
+
+class NodeProfiler:
+    """Measures the wall time, CPU time and outputs of the nodes of a pipeline.
+
+    The start of a node is stored per thread, so nodes of the `ThreadRunner` are
+    measured independently. The CPU time is the time of the thread which runs the
+    node. The statistics are buffered until they are tracked in one batch with
+    `track_node_stats`.
+    """
+
+    def __init__(self) -> None:
+        self._scope = local()
+        self._stats: List[NodeStats] = []
+        self._lock = Lock()
+
+    def start(self) -> None:
+        """Start measuring the node of the calling thread."""
+        self._scope.start = (perf_counter(), thread_time())
+
+    def stop(
+        self, node: Node, inputs: Dict[str, Any], outputs: Dict[str, Any]
+    ) -> Optional[NodeStats]:
+        """Stop measuring the node of the calling thread and buffer its statistics.
+
+        Args:
+            node: The node that ran.
+            inputs: The inputs of the node.
+            outputs: The outputs of the node.
+
+        Returns:
+            The statistics of the node or None if the node was not started.
+        """
+        wall_end, cpu_end = perf_counter(), thread_time()
+        start = getattr(self._scope, "start", None)
+        if start is None:
+            return None
+        self._scope.start = None
+        stats = NodeStats(
+            node=node.name,
+            namespace=node.namespace,
+            wall_time=wall_end - start[0],
+            cpu_time=cpu_end - start[1],
+            inputs=len(inputs),
+            outputs=len(outputs),
+            output_bytes=sum(approximate_size(data) for data in outputs.values()),
+        )
+        with self._lock:
+            self._stats.append(stats)
+        return stats
+
+    def pop_stats(self) -> List[NodeStats]:
+        """Remove and return the buffered statistics.
+
+        Returns:
+            The statistics of the nodes in the order in which they finished.
+        """
+        with self._lock:
+            stats, self._stats = self._stats, []
+        return stats
+
+
+def track_node_stats(run: Any, stats: Iterable[NodeStats]) -> None:
+    """Track the statistics of nodes as metrics of a run.
+
+    Args:
+        run: The run or a stand-in for the run.
+        stats: The statistics of the nodes.
+    """
+    for node_stats in stats:
+        context = node_stats.context
+        for name, value in node_stats.metrics().items():
+            run.track(value, name=name, context=context)
+
+
+def file_size(data_set: AbstractDataSet, saved: bool) -> Optional[int]:
+    """Get the size of the file in which a dataset stores its data.
+
+    Args:
+        data_set: The dataset. Artifact datasets are replaced by the wrapped dataset.
+        saved: Whether the size of the saved or of the loaded version is requested.
+
+    Returns:
+        The size in bytes or None if the dataset does not store its data in a file
+        of a `fsspec` filesystem.
+    """
+    if isinstance(data_set, AimArtifactDataSetChild):
+        data_set = data_set._data_set
+    fs = getattr(data_set, "_fs", None)
+    if fs is None:
+        return None
+    location = file_location(data_set, saved)
+    if location is None:
+        return None
+    try:
+        return int(fs.size(location["path"]))
+    except OSError:
+        return None
+
+
+class DatasetStats:
+    """The aggregated statistics of the loads or the saves of one dataset.
+
+    Args:
+        dataset: The name of the dataset.
+        operation: Either `load` or `save`.
+    """
+
+    __slots__ = ("dataset", "operation", "count", "total_time", "max_time", "bytes")
+
+    def __init__(self, dataset: str, operation: str) -> None:
+        self.dataset = dataset
+        self.operation = operation
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.bytes: Optional[int] = None
+
+    def add(self, duration: float, size: Optional[int] = None) -> None:
+        """Add the duration and the size of one load or save.
+
+        Args:
+            duration: The duration in seconds.
+            size: The size of the file in bytes or None if it is unknown.
+        """
+        self.count += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+        if size is not None:
+            self.bytes = (self.bytes or 0) + size
+
+    def metrics(self) -> Dict[str, float]:
+        """The metrics of the dataset.
+
+        Returns:
+            Mapping from the name of the metric to its value. The bytes are only
+            included if the size of the file was known for at least one call.
+        """
+        prefix = f"dataset_{self.operation}"
+        metrics: Dict[str, float] = {
+            f"{prefix}_count": self.count,
+            f"{prefix}_time": self.total_time,
+            f"{prefix}_max_time": self.max_time,
+        }
+        if self.bytes is not None:
+            metrics[f"{prefix}_bytes"] = self.bytes
+        return metrics
+
+
+class DatasetProfiler:
+    """Measures the latency of the loads and saves of the datasets of a catalog.
+
+    The durations are aggregated in memory per dataset and operation. If `sizes` is
+    set, the size of the file is looked up after each load or save, outside of the
+    measured duration, so files which change between the calls are counted with
+    their actual sizes. The lookup is a request to the filesystem of the dataset,
+    which is a round trip on remote filesystems.
+
+    Args:
+        catalog: The catalog of the pipeline.
+        sizes: Whether the sizes of the files are aggregated as well.
+    """
+
+    def __init__(self, catalog: DataCatalog, sizes: bool = False) -> None:
+        self._catalog = catalog
+        self._sizes = sizes
+        self._scope = local()
+        self._stats: Dict[Tuple[str, str], DatasetStats] = {}
+        self._lock = Lock()
+
+    def start(self, dataset_name: str) -> None:
+        """Start measuring a load or save of the calling thread.
+
+        Args:
+            dataset_name: The name of the dataset.
+        """
+        starts = getattr(self._scope, "starts", None)
+        if starts is None:
+            starts = self._scope.starts = {}
+        starts[dataset_name] = perf_counter()
+
+    def stop(self, dataset_name: str, operation: str) -> None:
+        """Stop measuring a load or save of the calling thread.
+
+        Args:
+            dataset_name: The name of the dataset.
+            operation: Either `load` or `save`.
+        """
+        end = perf_counter()
+        start = getattr(self._scope, "starts", {}).pop(dataset_name, None)
+        if start is None:
+            return
+        size = None
+        if self._sizes:
+            data_set = self._catalog._data_sets.get(dataset_name)
+            if data_set is not None:
+                size = file_size(data_set, saved=operation == "save")
+        key = (dataset_name, operation)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = DatasetStats(dataset_name, operation)
+            stats.add(end - start, size)
+
+    def pop_stats(self) -> List[DatasetStats]:
+        """Remove and return the aggregated statistics.
+
+        Returns:
+            The statistics sorted by the total time, the slowest dataset first.
+        """
+        with self._lock:
+            stats, self._stats = list(self._stats.values()), {}
+        return sorted(stats, key=lambda s: s.total_time, reverse=True)
+
+
+def track_dataset_stats(run: Any, stats: Iterable[DatasetStats]) -> None:
+    """Track the statistics of datasets as metrics of a run.
+
+    Args:
+        run: The run or a stand-in for the run.
+        stats: The statistics of the datasets.
+    """
+    for dataset_stats in stats:
+        context = {"dataset": dataset_stats.dataset}
+        for name, value in dataset_stats.metrics().items():
+            run.track(value, name=name, context=context)
@@ -1,14 +1,163 @@
-from kedro_aim.config import KedroAimConfig
+import fnmatch
+import hashlib
+import pickle
+import re
+from typing import Any, Dict, Iterable, List, Optional, Pattern
 
+from kedro.pipeline.node import Node
 
-def check_aim_enabled(pipeline_name: str, aim_config: KedroAimConfig) -> bool:
-    """Check if Aim is enabled for the given pipeline.
+from kedro_aim.config.model import DisableOptions
+
+REGEX_PREFIX = "re:"
+
+
+def compile_patterns(patterns: Iterable[str]) -> Optional[Pattern[str]]:
+    """Compile a list of patterns into a single regular expression.
+
+    Patterns are glob patterns, unless they are prefixed with `re:`, in which case
+    the rest of the pattern is used as a regular expression. A name matches if it
+    fully matches any of the patterns.
+
+    Args:
+        patterns: The glob patterns and regular expressions.
+
+    Returns:
+        The compiled expression or None if no patterns are given.
+    """
+    expressions = [
+        pattern[len(REGEX_PREFIX) :]
+        if pattern.startswith(REGEX_PREFIX)
+        else fnmatch.translate(pattern)
+        for pattern in patterns
+    ]
+    if not expressions:
+        return None
+    return re.compile("|".join(f"(?:{expression})" for expression in expressions))
+
+
+def _matches(pattern: Optional[Pattern[str]], names: Iterable[str]) -> bool:
+    return pattern is not None and any(pattern.fullmatch(name) for name in names)
+
+
+def _namespace_prefixes(namespace: Optional[str]) -> List[str]:
+    if not namespace:
+        return []
+    parts = namespace.split(".")
+    return [".".join(parts[: i + 1]) for i in range(len(parts))]
+
+
+class DisableMatcher:
+    """Decides whether tracking is disabled for a pipeline or a node.
+
+    The rules of the `disable` section of the config are compiled once into one
+    regular expression per kind of rule. The decision for a node is cached by the
+    name of the node, so each node is only matched against the rules once.
+
+    A node is disabled if its name, one of its tags or its namespace matches a rule.
+    Nested namespaces are disabled together with their parent namespace.
+
+    Args:
+        options: The `disable` section of the config.
+    """
+
+    def __init__(self, options: DisableOptions) -> None:
+        self._pipelines = compile_patterns(options.pipelines)
+        self._nodes = compile_patterns(options.nodes)
+        self._tags = compile_patterns(options.tags)
+        self._namespaces = compile_patterns(options.namespaces)
+        self._node_decisions: Dict[str, bool] = {}
+
+    def pipeline_disabled(self, pipeline_name: str) -> bool:
+        """Check if tracking is disabled for the given pipeline.
+
+        Args:
+            pipeline_name: Name of the pipeline.
+
+        Returns:
+            True if the pipeline matches one of the rules for pipelines.
+        """
+        return _matches(self._pipelines, [pipeline_name])
+
+    def node_disabled(self, node: Node) -> bool:
+        """Check if parameter logging and artifact tracking is disabled for a node.
+
+        Args:
+            node: The node.
+
+        Returns:
+            True if the node matches one of the rules for nodes, tags or namespaces.
+        """
+        disabled = self._node_decisions.get(node.name)
+        if disabled is None:
+            disabled = self._node_decisions[node.name] = (
+                _matches(self._nodes, [node.name])
+                or _matches(self._tags, node.tags)
+                or _matches(self._namespaces, _namespace_prefixes(node.namespace))
+            )
+        return disabled
+
+
+def uses_multiprocessing(run_params: Dict[str, Any]) -> bool:
+    """Check if the pipeline is run by a runner which uses worker processes.
+
+    Args:
+        run_params: The params used to run the pipeline.
+
+    Returns:
+        A boolean indicating whether the nodes are run in worker processes.
+    """
+    return "ParallelRunner" in str(run_params.get("runner", ""))
+
+
+def uses_threading(run_params: Dict[str, Any]) -> bool:
+    """Check if the pipeline is run by a runner which runs nodes in multiple threads.
+
+    Args:
+        run_params: The params used to run the pipeline.
+
+    Returns:
+        A boolean indicating whether the nodes are run concurrently in threads.
+    """
+    return "ThreadRunner" in str(run_params.get("runner", ""))
+
+
+def fingerprint(value: Any) -> Optional[str]:
+    """Compute a fingerprint of a value to detect if it has changed.
+
+    Args:
+        value: The value for which the fingerprint is computed.
+
+    Returns:
+        A hash of the pickled value or None if the value can not be pickled.
+    """
+    try:
+        return hashlib.sha1(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)).hexdigest()
+    except Exception:
+        return None
+
+
+def select_changed_params(
+    params: Dict[str, Any], fingerprints: Dict[str, str]
+) -> Dict[str, Any]:
+    """Select the parameters whose value differs from the last logged value.
+
+    The fingerprints of the selected parameters are updated in place, so the same
+    value will not be selected again. Values without a fingerprint are always
+    selected.
 
     Args:
-        pipeline_name: Name of the pipeline.
-        aim_config: Kedro-Aim configuration.
+        params: Mapping from the name of the parameter to its value.
+        fingerprints: Mapping from the name of a logged parameter to the fingerprint
+            of its last logged value.
 
     Returns:
-        A boolean indicating whether Aim is enabled for the given pipeline.
+        The parameters that need to be logged.
     """
-    return pipeline_name not in aim_config.disable.pipelines
+    changed = {}
+    for key, value in params.items():
+        value_fingerprint = fingerprint(value)
+        if value_fingerprint is None or fingerprints.get(key) != value_fingerprint:
+            changed[key] = value
+            if value_fingerprint is not None:
+                fingerprints[key] = value_fingerprint
+    return changed
@@ -1 +1,9 @@
-from .aim_artifact_dataset import AimArtifactDataSet, make_run_dataset
+from .aim_artifact_dataset import (
+    AimArtifactDataSet,
+    AimArtifactDataSetChild,
+    AimArtifactPartitionedDataSetChild,
+    AimArtifactStreamDataSet,
+    AimArtifactStreamDataSetChild,
+    make_run_dataset,
+)
+from .sampling import SamplingOptions
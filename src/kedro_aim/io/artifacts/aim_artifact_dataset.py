@@ -1,16 +1,38 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from enum import Enum
+from functools import lru_cache, partial
 from logging import getLogger
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, Set, Tuple
 
-from aim import Audio, Figure, Image, Text
-from kedro.io import AbstractDataSet
+from kedro.io import AbstractDataSet, PartitionedDataSet
 from kedro.io.core import parse_dataset_definition
 
-from kedro_aim.aim.utils import list_metrics_names_in_run
-from kedro_aim.framework import hooks
+from kedro_aim.aim.artifact_index import ArtifactIndex, content_hash
+from kedro_aim.aim.distributions import make_distribution
+from kedro_aim.aim.figures import make_raster_figure
+from kedro_aim.aim.images import is_image_batch, make_image, make_images
+from kedro_aim.aim.proxy import RunProxy
+from kedro_aim.aim.utils import SequenceKey, sequence_key
+from kedro_aim.io.artifacts.sampling import ArtifactSampler, SamplingOptions
+from kedro_aim.io.artifacts.spill import (
+    SpilledArtifact,
+    exceeds_size,
+    file_location,
+    partition_location,
+    payload_hash,
+)
+from kedro_aim.io.core import RunDataSetMixin
+
+if TYPE_CHECKING:
+    from kedro_aim.framework import hooks
 
 LOGGER = getLogger(__name__)
 
+# size of the previews of artifacts which are not stored in the repository
+PREVIEW_CHARS = 1000
+PREVIEW_SIZE = 256
+
 
 class ArtifactType(str, Enum):
     """Enumeration of the artifact types that can be used to tag metrics."""
@@ -19,6 +41,14 @@ class ArtifactType(str, Enum):
     FIGURE = "figure"
     TEXT = "text"
     AUDIO = "audio"
+    DISTRIBUTION = "distribution"
+
+
+class FigureBackend(str, Enum):
+    """Enumeration of the ways in which matplotlib figures are tracked."""
+
+    PLOTLY = "plotly"
+    RASTER = "raster"
 
 
 class AimArtifactDataSet(AbstractDataSet[Any, Any]):
@@ -34,7 +64,29 @@ class AimArtifactDataSet(AbstractDataSet[Any, Any]):
         name: The name that is used to save the artifact to Aim.
         data_set: The dataset that is used to load the artifact.
         context: The run context of artifact. Defaults to {}.
-        save_args: Additional parameters that are passed to aim. Defaults to None.
+        save_args: Additional parameters that are passed to aim. For distributions
+            they are passed to `make_distribution`. Defaults to None.
+        max_items: The maximum number of images that are tracked of a batch of images.
+            The images are sampled evenly from the batch. Defaults to None.
+        max_size: The maximum length of the longer side of tracked images. Larger
+            images are downscaled by an integer factor before they are encoded. Use
+            the `format` and `quality` of the `save_args` to choose the encoding.
+            Defaults to None.
+        sampling: Options which select the saves that are tracked, see
+            `SamplingOptions`. Skipped saves are only saved to the wrapped dataset.
+            Defaults to None, in which case every save is tracked.
+        figure_backend: How matplotlib figures are tracked. "plotly" converts them
+            to an `aim.Figure`, "raster" renders them to an `aim.Image`. Defaults to
+            "plotly".
+        dpi: The resolution of figures which are rendered to images. Defaults to
+            None, in which case the resolution of the figure is used.
+        partition_workers: The number of threads which track the partitions of a
+            `PartitionedDataSet` in parallel. Defaults to 4.
+        max_embedded_size: The maximum size in bytes of texts, images and audio
+            which are stored in the repository. Larger artifacts are only stored in
+            the file of the wrapped dataset. The run references the file and only a
+            preview is tracked. Defaults to None, in which case all artifacts are
+            stored in the repository.
     """
 
     def __init__(
@@ -44,16 +96,36 @@ def __init__(
         data_set: Dict[str, Any],
         context: Dict[str, Any] = {},
         save_args: Optional[Dict[str, Any]] = None,
+        max_items: Optional[int] = None,
+        max_size: Optional[int] = None,
+        sampling: Optional[Dict[str, Any]] = None,
+        figure_backend: FigureBackend = FigureBackend.PLOTLY,
+        dpi: Optional[float] = None,
+        partition_workers: int = 4,
+        max_embedded_size: Optional[int] = None,
     ) -> None:
         assert (
             artifact_type in ArtifactType.__members__.values()
         ), f"Invalid artifact type `{artifact_type}`."
+        assert max_items is None or max_items > 0, "`max_items` must be positive."
+        assert max_size is None or max_size > 0, "`max_size` must be positive."
+        assert (
+            figure_backend in FigureBackend.__members__.values()
+        ), f"Invalid figure backend `{figure_backend}`."
+        assert partition_workers > 0, "`partition_workers` must be positive."
 
         self.artifact_type = artifact_type
         self.data_set = data_set
         self.name = name
         self.context = context
         self.save_args = save_args
+        self.max_items = max_items
+        self.max_size = max_size
+        self.sampling = None if sampling is None else SamplingOptions(**sampling)
+        self.figure_backend = figure_backend
+        self.dpi = dpi
+        self.partition_workers = partition_workers
+        self.max_embedded_size = max_embedded_size
 
     def _load(self) -> Any:  # pragma: no cover
         raise NotImplementedError(
@@ -71,6 +143,760 @@ def _describe(self) -> Dict[str, Any]:  # pragma: no cover
         )
 
 
+class AimArtifactDataSetChild(RunDataSetMixin, AbstractDataSet[Any, Any]):
+    """The dataset that is used to save artifacts to Aim.
+
+    The dataset wraps the dataset that is defined in the `data_set` key of an
+    `AimArtifactDataSet`. All loads and saves are delegated to the wrapped dataset and
+    the artifact is tracked to the run of the `AimHook` in addition.
+
+    The dataset can be pickled, e.g. to be used in worker processes of the
+    `ParallelRunner`. The copies do not have access to the hook. Instead, they track
+    their artifacts through the `RunProxy` of the hook, which sends them to the run in
+    the main process. Since the copies can not read from the run, they only track
+    artifacts when they are saved.
+
+    If `tracking.artifact_workers` is configured, the aim objects are created and
+    tracked by the worker pool of the hook, while the wrapped dataset saves the data.
+    Matplotlib objects are not thread-safe, so they are always tracked before they
+    are saved.
+
+    With the "raster" figure backend, matplotlib figures are drawn by the Agg backend
+    and tracked as `aim.Image` instead of being converted to plotly.
+
+    Distributions are tracked as a histogram which is computed chunk by chunk, so
+    that large or memory-mapped arrays are never copied as a whole.
+
+    If `tracking.deduplicate_artifacts` is enabled, artifacts whose content is already
+    stored in the repository are not tracked again. Instead, a reference to the stored
+    copy is set as `artifact_references.<name>` of the run.
+
+    Artifacts which are loaded or saved by nodes that are disabled in the `disable`
+    section of the config are not tracked. The wrapped dataset is used as usual.
+
+    Args:
+        hook: The `AimHook` hook.
+        artifact_dataset: The placeholder dataset.
+        data_set: The dataset that is used to load and save the artifact.
+    """
+
+    def __init__(
+        self,
+        hook: "hooks.AimHook",
+        artifact_dataset: AimArtifactDataSet,
+        data_set: AbstractDataSet[Any, Any],
+    ) -> None:
+        self._hook: Optional["hooks.AimHook"] = hook
+        self._run: Optional[RunProxy] = None
+        self._artifact_dataset = artifact_dataset
+        self._data_set = data_set
+        self._save_args = artifact_dataset.save_args or {}
+        self._sampler = (
+            None
+            if artifact_dataset.sampling is None
+            else ArtifactSampler(artifact_dataset.sampling)
+        )
+
+    def _save(self, data: Any) -> None:
+        if self._node_disabled:
+            self._data_set.save(data)
+            return
+
+        if not self._oversized(data):
+            self._sample_artifact(data)
+            self._data_set.save(data)
+        else:
+            # the file is written first, so that the run can reference it
+            self._data_set.save(data)
+            self._sample_artifact(self._reference_file(data, saved=True))
+
+    def _load(self) -> Any:
+        data = self._data_set.load()
+
+        # track artifact if it was not tracked before
+        hook = self._hook
+        if (
+            hook is not None
+            and hook.tracking_run is not None
+            and not self._node_disabled
+        ):
+            if not hook.sequence_tracked(self._sequence_key):
+                self._submit_artifact(
+                    self._reference_file(data, saved=False)
+                    if self._oversized(data)
+                    else data
+                )
+
+        return data
+
+    def _exists(self) -> bool:
+        return self._data_set.exists()
+
+    def _release(self) -> None:
+        self._data_set.release()
+
+    def _describe(self) -> Dict[str, Any]:
+        return self._data_set._describe()
+
+    @property
+    def _sequence_key(self) -> SequenceKey:
+        return sequence_key(self._artifact_dataset.name, self._artifact_dataset.context)
+
+    def _partition_key(self, partition: Optional[str]) -> SequenceKey:
+        return sequence_key(self._artifact_dataset.name, self._context(partition))
+
+    @property
+    def _node_disabled(self) -> bool:
+        return self._hook is not None and self._hook.node_tracking_disabled
+
+    @property
+    def uses_threads(self) -> bool:
+        """Whether the dataset tracks artifacts from threads of its own.
+
+        Returns:
+            False, single artifacts are tracked by the thread which saves them.
+        """
+        return False
+
+    @property
+    def uses_reservoir(self) -> bool:
+        """Whether the saves are sampled with a reservoir.
+
+        Returns:
+            True if `sampling.reservoir` is set.
+        """
+        sampling = self._artifact_dataset.sampling
+        return sampling is not None and sampling.reservoir is not None
+
+    def flush_samples(self) -> None:
+        """Track the samples which were kept in the reservoir of the sampling."""
+        if self._sampler is not None:
+            for step, (data, partition) in self._sampler.drain():
+                self._submit_artifact(data, step, partition)
+
+    def _sample_artifact(
+        self, data: Any, step: Optional[int] = None, partition: Optional[str] = None
+    ) -> None:
+        if self._sampler is None:
+            self._submit_artifact(data, step, partition)
+            return
+        # skipped saves are registered as well, so that loads do not track them
+        hook = self._hook
+        if hook is not None and hook.tracking_run is not None:
+            hook.tracked_sequences.add(self._partition_key(partition))
+        sampled_step = self._sampler.sample((data, partition), step)
+        if sampled_step is not None:
+            self._submit_artifact(data, sampled_step, partition)
+
+    def _submit_artifact(
+        self, data: Any, step: Optional[int] = None, partition: Optional[str] = None
+    ) -> None:
+        hook = self._hook
+        if hook is None or _is_matplotlib_object(data):
+            self._track_artifact(data, step, partition)
+        else:
+            # register the artifact right away, so that loads do not track it again
+            # while it is tracked in the background
+            if hook.tracking_run is not None:
+                hook.tracked_sequences.add(self._partition_key(partition))
+            hook.submit_artifact(partial(self._track_artifact, data, step, partition))
+
+    def _track_artifact(
+        self, data: Any, step: Optional[int] = None, partition: Optional[str] = None
+    ) -> None:
+        run = self._tracking_run
+        if run is not None:
+            record = None
+            if isinstance(data, SpilledArtifact):
+                record = data.record()
+                run.set(self._key("artifact_files", step, partition), record)
+
+            # known artifacts are referenced before they are encoded
+            digest = self._payload_hash(data, record)
+            if digest is None or not self._reference_stored_copy(
+                run, digest, step, partition
+            ):
+                self._store_artifact(run, data, record, digest, step, partition)
+            if self._hook is not None:
+                self._hook.tracked_sequences.add(self._partition_key(partition))
+        else:
+            LOGGER.warning("No run is active. Skipping artifact tracking.")
+
+    def _store_artifact(
+        self,
+        run: Any,
+        data: Any,
+        record: Optional[Dict[str, Any]],
+        digest: Optional[str],
+        step: Optional[int] = None,
+        partition: Optional[str] = None,
+    ) -> None:
+        """Encode and track an artifact and add it to the artifact index.
+
+        Args:
+            run: The run to which the artifact is tracked.
+            data: The data of the artifact.
+            record: The reference record of a spilled artifact.
+            digest: The content hash of the raw data or None if it is unknown.
+            step: The step of the artifact, if it is tracked with an explicit step.
+            partition: The id of the partition, if the artifact is a partition.
+        """
+        if record is not None:
+            tracked_data = self._make_preview(data, record)
+        else:
+            tracked_data = self._to_aim_object(data)
+        if digest is None and self._artifact_index is not None:
+            # the raw data of e.g. figures can only be hashed after it was encoded
+            digest = content_hash(tracked_data)
+            if self._reference_stored_copy(run, digest, step, partition):
+                return
+        run.track(
+            value=tracked_data,
+            name=self._artifact_dataset.name,
+            step=step,
+            context=self._context(partition),  # type: ignore
+        )
+        # the artifact is only indexed once it was tracked successfully
+        self._index_stored_copy(digest, step, partition)
+
+    def _to_aim_object(self, data: Any) -> Any:
+        from aim import Audio, Figure, Text
+
+        artifact_type = self._artifact_dataset.artifact_type
+        if artifact_type == ArtifactType.IMAGE and is_image_batch(data):
+            return make_images(
+                data,
+                self._artifact_dataset.max_items,
+                self._artifact_dataset.max_size,
+                **self._save_args,
+            )
+        if artifact_type == ArtifactType.IMAGE:
+            return make_image(data, self._artifact_dataset.max_size, **self._save_args)
+        if artifact_type == ArtifactType.FIGURE and self._renders_raster(data):
+            return make_raster_figure(
+                data, self._artifact_dataset.dpi, **self._save_args
+            )
+        if artifact_type == ArtifactType.FIGURE:
+            return Figure(data, **self._save_args)
+        if artifact_type == ArtifactType.TEXT:
+            return Text(data, **self._save_args)
+        if artifact_type == ArtifactType.AUDIO:
+            return Audio(data, **self._save_args)
+        if artifact_type == ArtifactType.DISTRIBUTION:
+            return make_distribution(data, **self._save_args)
+        raise AssertionError(f"Invalid artifact type `{artifact_type}`.")
+
+    def _renders_raster(self, data: Any) -> bool:
+        backend = self._artifact_dataset.figure_backend
+        return backend == FigureBackend.RASTER and _is_matplotlib_object(data)
+
+    def _context(self, partition: Optional[str] = None) -> Dict[str, Any]:
+        context = self._artifact_dataset.context
+        if partition is None:
+            return context
+        return {**context, "partition": partition}
+
+    def _oversized(self, data: Any) -> bool:
+        max_size = self._artifact_dataset.max_embedded_size
+        if max_size is None or self._artifact_dataset.artifact_type not in (
+            ArtifactType.TEXT,
+            ArtifactType.IMAGE,
+            ArtifactType.AUDIO,
+        ):
+            return False
+        return exceeds_size(data, max_size)
+
+    def _reference_file(
+        self,
+        data: Any,
+        saved: bool,
+        partition: Optional[str] = None,
+    ) -> Any:
+        location = (
+            file_location(self._data_set, saved)
+            if partition is None
+            else partition_location(self._data_set, partition)
+        )
+        if location is None:
+            return data
+        return SpilledArtifact(data, location)
+
+    def _make_preview(self, spilled: SpilledArtifact, record: Dict[str, Any]) -> Any:
+        """Create the aim object which is tracked instead of a spilled artifact.
+
+        Args:
+            spilled: The spilled artifact.
+            record: The reference record of the artifact.
+
+        Returns:
+            The beginning of a text, a thumbnail of an image or a text which refers
+            to the file of an audio.
+        """
+        from aim import Text
+
+        data, artifact_type = spilled.data, self._artifact_dataset.artifact_type
+        note = f"{record['size']} bytes stored in {record['path']}"
+        if artifact_type == ArtifactType.TEXT:
+            return Text(f"{data[:PREVIEW_CHARS]}\n[...] ({note})")
+        if artifact_type == ArtifactType.IMAGE and is_image_batch(data):
+            return make_images(
+                data,
+                self._artifact_dataset.max_items,
+                PREVIEW_SIZE,
+                **self._save_args,
+            )
+        if artifact_type == ArtifactType.IMAGE:
+            return make_image(data, PREVIEW_SIZE, **self._save_args)
+        return Text(f"Audio with {note}")
+
+    @property
+    def _artifact_index(self) -> Optional[ArtifactIndex]:
+        hook = self._hook
+        return hook.artifact_index if hook is not None else None
+
+    def _payload_hash(
+        self, data: Any, record: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """Compute the content hash of the raw data of an artifact.
+
+        The hash covers the settings which change the encoding of the data. Spilled
+        artifacts are hashed by the content hash and the location of their file.
+
+        Args:
+            data: The data of the artifact.
+            record: The reference record of a spilled artifact.
+
+        Returns:
+            The hex digest or None if no artifact index is used or the raw data of
+            the artifact cannot be hashed.
+        """
+        if self._artifact_index is None:
+            return None
+        dataset = self._artifact_dataset
+        settings = (
+            ArtifactType(dataset.artifact_type).value,
+            dataset.max_items,
+            dataset.max_size,
+            FigureBackend(dataset.figure_backend).value,
+            dataset.dpi,
+            sorted(self._save_args.items()),
+        )
+        if record is None:
+            return payload_hash(data, *settings)
+        return payload_hash(record["hash"], *settings, record["path"])
+
+    def _stored_copy(
+        self, step: Optional[int] = None, partition: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create the reference to an artifact which is stored by the current run.
+
+        Args:
+            step: The step of the artifact, if it is tracked with an explicit step.
+            partition: The id of the partition, if the artifact is a partition.
+
+        Returns:
+            The hash of the run, the name, the context and the step of the artifact.
+        """
+        return {
+            "run_hash": self._hook.run_hash if self._hook is not None else None,
+            "name": self._artifact_dataset.name,
+            "context": self._context(partition),
+            "step": step,
+        }
+
+    def _reference_stored_copy(
+        self,
+        run: Any,
+        digest: str,
+        step: Optional[int] = None,
+        partition: Optional[str] = None,
+    ) -> bool:
+        """Reference the stored copy of an artifact if its content is already stored.
+
+        Args:
+            run: The run to which the artifact is tracked.
+            digest: The content hash of the artifact.
+            step: The step of the artifact, if it is tracked with an explicit step.
+            partition: The id of the partition, if the artifact is a partition.
+
+        Returns:
+            True if a reference was set and the artifact does not need to be tracked.
+        """
+        hook, index = self._hook, self._artifact_index
+        reference = index.get(digest) if index is not None else None
+        if reference is None:
+            return False
+        if reference["run_hash"] is None and hook is not None:
+            # the copy is stored by the current run, which was created lazily
+            reference = {**reference, "run_hash": hook.resolve_run_hash()}
+        run.set(self._key("artifact_references", step, partition), reference)
+        return True
+
+    def _index_stored_copy(
+        self,
+        digest: Optional[str],
+        step: Optional[int] = None,
+        partition: Optional[str] = None,
+    ) -> None:
+        """Add an artifact which was tracked to the artifact index.
+
+        Args:
+            digest: The content hash of the artifact or None if it is not indexed.
+            step: The step of the artifact, if it is tracked with an explicit step.
+            partition: The id of the partition, if the artifact is a partition.
+        """
+        index = self._artifact_index
+        if index is not None and digest is not None:
+            index.add(digest, self._stored_copy(step, partition))
+
+    def _key(
+        self, section: str, step: Optional[int], partition: Optional[str]
+    ) -> Tuple[str, ...]:
+        """Get the key of a run parameter which describes a tracked artifact.
+
+        Args:
+            section: The top-level parameter, e.g. `artifact_references`.
+            step: The step of the artifact, if it is tracked with an explicit step.
+            partition: The id of the partition, if the artifact is a partition.
+
+        Returns:
+            The key of the parameter.
+        """
+        key: Tuple[str, ...] = (section, self._artifact_dataset.name)
+        if partition is not None:
+            key = (*key, partition)
+        return key if step is None else (*key, str(step))
+
+
+class AimArtifactStreamDataSet(AimArtifactDataSet):
+    """A dataset that is used to save a stream of artifacts to Aim.
+
+    Like `AimArtifactDataSet`, this dataset is only a placeholder which is replaced by
+    the `AimHook` with an `AimArtifactStreamDataSetChild`. Each element of the stream
+    is tracked as one step of the artifact and saved as one partition of the wrapped
+    dataset, which should be a `PartitionedDataSet`.
+
+    Args:
+        artifact_type: The type of the artifacts.
+        name: The name that is used to save the artifacts to Aim.
+        data_set: The partitioned dataset that is used to save the elements.
+        context: The run context of artifacts. Defaults to {}.
+        save_args: Additional parameters that are passed to aim. For distributions
+            they are passed to `make_distribution`. Defaults to None.
+        max_items: The maximum number of images that are tracked of a batch of images.
+            Defaults to None.
+        max_size: The maximum length of the longer side of tracked images. Defaults
+            to None.
+        sampling: Options which select the elements that are tracked, see
+            `SamplingOptions`. Defaults to None.
+        figure_backend: How matplotlib figures are tracked. Defaults to "plotly".
+        dpi: The resolution of figures which are rendered to images. Defaults to
+            None.
+        partition_format: The format of the partition ids, which is formatted with
+            the step of the element. Defaults to "{step:05d}".
+    """
+
+    def __init__(
+        self,
+        artifact_type: ArtifactType,
+        name: str,
+        data_set: Dict[str, Any],
+        context: Dict[str, Any] = {},
+        save_args: Optional[Dict[str, Any]] = None,
+        max_items: Optional[int] = None,
+        max_size: Optional[int] = None,
+        sampling: Optional[Dict[str, Any]] = None,
+        figure_backend: FigureBackend = FigureBackend.PLOTLY,
+        dpi: Optional[float] = None,
+        partition_format: str = "{step:05d}",
+    ) -> None:
+        super().__init__(
+            artifact_type=artifact_type,
+            name=name,
+            data_set=data_set,
+            context=context,
+            save_args=save_args,
+            max_items=max_items,
+            max_size=max_size,
+            sampling=sampling,
+            figure_backend=figure_backend,
+            dpi=dpi,
+        )
+        self.partition_format = partition_format
+
+
+class AimArtifactStreamDataSetChild(AimArtifactDataSetChild):
+    """The dataset that is used to save a stream of artifacts to Aim.
+
+    The dataset accepts single elements, as they are saved by Kedro for nodes which
+    are generators, as well as iterators of elements. Each element is tracked with the
+    next step and saved as a partition of the wrapped dataset right away, so only one
+    element is held in memory at a time. If the wrapped dataset has `overwrite` set,
+    the partitions of previous saves are only removed by the first element.
+
+    Loading returns an iterator which loads the partitions one after another, sorted
+    by their partition id. If the artifact was not tracked to the run before, each
+    element is tracked when it is loaded.
+
+    Args:
+        hook: The `AimHook` hook.
+        artifact_dataset: The placeholder dataset.
+        data_set: The partitioned dataset that is used to load and save the elements.
+    """
+
+    def __init__(
+        self,
+        hook: "hooks.AimHook",
+        artifact_dataset: AimArtifactStreamDataSet,
+        data_set: AbstractDataSet[Any, Any],
+    ) -> None:
+        super().__init__(hook, artifact_dataset, data_set)
+        self._partition_format = artifact_dataset.partition_format
+        self._next_step = 0
+
+    def _save(self, data: Any) -> None:
+        track = not self._node_disabled
+        for element in data if isinstance(data, Iterator) else [data]:
+            step, self._next_step = self._next_step, self._next_step + 1
+            if track:
+                self._sample_artifact(element, step)
+            partition_id = self._partition_format.format(step=step)
+            self._data_set.save({partition_id: element})
+            if getattr(self._data_set, "_overwrite", False):
+                # only the first element replaces the partitions of previous saves
+                self._data_set._overwrite = False  # type: ignore
+
+    def _load(self) -> Iterator[Any]:
+        partitions = self._data_set.load()
+
+        # track artifacts if they were not tracked before
+        hook = self._hook
+        track = (
+            hook is not None
+            and hook.tracking_run is not None
+            and not self._node_disabled
+            and not hook.sequence_tracked(self._sequence_key)
+        )
+        return self._iter_partitions(partitions, track)
+
+    def _iter_partitions(
+        self, partitions: Dict[str, Callable[[], Any]], track: bool
+    ) -> Iterator[Any]:
+        for step, partition_id in enumerate(sorted(partitions)):
+            element = partitions[partition_id]()
+            if track:
+                self._sample_artifact(element, step)
+            yield element
+
+
+class AimArtifactPartitionedDataSetChild(AimArtifactDataSetChild):
+    """The dataset that is used to save the partitions of a dataset to Aim.
+
+    The dataset is used if the `data_set` of an `AimArtifactDataSet` is a
+    `PartitionedDataSet`. Each partition is tracked as an artifact of its own with the
+    partition id as `partition` in its context.
+
+    The wrapped dataset saves all partitions at once, so that options like
+    `overwrite` apply to the whole save. Saved partitions can be callables, which are
+    called once while the wrapped dataset saves them. The partitions are tracked by a
+    bounded pool of `partition_workers` threads, which the wrapped dataset only waits
+    for if too many partitions are pending, so the partitions are never held in memory
+    all at once. Like single artifacts, the tracked partitions are selected by the
+    `sampling` and partitions larger than `max_embedded_size` only reference their
+    files. Loading returns the lazy partitions of the wrapped dataset. If the
+    partitions were not tracked to the run before, they are tracked first.
+
+    Matplotlib objects are not thread-safe, so figures are tracked by the thread
+    which saves or loads the partitions. If the dataset has `partition_workers`, the
+    `AimHook` routes all writes through its background writer, so that the threads of
+    the pool never write to the run directly.
+
+    Args:
+        hook: The `AimHook` hook.
+        artifact_dataset: The placeholder dataset.
+        data_set: The partitioned dataset that is used to load and save the partitions.
+    """
+
+    def __init__(
+        self,
+        hook: "hooks.AimHook",
+        artifact_dataset: AimArtifactDataSet,
+        data_set: AbstractDataSet[Any, Any],
+    ) -> None:
+        super().__init__(hook, artifact_dataset, data_set)
+        self._partition_workers = (
+            0
+            if artifact_dataset.artifact_type == ArtifactType.FIGURE
+            else artifact_dataset.partition_workers
+        )
+
+    @property
+    def uses_threads(self) -> bool:
+        """Whether the partitions are tracked by a pool of threads.
+
+        Returns:
+            True if the dataset has `partition_workers`.
+        """
+        return self._partition_workers > 0
+
+    def _save(self, data: Dict[str, Any]) -> None:
+        if self._node_disabled:
+            self._data_set.save(data)
+            return
+        if self._tracking_run is None:
+            LOGGER.warning("No run is active. Skipping artifact tracking.")
+            self._data_set.save(data)
+            return
+
+        with self._partition_pool() as submit:
+            self._data_set.save(
+                {
+                    partition_id: partial(
+                        self._submit_partition, submit, partition_id, partition
+                    )
+                    for partition_id, partition in data.items()
+                }
+            )
+
+    def _load(self) -> Dict[str, Callable[[], Any]]:
+        partitions = self._data_set.load()
+
+        # track partitions if they were not tracked before
+        hook = self._hook
+        if (
+            hook is not None
+            and hook.tracking_run is not None
+            and not self._node_disabled
+            and partitions
+        ):
+            if not hook.sequence_tracked(self._partition_key(min(partitions))):
+                with self._partition_pool() as submit:
+                    for partition_id in sorted(partitions):
+                        submit(
+                            self._track_loaded_partition,
+                            partition_id,
+                            partitions[partition_id],
+                        )
+
+        return partitions
+
+    def _submit_partition(
+        self,
+        submit: Callable[[Callable[[str, Any], None], str, Any], None],
+        partition_id: str,
+        partition: Any,
+    ) -> Any:
+        """Resolve a saved partition and submit it to be tracked.
+
+        The wrapped dataset calls this function right before it saves the partition.
+
+        Args:
+            submit: The function which submits the partition to the pool.
+            partition_id: The id of the partition.
+            partition: The partition or a callable which returns it.
+
+        Returns:
+            The data of the partition.
+        """
+        data = partition() if callable(partition) else partition
+        submit(self._track_saved_partition, partition_id, data)
+        return data
+
+    def _track_saved_partition(self, partition_id: str, data: Any) -> None:
+        if self._oversized(data):
+            data = self._reference_file(data, True, partition_id)
+        self._sample_artifact(data, partition=partition_id)
+
+    def _track_loaded_partition(
+        self, partition_id: str, load: Callable[[], Any]
+    ) -> None:
+        data = load()
+        if self._oversized(data):
+            data = self._reference_file(data, False, partition_id)
+        self._submit_artifact(data, partition=partition_id)
+
+    @contextmanager
+    def _partition_pool(
+        self,
+    ) -> Iterator[Callable[[Callable[[str, Any], None], str, Any], None]]:
+        """Create a bounded pool of threads which process partitions.
+
+        At most two partitions per worker are pending at a time, so partitions which
+        are produced faster than they are tracked do not pile up in memory. Without
+        workers, the partitions are processed by the calling thread. All partitions
+        are processed when the context is left.
+
+        Yields:
+            A function which submits a function to be called with the id and the
+            value of a partition.
+        """
+        if self._partition_workers == 0:
+            yield self._in_worker
+            return
+
+        max_pending = 2 * self._partition_workers
+        with ThreadPoolExecutor(
+            max_workers=self._partition_workers,
+            thread_name_prefix="kedro-aim-partition",
+        ) as pool:
+            pending: Set["Future[None]"] = set()
+
+            def submit(
+                fn: Callable[[str, Any], None], partition_id: str, partition: Any
+            ) -> None:
+                nonlocal pending
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(pool.submit(self._in_worker, fn, partition_id, partition))
+
+            yield submit
+            for future in wait(pending).done:
+                future.result()
+
+    def _in_worker(
+        self, fn: Callable[[str, Any], None], partition_id: str, partition: Any
+    ) -> None:
+        try:
+            fn(partition_id, partition)
+        finally:
+            # hand the writes of the worker thread to the background writer
+            writer = self._hook.writer if self._hook is not None else None
+            if writer is not None:
+                writer.flush_thread()
+
+
+def _is_matplotlib_object(data: Any) -> bool:
+    """Check if the data is a matplotlib object, e.g. a figure, or a list of them.
+
+    Args:
+        data: The data of the artifact.
+
+    Returns:
+        True if the type of the data, or of an item of a list, is defined by matplotlib.
+    """
+    items = data if isinstance(data, (list, tuple)) else [data]
+    return any(type(item).__module__.split(".")[0] == "matplotlib" for item in items)
+
+
+@lru_cache(maxsize=None)
+def _load_dataset_class(class_path: str) -> type:
+    """Load the class of a dataset from its path in the catalog.
+
+    Kedro tries to import the path with several prefixes, which is slow compared to
+    the creation of the dataset. The classes are therefore only loaded once per path.
+
+    Args:
+        class_path: The `type` of the dataset in the catalog.
+
+    Returns:
+        The class of the dataset.
+    """
+    data_set_cls, _ = parse_dataset_definition(config={"type": class_path})
+    return data_set_cls
+
+
 def make_run_dataset(
     hook: "hooks.AimHook",
     artifact_dataset: AimArtifactDataSet,
@@ -90,58 +916,24 @@ def make_run_dataset(
     Returns:
         A dataset that is used to save the artifact to Aim.
     """
-    data_set_cls, data_set_args = parse_dataset_definition(
-        config=artifact_dataset.data_set
+    config = dict(artifact_dataset.data_set)
+    if isinstance(config.get("type"), str):
+        config["type"] = _load_dataset_class(config["type"])
+    data_set_cls, data_set_args = parse_dataset_definition(config=config)
+    if isinstance(artifact_dataset, AimArtifactStreamDataSet):
+        return AimArtifactStreamDataSetChild(
+            hook=hook,
+            artifact_dataset=artifact_dataset,
+            data_set=data_set_cls(**data_set_args),
+        )
+    if issubclass(data_set_cls, PartitionedDataSet):
+        return AimArtifactPartitionedDataSetChild(
+            hook=hook,
+            artifact_dataset=artifact_dataset,
+            data_set=data_set_cls(**data_set_args),
+        )
+    return AimArtifactDataSetChild(
+        hook=hook,
+        artifact_dataset=artifact_dataset,
+        data_set=data_set_cls(**data_set_args),
     )
-    save_args = {} if artifact_dataset.save_args is None else artifact_dataset.save_args
-
-    class AimArtifactDataSetChild(data_set_cls):  # type: ignore
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            super().__init__(*args, **kwargs)
-
-        def _save(self, data: Any) -> None:
-            self._track_artifact(data, artifact_dataset.artifact_type)
-            super()._save(data)
-
-        def _load(self) -> Any:
-            data = super()._load()
-
-            # track artifact if it was not tracked before
-            if hook.run is not None:
-                if artifact_dataset.name not in list_metrics_names_in_run(hook.run):
-                    self._track_artifact(data, artifact_dataset.artifact_type)
-
-            return data
-
-        def _describe(self) -> Dict[str, Any]:
-            return super()._describe()
-
-        @staticmethod
-        def _track_artifact(data: Any, artifact_type: ArtifactType) -> None:
-            if hook.run is not None:
-                if artifact_type == ArtifactType.IMAGE:
-                    tracked_data = Image(data, **save_args)
-                elif artifact_type == ArtifactType.FIGURE:
-                    tracked_data = Figure(data, **save_args)
-                elif artifact_type == ArtifactType.TEXT:
-                    tracked_data = Text(data, **save_args)
-                elif artifact_type == ArtifactType.AUDIO:
-                    tracked_data = Audio(data, **save_args)
-                else:
-                    raise AssertionError(f"Invalid artifact type `{artifact_type}`.")
-
-                hook.run.track(
-                    value=tracked_data,
-                    name=artifact_dataset.name,
-                    context=artifact_dataset.context,  # type: ignore
-                )
-            else:
-                LOGGER.warning("No run is active. Skipping artifact tracking.")
-
-    # rename the class
-    parent_name = data_set_cls.__name__
-    AimArtifactDataSetChild.__name__ = f"Mlflow{parent_name}"
-    AimArtifactDataSetChild.__qualname__ = f"{parent_name}.Mlflow{parent_name}"
-
-    aim_dataset_instance = AimArtifactDataSetChild(**data_set_args)
-    return aim_dataset_instance
@@ -0,0 +1,128 @@
+import random
+import time
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Extra, Field
+
+
+class SamplingOptions(BaseModel):
+    """Options which select the saves of an artifact dataset that are tracked."""
+
+    class Config:
+        extra = Extra.forbid
+
+    every_n: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Only track every n-th save, starting with the first one.",
+    )
+    min_interval: Optional[float] = Field(
+        default=None,
+        ge=0,
+        description="Minimum number of seconds between two tracked saves.",
+    )
+    reservoir: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Keep a uniform random sample of this many saves in memory and track "
+            "them at the end of the pipeline run."
+        ),
+    )
+    seed: Optional[int] = Field(
+        default=None, description="Seed of the random sample of the `reservoir`."
+    )
+
+
+class ArtifactSampler:
+    """Decides which saves of an artifact dataset are tracked.
+
+    The filters are applied in the order `every_n`, `min_interval` and `reservoir`.
+    Saves which pass `every_n` and `min_interval` are tracked right away, unless a
+    `reservoir` is configured. In that case, they are candidates of a reservoir
+    sample, which is tracked once `drain` is called.
+
+    Copies of the sampler, e.g. in the worker processes of the `ParallelRunner`, keep
+    their own counters and reservoir. The reservoirs of worker processes are never
+    drained, so a `reservoir` has no effect on saves in worker processes.
+
+    Args:
+        options: The sampling options.
+    """
+
+    def __init__(self, options: SamplingOptions) -> None:
+        self.options = options
+        self._saves = 0
+        self._candidates = 0
+        self._last_time: Optional[float] = None
+        self._reservoir: List[Tuple[int, Any]] = []
+        self._random = random.Random(options.seed)
+        self._lock = Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state of the sampler without its lock.
+
+        Returns:
+            The state of the sampler.
+        """
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state of the sampler with a new lock.
+
+        Args:
+            state: The state of the sampler.
+        """
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def sample(self, data: Any, step: Optional[int] = None) -> Optional[int]:
+        """Register a save and decide whether it is tracked right away.
+
+        Args:
+            data: The saved data.
+            step: The step of the save. Defaults to None, in which case the number of
+                previous saves is used.
+
+        Returns:
+            The step with which the data is tracked or None if it is not tracked now.
+        """
+        options = self.options
+        with self._lock:
+            index, self._saves = self._saves, self._saves + 1
+            step = index if step is None else step
+            if options.every_n is not None and index % options.every_n:
+                return None
+            if options.min_interval is not None:
+                now = time.monotonic()
+                if (
+                    self._last_time is not None
+                    and now - self._last_time < options.min_interval
+                ):
+                    return None
+                self._last_time = now
+            if options.reservoir is None:
+                return step
+
+            # reservoir sampling, so that each candidate is kept with equal probability
+            seen, self._candidates = self._candidates, self._candidates + 1
+            if seen < options.reservoir:
+                self._reservoir.append((step, data))
+            else:
+                slot = self._random.randrange(seen + 1)
+                if slot < options.reservoir:
+                    self._reservoir[slot] = (step, data)
+            return None
+
+    def drain(self) -> List[Tuple[int, Any]]:
+        """Remove the samples of the reservoir.
+
+        Returns:
+            The steps and data of the samples, sorted by step.
+        """
+        with self._lock:
+            samples, self._reservoir = self._reservoir, []
+        return sorted(samples, key=lambda sample: sample[0])
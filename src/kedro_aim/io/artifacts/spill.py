@@ -0,0 +1,165 @@
+import hashlib
+from typing import Any, Dict, NamedTuple, Optional
+
+import numpy as np
+from kedro.io import AbstractDataSet
+from kedro.io.core import AbstractVersionedDataSet
+
+
+class SpilledArtifact(NamedTuple):
+    """An artifact which is referenced in the file of the wrapped dataset.
+
+    Attributes:
+        data: The data of the artifact.
+        location: The path, protocol and version of the file.
+    """
+
+    data: Any
+    location: Dict[str, Any]
+
+    def record(self) -> Dict[str, Any]:
+        """Create the reference record of the artifact which is stored in the run.
+
+        The raw bytes are only created and hashed here, i.e. for the artifacts which
+        are referenced and tracked.
+
+        Returns:
+            The path, protocol, version, size and content hash of the artifact.
+        """
+        payload = payload_of(self.data)
+        if payload is None:
+            return {**self.location, "size": None, "hash": None}
+        digest = hashlib.blake2b(payload, digest_size=20).hexdigest()
+        return {**self.location, "size": payload.nbytes, "hash": digest}
+
+
+def payload_of(data: Any) -> Optional[memoryview]:
+    """Get the raw bytes of the data of an artifact.
+
+    Args:
+        data: The data of the artifact.
+
+    Returns:
+        The bytes of strings, bytes, numpy arrays and pillow images or None if the
+        type of the data is not supported.
+    """
+    if isinstance(data, str):
+        return memoryview(data.encode())
+    if isinstance(data, (bytes, bytearray)):
+        return memoryview(data)
+    if isinstance(data, np.ndarray):
+        return memoryview(np.ascontiguousarray(data)).cast("B")
+    if _is_pil_image(data):
+        return memoryview(data.tobytes())
+    return None
+
+
+def payload_hash(data: Any, *settings: Any) -> Optional[str]:
+    """Compute a hash of the raw data of an artifact before it is encoded.
+
+    Lists and tuples, e.g. batches of images, are hashed item by item. The shape of
+    arrays and the mode and size of images are part of the hash, because their raw
+    bytes do not describe them.
+
+    Args:
+        data: The data of the artifact.
+        *settings: Settings which change the encoding of the data, e.g. the maximum
+            size of images. Their `repr` is part of the hash.
+
+    Returns:
+        The hex digest or None if the type of the data or of an item is not
+        supported.
+    """
+    digest = hashlib.blake2b(repr(settings).encode(), digest_size=20)
+    for item in data if isinstance(data, (list, tuple)) else [data]:
+        payload = payload_of(item)
+        if payload is None:
+            return None
+        if isinstance(item, np.ndarray):
+            layout: Any = (item.dtype.str, item.shape)
+        elif _is_pil_image(item):
+            layout = (item.mode, item.size)
+        else:
+            layout = None
+        digest.update(f"{type(item).__name__}{layout}{payload.nbytes}".encode())
+        digest.update(payload)
+    return digest.hexdigest()
+
+
+def exceeds_size(data: Any, max_size: int) -> bool:
+    """Check if the raw bytes of an artifact are larger than a size.
+
+    The size is estimated from the metadata of the data without copying it. The
+    length of a string bounds its size in UTF-8, which takes one to four bytes per
+    character, so strings are only encoded if their length is close to `max_size`.
+
+    Args:
+        data: The data of the artifact.
+        max_size: The size in bytes.
+
+    Returns:
+        True if the data is larger than `max_size`. False if it is not or if the
+        type of the data is not supported.
+    """
+    if isinstance(data, str):
+        if len(data) > max_size or 4 * len(data) <= max_size:
+            return len(data) > max_size
+        return len(data.encode()) > max_size
+    if isinstance(data, (bytes, bytearray)):
+        return len(data) > max_size
+    if isinstance(data, np.ndarray):
+        return data.nbytes > max_size
+    if _is_pil_image(data):
+        width, height = data.size
+        return width * height * len(data.getbands()) > max_size
+    return False
+
+
+def _is_pil_image(data: Any) -> bool:
+    return type(data).__module__.split(".")[0] == "PIL"
+
+
+def file_location(data_set: AbstractDataSet, saved: bool) -> Optional[Dict[str, Any]]:
+    """Get the location of the file in which a dataset stores its data.
+
+    Args:
+        data_set: The dataset.
+        saved: Whether the data was just saved. Otherwise the data was just loaded.
+
+    Returns:
+        The path, protocol and version of the file or None if the dataset does not
+        store its data in a file.
+    """
+    description = data_set._describe()
+    if "filepath" not in description:
+        return None
+    path, version = description["filepath"], None
+    if isinstance(data_set, AbstractVersionedDataSet) and data_set._version:
+        version = (
+            data_set.resolve_save_version()
+            if saved
+            else data_set.resolve_load_version()
+        )
+        path = data_set._get_versioned_path(version)  # type: ignore
+    return {
+        "path": str(path),
+        "protocol": description.get("protocol"),
+        "version": version,
+    }
+
+
+def partition_location(data_set: Any, partition_id: str) -> Dict[str, Any]:
+    """Get the location of the file in which a `PartitionedDataSet` stores a partition.
+
+    Args:
+        data_set: The partitioned dataset.
+        partition_id: The id of the partition.
+
+    Returns:
+        The path and protocol of the file. Partitions are not versioned.
+    """
+    return {
+        "path": data_set._partition_to_path(partition_id),
+        "protocol": data_set._protocol,
+        "version": None,
+    }
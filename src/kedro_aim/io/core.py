@@ -0,0 +1,36 @@
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from kedro_aim.aim.proxy import RunProxy
+
+if TYPE_CHECKING:
+    from kedro_aim.framework import hooks
+
+
+class RunDataSetMixin:
+    """A mixin for the datasets which the `AimHook` creates to write to its run.
+
+    The datasets write through the `tracking_run` of the hook. When they are pickled,
+    e.g. for the worker processes of the `ParallelRunner`, the hook is replaced by its
+    `RunProxy`, so that the copies send their writes to the main process.
+    """
+
+    _hook: Optional["hooks.AimHook"]
+    _run: Optional[RunProxy]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state of the dataset without the hook.
+
+        Returns:
+            The state of the dataset in which the hook is replaced by its `RunProxy`.
+        """
+        state = self.__dict__.copy()
+        run = self._tracking_run
+        state["_hook"] = None
+        state["_run"] = run if isinstance(run, RunProxy) else None
+        return state
+
+    @property
+    def _tracking_run(self) -> Any:
+        if self._hook is not None:
+            return self._hook.tracking_run
+        return self._run
@@ -0,0 +1,5 @@
+from .aim_metrics_dataset import (
+    AimMetricsDataSet,
+    AimMetricsDataSetChild,
+    make_metrics_dataset,
+)
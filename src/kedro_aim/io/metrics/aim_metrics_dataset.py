@@ -0,0 +1,235 @@
+from itertools import repeat
+from logging import getLogger
+from numbers import Real
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Mapping, Optional, Set
+
+import numpy as np
+from kedro.io import AbstractDataSet, DataSetError
+
+from kedro_aim.aim.proxy import RunProxy
+from kedro_aim.aim.utils import sequence_key
+from kedro_aim.io.core import RunDataSetMixin
+
+if TYPE_CHECKING:
+    from kedro_aim.framework import hooks
+
+LOGGER = getLogger(__name__)
+
+
+class AimMetricsDataSet(AbstractDataSet[Any, None]):
+    """A dataset that is used to track metrics to Aim in bulk.
+
+    Like the `AimArtifactDataSet`, this dataset does not implement any functionality
+    itself. During the `after_catalog_created` hook, the `AimHook` replaces it with an
+    `AimMetricsDataSetChild` which tracks the saved metrics to the run.
+
+    Args:
+        context: The run context of the metrics. Defaults to {}.
+        metrics: Mapping from a key or column of the saved data to the name of the
+            metric. If set, only the mapped keys and columns are tracked. Defaults to
+            None, in which case all numeric values are tracked under their own name.
+        step_column: The column of a `DataFrame` which contains the steps. Defaults
+            to "step".
+        epoch_column: The column of a `DataFrame` which contains the epochs. Defaults
+            to "epoch".
+    """
+
+    def __init__(
+        self,
+        context: Dict[str, Any] = {},
+        metrics: Optional[Dict[str, str]] = None,
+        step_column: str = "step",
+        epoch_column: str = "epoch",
+    ) -> None:
+        self.context = context
+        self.metrics = metrics
+        self.step_column = step_column
+        self.epoch_column = epoch_column
+
+    def _load(self) -> Any:  # pragma: no cover
+        raise NotImplementedError(
+            "This method should be overwritten by `AimMetricsDataSetChild`."
+        )
+
+    def _save(self, data: Any) -> None:  # pragma: no cover
+        raise NotImplementedError(
+            "This method should be overwritten by `AimMetricsDataSetChild`."
+        )
+
+    def _describe(self) -> Dict[str, Any]:  # pragma: no cover
+        raise NotImplementedError(
+            "This method should be overwritten by `AimMetricsDataSetChild`."
+        )
+
+
+class AimMetricsDataSetChild(RunDataSetMixin, AbstractDataSet[Any, None]):
+    """The dataset that is used to track metrics to Aim in bulk.
+
+    The dataset accepts three kinds of data:
+
+    - A dict of scalars, which are tracked as the next value of the metric with the
+      name of their key. Values which are not numbers or missing are skipped.
+    - A pandas `Series` of scalars, which is tracked like a dict.
+    - A pandas `DataFrame` with one row per step, e.g. a training curve. Each numeric
+      column is tracked as a metric. The steps and epochs are taken from the
+      `step_column` and `epoch_column` if the frame contains them. Missing values are
+      skipped and rows with a missing step or epoch are tracked without it.
+
+    The metrics of each row, or of a dict, are tracked with one call of `track`
+    with a dict of values, which aim writes to the run at once. The missing values of
+    a `DataFrame` are found with one vectorized numpy pass over all columns. The
+    dataset is write-only.
+
+    Args:
+        hook: The `AimHook` hook.
+        metrics_dataset: The placeholder dataset.
+    """
+
+    def __init__(
+        self, hook: "hooks.AimHook", metrics_dataset: AimMetricsDataSet
+    ) -> None:
+        self._hook: Optional["hooks.AimHook"] = hook
+        self._run: Optional[RunProxy] = None
+        self._metrics_dataset = metrics_dataset
+
+    def _save(self, data: Any) -> None:
+        run = self._tracking_run
+        if run is None:
+            LOGGER.warning("No run is active. Skipping metrics tracking.")
+        elif hasattr(data, "columns"):
+            self._track_frame(run, data)
+        elif isinstance(data, Mapping) or hasattr(data, "to_dict"):
+            self._track_scalars(run, dict(data))
+        else:
+            raise DataSetError(
+                f"Can not track metrics of type `{type(data).__name__}`. Expected a "
+                "dict, a pandas `Series` or a pandas `DataFrame`."
+            )
+
+    def _load(self) -> Any:
+        raise DataSetError("`AimMetricsDataSet` is write-only.")
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            context=self._metrics_dataset.context,
+            metrics=self._metrics_dataset.metrics,
+        )
+
+    def _metric_names(self, keys: Iterable[str]) -> Dict[str, str]:
+        metrics = self._metrics_dataset.metrics
+        if metrics is None:
+            return {key: key for key in keys}
+        return {key: metrics[key] for key in keys if key in metrics}
+
+    def _track_scalars(self, run: Any, scalars: Dict[str, Any]) -> None:
+        # skip the values which are not numbers, like the columns of a `DataFrame`
+        numeric = [key for key, value in scalars.items() if _is_number(value)]
+        names = self._metric_names(numeric)
+        row = {name: scalars[key] for key, name in names.items()}
+        self._track_rows(run, [row], repeat(None), repeat(None))
+
+    def _track_frame(self, run: Any, frame: Any) -> None:
+        step_column = self._metrics_dataset.step_column
+        epoch_column = self._metrics_dataset.epoch_column
+        steps = _column_or_none(frame, step_column)
+        epochs = _column_or_none(frame, epoch_column)
+
+        columns = [
+            column
+            for column in frame.select_dtypes(include=["number", "bool"]).columns
+            if column not in (step_column, epoch_column)
+        ]
+        names = self._metric_names(columns)
+        # one vectorized pass over all columns to find the missing values
+        values = frame[list(names)].to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        metric_names = list(names.values())
+        rows = (
+            {
+                name: value
+                for name, value, is_present in zip(metric_names, row, row_present)
+                if is_present
+            }
+            for row, row_present in zip(values.tolist(), present.tolist())
+        )
+        self._track_rows(
+            run,
+            rows,
+            repeat(None) if steps is None else steps.tolist(),
+            repeat(None) if epochs is None else epochs.tolist(),
+        )
+
+    def _track_rows(
+        self,
+        run: Any,
+        rows: Iterable[Dict[str, Any]],
+        steps: Iterable[Optional[int]],
+        epochs: Iterable[Optional[int]],
+    ) -> None:
+        """Track the metrics of each row with one call of `track`.
+
+        Args:
+            run: The run or its stand-in.
+            rows: Mappings from the name of a metric to its value.
+            steps: The step of each row or None.
+            epochs: The epoch of each row or None.
+        """
+        context = self._metrics_dataset.context
+        tracked: Set[str] = set()
+        for row, step, epoch in zip(rows, steps, epochs):
+            if row:
+                run.track(row, step=step, epoch=epoch, context=context)
+                tracked.update(row)
+        if self._hook is not None:
+            self._hook.tracked_sequences.update(
+                sequence_key(name, context) for name in tracked
+            )
+
+
+def _is_number(value: Any) -> bool:
+    """Check if a value is a real number which is not missing.
+
+    Args:
+        value: The value.
+
+    Returns:
+        True if the value can be tracked as a metric.
+    """
+    return isinstance(value, Real) and not np.isnan(value)
+
+
+def _column_or_none(frame: Any, column: str) -> Optional[np.ndarray]:
+    """Get a column of a `DataFrame` as array of integers if it exists.
+
+    Args:
+        frame: The pandas `DataFrame`.
+        column: The name of the column.
+
+    Returns:
+        The values of the column or None if the frame has no such column. If values
+        are missing, the array has the object dtype and contains None for them.
+    """
+    if column not in frame.columns:
+        return None
+    values = frame[column].to_numpy(dtype=float)
+    missing = np.isnan(values)
+    if not missing.any():
+        return values.astype(np.int64)
+    integers = np.full(len(values), None, dtype=object)
+    integers[~missing] = values[~missing].astype(np.int64)
+    return integers
+
+
+def make_metrics_dataset(
+    hook: "hooks.AimHook", metrics_dataset: AimMetricsDataSet
+) -> AimMetricsDataSetChild:
+    """Takes `AimMetricsDataSet` and replaces it with `AimMetricsDataSetChild`.
+
+    Args:
+        hook: The `AimHook` hook.
+        metrics_dataset: The placeholder dataset.
+
+    Returns:
+        A dataset that is used to track metrics to Aim.
+    """
+    return AimMetricsDataSetChild(hook=hook, metrics_dataset=metrics_dataset)
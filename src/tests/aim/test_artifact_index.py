@@ -0,0 +1,59 @@
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+from aim import Image, Text
+
+from kedro_aim.aim.artifact_index import ArtifactIndex, content_hash
+
+
+def test_content_hash() -> None:
+    """Check that the hash only depends on the type and the content of an object."""
+    assert content_hash(Text("joke")) == content_hash(Text("joke"))
+    assert content_hash(Text("joke")) != content_hash(Text("other joke"))
+
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+    assert content_hash(Image(image)) == content_hash(Image(image.copy()))
+    assert content_hash(Image(image)) != content_hash(Image(image + 1))
+    assert content_hash(Image(image)) != content_hash(Image(image, caption="zeros"))
+
+
+def test_artifact_index_is_shared_by_runs(tmp_path: Path) -> None:
+    """Check that the entries of all runs are stored in the index file."""
+    path = tmp_path / ".aim" / "kedro_aim_artifacts.json"
+    reference: Dict[str, Any] = {
+        "run_hash": None,
+        "name": "joke",
+        "context": {},
+        "step": None,
+    }
+
+    first = ArtifactIndex(path)
+    second = ArtifactIndex(path)
+    assert first.add("a", reference) is None
+    assert first.add("a", {**reference, "name": "other"}) == reference
+    assert second.add("b", reference) is None
+
+    # the first reference of a content is kept
+    assert first.get("a") == reference
+    assert first.get("b") is None
+
+    # the run hash is added when the index is saved and the entries are merged
+    first.save("first_run")
+    second.save("second_run")
+    second.save("second_run")
+    index = ArtifactIndex(path)
+    assert index.get("a") == {**reference, "run_hash": "first_run"}
+    assert index.get("b") == {**reference, "run_hash": "second_run"}
+
+
+def test_corrupt_artifact_index_is_ignored(tmp_path: Path) -> None:
+    """Check that a corrupt index file is replaced."""
+    path = tmp_path / "kedro_aim_artifacts.json"
+    path.write_text("{")
+
+    index = ArtifactIndex(path)
+    assert index.get("a") is None
+    index.add("a", {"run_hash": None, "name": "joke", "context": {}})
+    index.save("run")
+    assert ArtifactIndex(path).get("a") is not None
@@ -0,0 +1,82 @@
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from aim import Distribution
+from pytest_mock import MockerFixture
+
+from kedro_aim.aim.distributions import iter_chunks, make_distribution, value_range
+
+
+def test_iter_chunks_splits_along_first_axis() -> None:
+    """Check that chunks contain whole rows and only finite values."""
+    data = np.arange(12, dtype=float).reshape(4, 3)
+    data[1, 1] = np.nan
+    chunks = list(iter_chunks(data, chunk_size=7))
+    assert [chunk.tolist() for chunk in chunks] == [
+        [0.0, 1.0, 2.0, 3.0, 5.0],
+        [6.0, 7.0, 8.0, 9.0, 10.0, 11.0],
+    ]
+    assert [chunk.tolist() for chunk in iter_chunks(3, chunk_size=7)] == [[3.0]]
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (np.array([2.0, -1.0, np.inf]), (-1.0, 2.0)),
+        (np.array([2.0, 2.0]), (1.5, 2.5)),
+        (np.array([np.nan]), (0.0, 1.0)),
+    ],
+)
+def test_value_range(data: np.ndarray, expected: tuple) -> None:
+    """Check that the range matches the range of `np.histogram`."""
+    assert value_range(data, chunk_size=1) == expected
+
+
+def test_make_distribution_matches_numpy_histogram(tmp_path: Path) -> None:
+    """Check that the chunked histogram of a memory-mapped array is exact."""
+    values = np.random.default_rng(0).normal(size=(1000, 10))
+    data = np.memmap(tmp_path / "values.dat", dtype=float, mode="w+", shape=(1000, 10))
+    data[:] = values
+
+    distribution = make_distribution(data, bin_count=16, chunk_size=1000)
+
+    hist, edges = np.histogram(values, bins=16)
+    assert isinstance(distribution, Distribution)
+    assert distribution.bin_count == 16
+    assert distribution.range == pytest.approx((edges[0], edges[-1]))
+    assert distribution.weights.tolist() == hist.tolist()
+
+
+def test_make_distribution_with_bin_range() -> None:
+    """Check that values outside of an explicit range are not counted."""
+    distribution = make_distribution([0.1, 0.6, 5.0], bin_count=2, bin_range=(0, 1))
+    assert list(distribution.range) == [0, 1]
+    assert distribution.weights.tolist() == [1, 1]
+
+
+class HistogramDistribution:
+    """A stand-in for `aim.Distribution` of aim versions which accept bin counts."""
+
+    def __init__(
+        self,
+        distribution: Any = None,
+        bin_count: int = 64,
+        *,
+        hist: Any = None,
+        bin_range: Any = None,
+    ) -> None:
+        self.hist: Any = hist
+        self.bin_range = bin_range
+
+
+def test_make_distribution_passes_bin_counts_if_supported(
+    mocker: MockerFixture,
+) -> None:
+    """Check that the bin counts are passed to aim versions which accept them."""
+    mocker.patch("aim.Distribution", HistogramDistribution)
+    distribution = make_distribution([0.1, 0.6, 5.0], bin_count=2, bin_range=(0, 1))
+    assert isinstance(distribution, HistogramDistribution)
+    assert distribution.hist.tolist() == [1, 1]
+    assert distribution.bin_range == (0, 1)
@@ -0,0 +1,42 @@
+import numpy as np
+from aim import Image
+from matplotlib import pyplot as plt
+
+from kedro_aim.aim.figures import RasterRenderer, make_raster_figure
+
+
+def test_raster_renderer_draws_figures_with_shared_canvas() -> None:
+    """Check that figures are drawn at the given resolution and keep their canvas."""
+    renderer = RasterRenderer()
+    fig = plt.figure(figsize=(2, 1), dpi=50)
+    plt.plot([1, 2, 3])
+    canvas = fig.canvas
+
+    pixels = renderer.render(fig, dpi=100)
+    assert pixels.shape == (100, 200, 3) and pixels.dtype == np.uint8
+    assert renderer.render(fig).shape == (50, 100, 3)
+    assert fig.canvas is canvas and fig.dpi == 50
+
+    # the pixels do not change when the canvas is reused for the next figure
+    copy = pixels.copy()
+    renderer.render(plt.figure(figsize=(2, 1), facecolor="black"), dpi=100)
+    assert (pixels == copy).all()
+    plt.close("all")
+
+
+def test_raster_renderer_keeps_transparency() -> None:
+    """Check that the alpha channel is kept for transparent figures."""
+    fig = plt.figure(figsize=(1, 1), dpi=10)
+    fig.patch.set_alpha(0)
+    assert RasterRenderer().render(fig).shape == (10, 10, 4)
+    plt.close(fig)
+
+
+def test_make_raster_figure() -> None:
+    """Check that an aim image with the encoding options is created."""
+    fig = plt.figure(figsize=(2, 2), dpi=10)
+    image = make_raster_figure(fig, dpi=20, format="jpeg", caption="plot")
+    assert isinstance(image, Image)
+    assert image.size == (40, 40)
+    assert image.format == "jpeg" and image.caption == "plot"
+    plt.close(fig)
@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+from aim import Image
+from matplotlib import pyplot as plt
+from PIL import Image as PILImage
+
+from kedro_aim.aim.images import (
+    downscale,
+    downscale_factor,
+    is_image_batch,
+    make_image,
+    make_images,
+    sample_indices,
+    to_uint8,
+)
+
+
+def test_is_image_batch() -> None:
+    """Check that lists and 4-D arrays are detected as batches."""
+    assert is_image_batch([np.zeros((4, 4))])
+    assert is_image_batch(np.zeros((2, 4, 4, 3)))
+    assert not is_image_batch(np.zeros((4, 4, 3)))
+    assert not is_image_batch("image")
+
+
+@pytest.mark.parametrize(
+    "n_items,max_items,expected",
+    [
+        (5, None, [0, 1, 2, 3, 4]),
+        (5, 10, [0, 1, 2, 3, 4]),
+        (10, 4, [0, 3, 6, 9]),
+        (10_000, 1, [0]),
+    ],
+)
+def test_sample_indices(n_items: int, max_items: int, expected: list) -> None:
+    """Check that the indices are spread evenly over the batch."""
+    assert sample_indices(n_items, max_items).tolist() == expected
+
+
+def test_to_uint8() -> None:
+    """Check the conversion of the value ranges of the different dtypes."""
+    floats = np.array([-1.0, 0.0, 0.5, 1.0, 2.0])
+    assert to_uint8(floats).tolist() == [0, 0, 128, 255, 255]
+    assert to_uint8(np.array([True, False])).tolist() == [255, 0]
+    assert to_uint8(np.array([-5, 7, 300])).tolist() == [0, 7, 255]
+    uint8 = np.array([1, 2], dtype=np.uint8)
+    assert to_uint8(uint8) is uint8
+
+
+def test_make_images() -> None:
+    """Check that batches of any type are converted to a list of images."""
+    batch = np.random.rand(10, 4, 4, 3).astype(np.float32)
+    images = make_images(batch, max_items=3, caption="sample")
+    assert len(images) == 3
+    assert all(isinstance(image, Image) for image in images)
+    assert images[0].caption == "sample"
+
+    # lists of mixed shapes and types are converted item by item
+    fig = plt.figure()
+    mixed = [np.zeros((4, 4), dtype=np.uint8), np.zeros((2, 2, 3)), fig]
+    assert len(make_images(mixed)) == 3
+    plt.close(fig)
+
+
+@pytest.mark.parametrize(
+    "height,width,max_size,expected",
+    [(100, 50, None, 1), (100, 50, 100, 1), (100, 50, 99, 2), (30, 2160, 1000, 3)],
+)
+def test_downscale_factor(
+    height: int, width: int, max_size: int, expected: int
+) -> None:
+    """Check that the factor fits the longer side into the maximum size."""
+    assert downscale_factor(height, width, max_size) == expected
+
+
+def test_downscale_returns_views() -> None:
+    """Check that images and batches are downscaled without copying pixels."""
+    mask = np.arange(2160 * 3840, dtype=np.int32).reshape(2160, 3840)
+    small = downscale(mask, 1000)
+    assert small.shape == (540, 960)
+    assert np.shares_memory(small, mask)
+    assert set(np.unique(small)) <= set(np.unique(mask))
+    assert downscale(mask, None) is mask
+
+    batch = np.zeros((5, 40, 20, 3))
+    assert downscale(batch, 10, batch=True).shape == (5, 10, 5, 3)
+
+
+@pytest.mark.parametrize("image_format", ["png", "jpeg", "webp"])
+def test_make_image_downscales_and_encodes(image_format: str) -> None:
+    """Check that arrays and pillow images are downscaled before they are encoded."""
+    array = np.random.randint(0, 256, (400, 300, 3), dtype=np.uint8)
+    image = make_image(array, max_size=100, format=image_format, quality=50)
+    assert image.size == (75, 100)
+    assert image.format == image_format
+
+    pil_image = make_image(PILImage.fromarray(array), max_size=100)
+    assert pil_image.size == (75, 100)
+    assert make_image(PILImage.fromarray(array), max_size=400).size == (300, 400)
+
+
+def test_make_images_downscales_batches() -> None:
+    """Check that all kinds of batches are downscaled."""
+    batch = np.random.rand(4, 40, 40, 3)
+    assert {image.size for image in make_images(batch, max_size=10)} == {(10, 10)}
+    stacked = make_images(list(batch), max_size=10)
+    assert {image.size for image in stacked} == {(10, 10)}
+    mixed = make_images([batch[0], batch[1, :20]], max_size=10)
+    assert [image.size for image in mixed] == [(10, 10), (10, 5)]
@@ -0,0 +1,54 @@
+from typing import Any, Dict
+
+import pytest
+from pytest_mock import MockerFixture
+
+from kedro_aim.aim.lazy import LazyRun
+
+
+def test_lazy_run_creation(mocker: MockerFixture) -> None:
+    """Check that the run is created on first access and deferred writes applied."""
+    params: Dict[str, Any] = {}
+    run = mocker.MagicMock()
+    run.__setitem__.side_effect = params.__setitem__
+    run.__getitem__.side_effect = params.__getitem__
+    factory = mocker.Mock(return_value=run)
+    lazy_run = LazyRun(factory)
+
+    # deferred writes do not create the run
+    assert lazy_run.defer(lambda r: r.__setitem__("deferred", 1))
+    assert not lazy_run.created
+    factory.assert_not_called()
+
+    # item assignment creates the run and applies the deferred writes
+    lazy_run["param"] = 2
+    assert lazy_run.created
+    assert lazy_run["deferred"] == 1
+    assert lazy_run["param"] == 2
+
+    # once created, writes are not deferred anymore
+    assert not lazy_run.defer(lambda r: None)
+
+    # attributes are forwarded to the run, private ones are not
+    lazy_run.track(1, name="score")
+    run.track.assert_called_once_with(1, name="score")
+    with pytest.raises(AttributeError):
+        lazy_run._missing
+    factory.assert_called_once()
+
+
+def test_lazy_run_defers_attribute_assignments(mocker: MockerFixture) -> None:
+    """Check that public attributes are set on the run once it is created."""
+    run = mocker.MagicMock()
+    factory = mocker.Mock(return_value=run)
+    lazy_run = LazyRun(factory)
+
+    lazy_run.name = "renamed"
+    factory.assert_not_called()
+    assert lazy_run.run is run
+    assert run.name == "renamed"
+
+    # once created, attributes are set right away
+    lazy_run.description = "description"
+    assert run.description == "description"
+    factory.assert_called_once()
@@ -0,0 +1,183 @@
+import pickle
+from multiprocessing import Manager
+from threading import Thread
+from typing import Any, List, Set, Tuple
+
+import pytest
+
+from kedro_aim.aim.proxy import RunProxy
+from kedro_aim.aim.utils import SequenceKey, sequence_key
+from kedro_aim.aim.writer import AsyncRunWriter
+
+
+class RecordingRun:
+    """A fake run which records all calls that are applied to it."""
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, Any]] = []
+        self.params: dict = {}
+
+    def track(self, value: Any, **kwargs: Any) -> None:
+        """Record a tracked value."""
+        self.calls.append(("track", value))
+
+    def set(self, key: str, val: Any, strict: bool = True) -> None:
+        """Record a set parameter."""
+        self.calls.append(("set", key))
+
+    def add_tag(self, value: str) -> None:
+        """Record an added tag."""
+        self.calls.append(("add_tag", value))
+
+    def remove_tag(self, tag_name: str) -> None:
+        """Record a removed tag."""
+        self.calls.append(("remove_tag", tag_name))
+
+    def __setitem__(self, key: str, val: Any) -> None:
+        """Record and store a set parameter."""
+        self.calls.append(("__setitem__", key))
+        self.params[key] = val
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a stored parameter.
+
+        Args:
+            key: The name of the parameter.
+
+        Returns:
+            The stored value.
+        """
+        return self.params[key]
+
+
+def test_writer_applies_writes_in_order() -> None:
+    """Check that the writer applies all submitted writes in submission order."""
+    run = RecordingRun()
+    writer = AsyncRunWriter(run, queue_size=10, batch_size=3)  # type: ignore
+
+    for i in range(50):
+        writer.submit("track", i)
+    writer.close()
+
+    assert run.calls == [("track", i) for i in range(50)]
+
+
+def test_writer_merges_buffers_of_threads() -> None:
+    """Check that the writes of each thread are applied in order and none are lost."""
+    run = RecordingRun()
+    writer = AsyncRunWriter(run, queue_size=4, batch_size=7)  # type: ignore
+
+    def track(thread_id: int) -> None:
+        for i in range(500):
+            writer.submit("track", (thread_id, i))
+        if thread_id % 2 == 0:
+            writer.flush_thread()
+
+    threads = [Thread(target=track, args=(thread_id,)) for thread_id in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # the remaining writes of the odd threads are queued when the writer is closed
+    writer.close()
+
+    assert len(run.calls) == 16 * 500
+    for thread_id in range(16):
+        tracked = [i for _, (t, i) in run.calls if t == thread_id]
+        assert tracked == list(range(500))
+
+
+def test_writer_raises_errors_of_writer_thread() -> None:
+    """Check that a failing write is raised in the submitting thread."""
+    run = RecordingRun()
+    writer = AsyncRunWriter(run)  # type: ignore
+
+    writer.submit("unknown_method", 1)
+    with pytest.raises(AttributeError):
+        writer.flush()
+    writer.close()
+
+
+def test_proxy_forwards_writes_and_reads() -> None:
+    """Check that the proxy queues writes and reads after flushing."""
+    run = RecordingRun()
+    writer = AsyncRunWriter(run)  # type: ignore
+    proxy = RunProxy(writer)
+
+    proxy.track(1.0, name="score")
+    proxy.set("other_param", "value")
+    proxy.add_tag("tag")
+    proxy.remove_tag("tag")
+    proxy["param"] = "value"
+
+    assert proxy["param"] == "value"
+    assert proxy.calls == [
+        ("track", 1.0),
+        ("set", "other_param"),
+        ("add_tag", "tag"),
+        ("remove_tag", "tag"),
+        ("__setitem__", "param"),
+    ]
+
+    # private attributes are not forwarded to the run
+    with pytest.raises(AttributeError):
+        proxy._calls
+    writer.close()
+
+
+def test_proxy_forwards_attribute_assignments() -> None:
+    """Check that public attributes are set on the run and private on the proxy."""
+    run = RecordingRun()
+    writer = AsyncRunWriter(run)  # type: ignore
+    proxy = RunProxy(writer)
+
+    proxy.name = "renamed"
+    proxy.experiment = "experiment"
+    assert proxy.name == "renamed"
+    assert getattr(run, "name") == "renamed"
+    assert getattr(run, "experiment") == "experiment"
+
+    proxy._sequences = set()
+    assert not hasattr(run, "_sequences")
+    writer.close()
+
+
+def test_proxy_indexes_tracked_sequences() -> None:
+    """Check that the proxy adds the keys of tracked sequences to the index."""
+    run = RecordingRun()
+    writer = AsyncRunWriter(run)  # type: ignore
+    sequences: Set[SequenceKey] = set()
+    proxy = RunProxy(writer, sequences)
+
+    proxy.track(1.0, name="score", context={"subset": "train"})
+    proxy.track(2.0, name="score", context={"subset": "train"})
+    proxy.track(3.0)
+    proxy.track({"loss": 1.0, "acc": 0.5}, context={"subset": "val"})
+    writer.close()
+
+    assert sequences == {
+        sequence_key("score", {"subset": "train"}),
+        sequence_key("loss", {"subset": "val"}),
+        sequence_key("acc", {"subset": "val"}),
+    }
+    assert sequence_key("score") not in sequences
+
+
+def test_pickled_proxy_submits_to_original_writer() -> None:
+    """Check that a pickled proxy sends its writes to the writer it was copied from."""
+    run = RecordingRun()
+    with Manager() as manager:
+        writer = AsyncRunWriter(run, queue=manager.Queue())  # type: ignore
+        proxy_copy = pickle.loads(pickle.dumps(RunProxy(writer)))
+
+        proxy_copy["param"] = "value"
+        proxy_copy.track(1.0)
+        proxy_copy._writer.flush()
+        assert run.calls == [("__setitem__", "param"), ("track", 1.0)]
+
+        # the copy has no access to the run
+        with pytest.raises(RuntimeError):
+            proxy_copy["param"]
+        proxy_copy._writer.close()
+        writer.close()
@@ -1,11 +1,19 @@
 from pathlib import Path
 
 import pytest
+import yaml
 from aim import Repo
+from kedro.config import ConfigLoader, MissingConfigException
+from pytest import MonkeyPatch
 from pytest_lazyfixture import lazy_fixture
+from pytest_mock import MockerFixture
 
 from kedro_aim.config.model import RepositoryOptions
-from kedro_aim.config.utils import load_repository
+from kedro_aim.config.utils import (
+    load_aim_config,
+    load_repository,
+    local_repository_path,
+)
 
 
 @pytest.fixture
@@ -44,3 +52,69 @@ def test_repository_options(cfg: RepositoryOptions) -> None:
     else:
         assert isinstance(repo, Repo)
         assert (Path(cfg.path) / ".aim").exists(), "The repository should be initilized"
+
+
+def test_local_repository_path(
+    monkeypatch: MonkeyPatch, tmp_path: Path, initilized_repo_option: RepositoryOptions
+) -> None:
+    """Test that the data folder of local repositories is found."""
+    monkeypatch.chdir(tmp_path)
+    assert local_repository_path(initilized_repo_option) == tmp_path / ".aim"
+    assert local_repository_path(RepositoryOptions()) == tmp_path / ".aim"
+    assert local_repository_path(RepositoryOptions(path="aim://localhost")) is None
+
+
+def test_load_aim_config_is_cached_until_files_change(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Check that the config is only parsed again if its files change."""
+    (tmp_path / "base").mkdir()
+    (tmp_path / "local").mkdir()
+    aim_yml = tmp_path / "base" / "aim.yml"
+    aim_yml.write_text(yaml.dump({"ui": {"port": 1234}}))
+    loader = ConfigLoader(str(tmp_path))
+    get = mocker.spy(loader, "get")
+
+    config = load_aim_config(loader)
+    assert config.ui.port == 1234
+    config.ui.port = 1
+    assert load_aim_config(ConfigLoader(str(tmp_path))).ui.port == 1234
+    assert load_aim_config(loader).ui.port == 1234
+    assert get.call_count == 1
+
+    # added files and modifications invalidate the cache
+    local_aim_yml = tmp_path / "local" / "aim.yml"
+    local_aim_yml.write_text(yaml.dump({"ui": {"port": 4321}}))
+    assert load_aim_config(loader).ui.port == 4321
+    local_aim_yml.write_text(yaml.dump({"ui": {"host": "0.0.0.0"}}))
+    assert load_aim_config(loader).ui.host == "0.0.0.0"
+    assert get.call_count == 3
+
+    # files in aim folders invalidate the cache as well
+    (tmp_path / "base" / "aim").mkdir()
+    run_yml = tmp_path / "base" / "aim" / "run.yml"
+    run_yml.write_text(yaml.dump({"run": {"experiment": "first"}}))
+    assert load_aim_config(loader).run.experiment == "first"
+    run_yml.write_text(yaml.dump({"run": {"experiment": "second"}}))
+    assert load_aim_config(loader).run.experiment == "second"
+    assert get.call_count == 5
+
+    # other environments are cached separately
+    (tmp_path / "prod").mkdir()
+    assert load_aim_config(ConfigLoader(str(tmp_path), env="prod")).ui.port == 1234
+
+
+def test_load_aim_config_without_files_or_conf_paths(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Check that missing configs raise and other loaders are not cached."""
+    (tmp_path / "base").mkdir()
+    (tmp_path / "local").mkdir()
+    with pytest.raises(MissingConfigException):
+        load_aim_config(ConfigLoader(str(tmp_path)))
+
+    loader = mocker.Mock(spec=["get"])
+    loader.get.return_value = {"ui": {"port": 1}}
+    assert load_aim_config(loader).ui.port == 1
+    assert load_aim_config(loader).ui.port == 1
+    assert loader.get.call_count == 2
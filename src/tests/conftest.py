@@ -1,6 +1,8 @@
 from pathlib import Path
+from typing import Any, Callable, Dict
 
 import pytest
+import yaml
 from cookiecutter.main import cookiecutter
 from kedro import __version__ as kedro_version
 from kedro.framework.cli.starters import TEMPLATE_PATH
@@ -61,3 +63,28 @@ def kedro_project_with_aim_config(kedro_project: Path) -> Path:
     )
 
     return kedro_project
+
+
+@pytest.fixture
+def update_aim_config(
+    kedro_project_with_aim_config: Path,
+) -> Callable[[Dict[str, Dict[str, Any]]], Path]:
+    """Create a function which changes options of the `aim.yml` of a Kedro project.
+
+    Args:
+        kedro_project_with_aim_config: A Kedro project with a `aim.yml` file.
+
+    Returns:
+        A function which takes a mapping from the sections of the config to the
+        options which are changed in them and returns the path to the Kedro project.
+    """
+
+    def update(options: Dict[str, Dict[str, Any]]) -> Path:
+        aim_yml = kedro_project_with_aim_config / "conf" / "local" / "aim.yml"
+        cfg_dict = yaml.safe_load(aim_yml.read_text())
+        for section, section_options in options.items():
+            cfg_dict.setdefault(section, {}).update(section_options)
+        aim_yml.write_text(yaml.dump(cfg_dict))
+        return kedro_project_with_aim_config
+
+    return update
@@ -232,3 +232,52 @@ def test_aim_is_found(
     monkeypatch.chdir(kedro_project_with_aim_config)
     r = subprocess.run([sys.executable, "-m", "kedro", "--help"], capture_output=True)
     assert "aim" in r.stdout.decode("utf-8")
+
+
+def test_ui_uses_repository_and_options(
+    monkeypatch: MonkeyPatch, mocker: MockerFixture, kedro_project_with_aim_config: Path
+) -> None:
+    """Check that the `aim ui` command passes the repository and the server options."""
+    monkeypatch.chdir(kedro_project_with_aim_config)
+    aim_yml_path = kedro_project_with_aim_config / "conf" / "local" / "aim.yml"
+    with open(aim_yml_path, "w") as fhandler:
+        yaml.dump(dict(repository=dict(path="my_repo"), ui=dict(workers=2)), fhandler)
+
+    create_session = mocker.patch("kedro.framework.session.KedroSession.create")
+    ui_mocker = mocker.patch("subprocess.call")
+    cli_runner = CliRunner()
+    result = cli_runner.invoke(cli_ui, "--port 1234 --dev")  # type: ignore
+
+    assert result.exit_code == 0
+    create_session.assert_not_called()
+    ui_mocker.assert_called_once_with(
+        [
+            "aim",
+            "up",
+            "--port",
+            "1234",
+            "--host",
+            "127.0.0.1",
+            "--repo",
+            "my_repo",
+            "--workers",
+            "2",
+            "--dev",
+        ]
+    )
+
+
+def test_ui_without_aim_config(
+    monkeypatch: MonkeyPatch, mocker: MockerFixture, kedro_project: Path
+) -> None:
+    """Check that the `aim ui` command uses the default config without `aim.yml`."""
+    monkeypatch.chdir(kedro_project)
+    ui_mocker = mocker.patch("subprocess.call")
+    cli_runner = CliRunner()
+    result = cli_runner.invoke(cli_ui)  # type: ignore
+
+    assert result.exit_code == 0
+    default = KedroAimConfig().ui
+    ui_mocker.assert_called_once_with(
+        ["aim", "up", "--port", str(default.port), "--host", default.host]
+    )
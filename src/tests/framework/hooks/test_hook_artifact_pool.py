@@ -0,0 +1,218 @@
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+import yaml
+from aim import Run, Text
+from aim.sdk.repo import Repo
+from kedro.framework.project import _ProjectPipelines  # type: ignore
+from kedro.framework.session import KedroSession
+from kedro.framework.startup import bootstrap_project
+from kedro.pipeline import Pipeline, node
+from pytest import MonkeyPatch
+from pytest_mock import MockerFixture
+
+from kedro_aim.aim.utils import list_metrics_in_run
+from kedro_aim.framework.hooks.aim_hook import StatusTag
+
+N_JOKES = 4
+
+
+@pytest.fixture
+def mock_artifact_pipeline(mocker: MockerFixture) -> threading.Event:
+    """Mock the pipeline regestry to contain nodes which create and load artifacts.
+
+    Args:
+        mocker: A pytest-mock fixture.
+
+    Returns:
+        An event which is set when the artifact was loaded by the second node.
+    """
+    loaded = threading.Event()
+
+    def tell_jokes() -> List[str]:
+        return [f"Joke number {i}." for i in range(N_JOKES)]
+
+    def read_joke(joke: str) -> None:
+        assert joke == "Joke number 0."
+        loaded.set()
+
+    def mocked_register_pipelines() -> Dict[str, Pipeline]:
+        artifact_pipeline = Pipeline(
+            [
+                node(
+                    func=tell_jokes,
+                    inputs=None,
+                    outputs=[f"joke_{i}" for i in range(N_JOKES)],
+                ),
+                node(func=read_joke, inputs="joke_0", outputs=None),
+            ]
+        )
+        return {"__default__": artifact_pipeline}
+
+    mocker.patch.object(
+        _ProjectPipelines,
+        "_get_pipelines_registry_callable",
+        return_value=mocked_register_pipelines,
+    )
+    return loaded
+
+
+@pytest.fixture
+def kedro_project_with_artifact_pool(
+    update_aim_config: Callable[[Dict[str, Dict[str, Any]]], Path]
+) -> Path:
+    """Enable the artifact pool and add text artifacts to the catalog.
+
+    Args:
+        update_aim_config: Changes options of the `aim.yml` of a Kedro project.
+
+    Returns:
+        The path to the Kedro project.
+    """
+    project_path = update_aim_config({"tracking": {"artifact_workers": 2}})
+
+    catalog = {
+        f"joke_{i}": {
+            "type": "kedro_aim.io.artifacts.AimArtifactDataSet",
+            "artifact_type": "text",
+            "name": f"joke_{i}",
+            "data_set": {
+                "type": "kedro.extras.datasets.text.TextDataSet",
+                "filepath": f"data/08_reporting/joke_{i}.md",
+            },
+        }
+        for i in range(N_JOKES)
+    }
+    catalog_yml = project_path / "conf" / "base" / "catalog.yml"
+    catalog_yml.write_text(yaml.dump(catalog))
+    return project_path
+
+
+def test_artifacts_are_tracked_by_pool(
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    kedro_project_with_artifact_pool: Path,
+    mock_artifact_pipeline: threading.Event,
+) -> None:
+    """Check that artifacts are tracked in the pool and awaited at the end."""
+    monkeypatch.chdir(kedro_project_with_artifact_pool)
+
+    # block the creation of the aim objects until the saved artifact was loaded
+    threads = []
+
+    def slow_text(data: Any, **kwargs: Any) -> Text:
+        threads.append(threading.current_thread().name)
+        assert mock_artifact_pipeline.wait(timeout=30)
+        return Text(data, **kwargs)
+
+    mocker.patch("aim.Text", slow_text)
+
+    bootstrap_project(kedro_project_with_artifact_pool)
+    with KedroSession.create(project_path=kedro_project_with_artifact_pool) as session:
+        session.run()
+
+    # check that the artifacts were created in the pool
+    assert len(threads) == N_JOKES
+    assert all(name.startswith("kedro-aim-artifact") for name in threads)
+
+    repo = Repo(str(kedro_project_with_artifact_pool))
+    runs = list(repo.iter_runs())
+    assert len(runs) == 1, "There should be only one run"
+    run = runs[0]
+
+    # check that every artifact was tracked once, also the one that was loaded
+    metrics = {m.name: m for m in list_metrics_in_run(run)}
+    for i in range(N_JOKES):
+        value = metrics[f"joke_{i}"].values.tolist()
+        assert len(value) == 1
+        assert value[0].data == f"Joke number {i}."
+    assert StatusTag.SUCCESS in run.tags
+
+
+@pytest.mark.usefixtures("mock_artifact_pipeline")
+def test_errors_of_pool_are_raised(
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    kedro_project_with_artifact_pool: Path,
+) -> None:
+    """Check that an error in the pool fails the pipeline run at the end."""
+    monkeypatch.chdir(kedro_project_with_artifact_pool)
+    mocker.patch(
+        "aim.Text",
+        side_effect=ValueError("Not funny"),
+    )
+
+    bootstrap_project(kedro_project_with_artifact_pool)
+    with KedroSession.create(project_path=kedro_project_with_artifact_pool) as session:
+        with pytest.raises(ValueError, match="Not funny"):
+            session.run()
+
+        # the artifacts were saved by the wrapped datasets nevertheless
+        for i in range(N_JOKES):
+            assert (
+                kedro_project_with_artifact_pool / f"data/08_reporting/joke_{i}.md"
+            ).exists()
+
+    repo = Repo(str(kedro_project_with_artifact_pool))
+    run = next(repo.iter_runs())
+    assert StatusTag.FAILURE in run.tags
+
+
+def test_partitions_are_tracked_by_writer(
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    update_aim_config: Callable[[Dict[str, Dict[str, Any]]], Path],
+) -> None:
+    """Check that the threads of the partition pool never write to the run."""
+    project_path = update_aim_config({"tracking": {"asynchronous": False}})
+    catalog = {
+        "jokes": {
+            "type": "kedro_aim.io.artifacts.AimArtifactDataSet",
+            "artifact_type": "text",
+            "name": "jokes",
+            "partition_workers": 2,
+            "data_set": {
+                "type": "PartitionedDataSet",
+                "path": "data/08_reporting/jokes",
+                "dataset": "kedro.extras.datasets.text.TextDataSet",
+                "filename_suffix": ".md",
+            },
+        }
+    }
+    (project_path / "conf" / "base" / "catalog.yml").write_text(yaml.dump(catalog))
+    monkeypatch.chdir(project_path)
+
+    def tell_jokes() -> Dict[str, str]:
+        return {f"joke_{i}": f"Joke number {i}." for i in range(N_JOKES)}
+
+    mocker.patch.object(
+        _ProjectPipelines,
+        "_get_pipelines_registry_callable",
+        return_value=lambda: {
+            "__default__": Pipeline([node(tell_jokes, inputs=None, outputs="jokes")])
+        },
+    )
+
+    # record the threads which write to the run
+    threads = []
+    track = Run.track
+
+    def record_track(run: Run, *args: Any, **kwargs: Any) -> None:
+        threads.append(threading.current_thread().name)
+        track(run, *args, **kwargs)
+
+    mocker.patch.object(Run, "track", record_track)
+
+    bootstrap_project(project_path)
+    with KedroSession.create(project_path=project_path) as session:
+        session.run()
+
+    assert len(threads) == N_JOKES
+    assert set(threads) == {"kedro-aim-writer"}
+
+    run = next(Repo(str(project_path)).iter_runs())
+    metrics = [m for m in list_metrics_in_run(run) if m.name == "jokes"]
+    contexts = sorted(m.context.to_dict()["partition"] for m in metrics)
+    assert contexts == [f"joke_{i}" for i in range(N_JOKES)]
@@ -0,0 +1,124 @@
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+from aim.sdk.repo import Repo
+from kedro.framework.project import _ProjectPipelines  # type: ignore
+from kedro.framework.session import KedroSession
+from kedro.framework.startup import bootstrap_project
+from kedro.pipeline import Pipeline, node
+from pytest import MonkeyPatch
+from pytest_mock import MockerFixture
+
+from kedro_aim.aim.proxy import RunProxy
+from kedro_aim.aim.utils import list_metrics_in_run
+from kedro_aim.framework.hooks.aim_hook import StatusTag
+
+
+@pytest.fixture
+def mock_tracking_pipeline(mocker: MockerFixture) -> None:
+    """Mock the pipeline regestry to contain a pipeline which tracks many values."""
+
+    def track_values(run: RunProxy) -> int:
+        assert isinstance(run, RunProxy), "The catalog should contain a proxy"
+        for i in range(1000):
+            run.track(i, name="counter")
+        run["foo"] = "bar"
+        return 0
+
+    def failing_node(x: int) -> None:
+        raise ValueError("Let's make this pipeline fail")
+
+    def track_untrackable(run: RunProxy) -> None:
+        run.track(object(), name="untrackable")
+
+    def mocked_register_pipelines() -> Dict[str, Pipeline]:
+        tracking_pipeline = Pipeline(
+            [node(func=track_values, inputs="run", outputs="output")]
+        )
+        failing_pipeline = tracking_pipeline + Pipeline(
+            [node(func=failing_node, inputs="output", outputs=None)]
+        )
+        untrackable_pipeline = Pipeline(
+            [node(func=track_untrackable, inputs="run", outputs=None)]
+        )
+        return {
+            "__default__": tracking_pipeline,
+            "failing": failing_pipeline,
+            "untrackable": untrackable_pipeline,
+        }
+
+    mocker.patch.object(
+        _ProjectPipelines,
+        "_get_pipelines_registry_callable",
+        return_value=mocked_register_pipelines,
+    )
+
+
+@pytest.fixture
+def kedro_project_with_async_tracking(
+    update_aim_config: Callable[[Dict[str, Dict[str, Any]]], Path]
+) -> Path:
+    """Enable asynchronous tracking in the `aim.yml` of the project.
+
+    Args:
+        update_aim_config: Changes options of the `aim.yml` of a Kedro project.
+
+    Returns:
+        The path to the Kedro project.
+    """
+    return update_aim_config({"tracking": {"asynchronous": True}})
+
+
+@pytest.mark.usefixtures("mock_tracking_pipeline")
+@pytest.mark.parametrize("pipeline_name", ["__default__", "failing"])
+def test_asynchronous_tracking(
+    monkeypatch: MonkeyPatch,
+    kedro_project_with_async_tracking: Path,
+    pipeline_name: str,
+) -> None:
+    """Check that all writes of the proxy are applied before the run is closed."""
+    monkeypatch.chdir(kedro_project_with_async_tracking)
+
+    bootstrap_project(kedro_project_with_async_tracking)
+    with KedroSession.create(project_path=kedro_project_with_async_tracking) as session:
+        if pipeline_name == "failing":
+            with pytest.raises(ValueError):
+                session.run(pipeline_name=pipeline_name)
+        else:
+            session.run(pipeline_name=pipeline_name)
+
+    repo = Repo(str(kedro_project_with_async_tracking))
+    runs = list(repo.iter_runs())
+    assert len(runs) == 1, "There should be only one run"
+    run = runs[0]
+
+    # check that all values were written in the order in which they were tracked
+    assert run["foo"] == "bar"
+    counter = next(m for m in list_metrics_in_run(run) if m.name == "counter")
+    tracked = {step: value for step, (value, *_) in counter.data.items()}
+    assert tracked == {i: i for i in range(1000)}
+
+    # check that the status tag was added after the writes
+    expected_tag = (
+        StatusTag.FAILURE if pipeline_name == "failing" else StatusTag.SUCCESS
+    )
+    assert expected_tag in run.tags
+
+
+@pytest.mark.usefixtures("mock_tracking_pipeline")
+def test_run_is_closed_if_writer_fails(
+    monkeypatch: MonkeyPatch, kedro_project_with_async_tracking: Path
+) -> None:
+    """Check that the run is tagged and closed before the error of a write is raised."""
+    monkeypatch.chdir(kedro_project_with_async_tracking)
+
+    bootstrap_project(kedro_project_with_async_tracking)
+    with KedroSession.create(project_path=kedro_project_with_async_tracking) as session:
+        with pytest.raises(Exception):
+            session.run(pipeline_name="untrackable")
+
+    repo = Repo(str(kedro_project_with_async_tracking))
+    run = next(repo.iter_runs())
+    assert StatusTag.FAILURE in run.tags
+    assert run.end_time is not None, "The run should be finalized"
@@ -0,0 +1,124 @@
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+import yaml
+from aim.sdk.repo import Repo
+from kedro.framework.project import _ProjectPipelines  # type: ignore
+from kedro.framework.session import KedroSession
+from kedro.framework.startup import bootstrap_project
+from kedro.pipeline import Pipeline, node
+from pytest import MonkeyPatch
+from pytest_mock import MockerFixture
+
+from kedro_aim.aim.utils import list_metrics_in_run
+
+
+@pytest.fixture
+def mock_io_pipelines(mocker: MockerFixture) -> None:
+    """Mock the pipeline regestry to contain a pipeline which saves and loads data."""
+
+    def make_list(ratio: float) -> List[float]:
+        return [ratio] * 100
+
+    def total(x: List[float]) -> float:
+        return sum(x)
+
+    def mocked_register_pipelines() -> Dict[str, Pipeline]:
+        return {
+            "__default__": Pipeline(
+                [
+                    node(make_list, "params:ratio", "values"),
+                    node(total, "values", "total"),
+                ]
+            )
+        }
+
+    mocker.patch.object(
+        _ProjectPipelines,
+        "_get_pipelines_registry_callable",
+        return_value=mocked_register_pipelines,
+    )
+
+
+@pytest.fixture
+def kedro_project_with_dataset_instrumentation(
+    update_aim_config: Callable[[Dict[str, Dict[str, Any]]], Path]
+) -> Path:
+    """Enable dataset instrumentation and add a pickled dataset to the project.
+
+    Args:
+        update_aim_config: Changes options of the `aim.yml` of a Kedro project.
+
+    Returns:
+        The path to the Kedro project.
+    """
+    project_path = update_aim_config(
+        {"instrumentation": {"datasets": True, "dataset_sizes": True}}
+    )
+    conf_base = project_path / "conf" / "base"
+    (conf_base / "parameters.yml").write_text(yaml.dump({"ratio": 0.5}))
+    catalog = {
+        "values": {
+            "type": "pickle.PickleDataSet",
+            "filepath": "data/values.pkl",
+        }
+    }
+    (conf_base / "catalog.yml").write_text(yaml.dump(catalog))
+    (project_path / "data").mkdir(exist_ok=True)
+    return project_path
+
+
+@pytest.mark.usefixtures("mock_io_pipelines")
+def test_dataset_statistics_are_tracked(
+    monkeypatch: MonkeyPatch, kedro_project_with_dataset_instrumentation: Path
+) -> None:
+    """Check that the aggregated I/O statistics are tracked per dataset."""
+    project_path = kedro_project_with_dataset_instrumentation
+    monkeypatch.chdir(project_path)
+
+    bootstrap_project(project_path)
+    with KedroSession.create(project_path=project_path) as session:
+        session.run()
+
+    repo = Repo(str(project_path))
+    run = next(repo.iter_runs())
+    metrics = {
+        (m.name, m.context.to_dict().get("dataset")): [
+            value for _, (value, *_) in m.data.items()
+        ]
+        for m in list_metrics_in_run(run)
+    }
+
+    assert metrics["dataset_save_count", "values"] == [1]
+    assert metrics["dataset_load_count", "values"] == [1]
+    assert ("dataset_load_time", "params:ratio") in metrics
+    file_size = (project_path / "data" / "values.pkl").stat().st_size
+    assert metrics["dataset_save_bytes", "values"] == [file_size]
+    assert ("dataset_load_bytes", "params:ratio") not in metrics
+
+
+@pytest.mark.usefixtures("mock_io_pipelines")
+def test_multiprocess_run_warns_about_worker_datasets(
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    kedro_project_with_dataset_instrumentation: Path,
+    update_aim_config: Callable[[Dict[str, Dict[str, Any]]], Path],
+) -> None:
+    """Check that a warning is logged if datasets are loaded in worker processes."""
+    project_path = update_aim_config({"tracking": {"multiprocess": True}})
+    monkeypatch.chdir(project_path)
+    logger = mocker.patch("kedro_aim.framework.hooks.aim_hook.LOGGER")
+
+    bootstrap_project(project_path)
+    with KedroSession.create(project_path=project_path) as session:
+        session.run()
+
+    logger.warning.assert_called_once_with(
+        "The datasets of worker processes are not instrumented."
+    )
+    # the datasets of the main process are still measured
+    repo = Repo(str(project_path))
+    run = next(repo.iter_runs())
+    names = {m.name for m in list_metrics_in_run(run)}
+    assert "dataset_save_count" in names
@@ -9,9 +9,12 @@
 from kedro.framework.session import KedroSession
 from kedro.framework.startup import bootstrap_project
 from kedro.pipeline import Pipeline, node
+from kedro.pipeline.modular_pipeline import pipeline
 from pytest import MonkeyPatch
 from pytest_mock import MockerFixture
 
+from kedro_aim.aim.utils import list_metrics_in_run
+
 
 @pytest.fixture
 def mock_failing_pipeline(mocker: MockerFixture) -> None:
@@ -110,3 +113,89 @@ def test_deactivate_tracking_but_not_for_given_pipeline(
     # check that the run is marked as failed
     run = runs[0]
     assert run["foo"] == "bar", "The run should have stored the foo key"
+
+
+@pytest.fixture
+def mock_modular_pipeline(mocker: MockerFixture) -> None:
+    """Mock the pipeline regestry to contain a hot inner modular pipeline."""
+
+    def make_joke(ratio: float) -> str:
+        return f"A joke with ratio {ratio}."
+
+    def mocked_register_pipelines() -> Dict[str, Pipeline]:
+        inner = Pipeline(
+            [node(func=make_joke, inputs="params:ratio", outputs="joke", name="joke")]
+        )
+        return {
+            "__default__": pipeline(
+                inner,
+                namespace="hot",
+                parameters={"params:ratio": "params:hot_ratio"},
+                outputs={"joke": "hot_joke"},
+            )
+            + pipeline(
+                inner,
+                namespace="cold",
+                parameters={"params:ratio": "params:cold_ratio"},
+                outputs={"joke": "cold_joke"},
+            )
+        }
+
+    mocker.patch.object(
+        _ProjectPipelines,
+        "_get_pipelines_registry_callable",
+        return_value=mocked_register_pipelines,
+    )
+
+
+@pytest.mark.usefixtures("mock_modular_pipeline")
+def test_deactivate_tracking_for_given_namespace(
+    monkeypatch: MonkeyPatch, kedro_project_with_aim_config: Path
+) -> None:
+    """Check that parameters and artifacts of a disabled namespace are not tracked."""
+    monkeypatch.chdir(kedro_project_with_aim_config)
+    conf_base = kedro_project_with_aim_config / "conf" / "base"
+    (conf_base / "parameters.yml").write_text(
+        yaml.dump({"hot_ratio": 0.5, "cold_ratio": 2.0})
+    )
+    (conf_base / "catalog.yml").write_text(
+        yaml.dump(
+            {
+                f"{name}_joke": {
+                    "type": "kedro_aim.io.artifacts.AimArtifactDataSet",
+                    "artifact_type": "text",
+                    "name": f"{name}_joke",
+                    "data_set": {
+                        "type": "kedro.extras.datasets.text.TextDataSet",
+                        "filepath": f"data/{name}.md",
+                    },
+                }
+                for name in ["hot", "cold"]
+            }
+        )
+    )
+
+    # disable the hot namespace
+    with open("./conf/local/aim.yml", "r") as f:
+        cfg_dict = yaml.safe_load(f)
+        cfg_dict["disable"]["namespaces"] = ["h*"]
+
+    with open("./conf/local/aim.yml", "w") as f:
+        yaml.dump(cfg_dict, f)
+
+    bootstrap_project(kedro_project_with_aim_config)
+    with KedroSession.create(project_path=kedro_project_with_aim_config) as session:
+        session.run()
+
+    # the outputs of both namespaces are saved
+    assert (kedro_project_with_aim_config / "data" / "hot.md").exists()
+    assert (kedro_project_with_aim_config / "data" / "cold.md").exists()
+
+    # only the cold namespace is tracked
+    repo = Repo(str(kedro_project_with_aim_config))
+    run = next(iter(repo.iter_runs()))
+    assert run["cold_ratio"] == 2.0
+    assert run.get("hot_ratio") is None
+    metric_names = {metric.name for metric in list_metrics_in_run(run)}
+    assert "cold_joke" in metric_names
+    assert "hot_joke" not in metric_names
@@ -0,0 +1,97 @@
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+import yaml
+from aim.sdk.repo import Repo
+from kedro.framework.project import _ProjectPipelines  # type: ignore
+from kedro.framework.session import KedroSession
+from kedro.framework.startup import bootstrap_project
+from kedro.pipeline import Pipeline, node
+from pytest import MonkeyPatch
+from pytest_mock import MockerFixture
+
+from kedro_aim.aim.lazy import LazyRun
+from kedro_aim.framework.hooks.aim_hook import StatusTag
+
+
+@pytest.fixture
+def mock_lazy_pipelines(mocker: MockerFixture) -> None:
+    """Mock the pipeline regestry to contain pipelines with and without a run."""
+
+    def no_tracking(x: Any) -> int:
+        return 0
+
+    def tracking(run: LazyRun, x: int) -> None:
+        assert isinstance(run, LazyRun), "The catalog should contain a lazy run"
+        assert not run.created, "The run should not be created before it is used"
+        run.track(1, name="score")
+
+    def mocked_register_pipelines() -> Dict[str, Pipeline]:
+        untracked_pipeline = Pipeline(
+            [node(func=no_tracking, inputs="params:ratio", outputs="x")]
+        )
+        tracked_pipeline = untracked_pipeline + Pipeline(
+            [node(func=tracking, inputs=["run", "x"], outputs=None)]
+        )
+        return {"__default__": untracked_pipeline, "tracked": tracked_pipeline}
+
+    mocker.patch.object(
+        _ProjectPipelines,
+        "_get_pipelines_registry_callable",
+        return_value=mocked_register_pipelines,
+    )
+
+
+@pytest.fixture
+def kedro_project_with_lazy_run(
+    update_aim_config: Callable[[Dict[str, Dict[str, Any]]], Path]
+) -> Path:
+    """Enable lazy run creation in the `aim.yml` of the project and add a parameter.
+
+    Args:
+        update_aim_config: Changes options of the `aim.yml` of a Kedro project.
+
+    Returns:
+        The path to the Kedro project.
+    """
+    project_path = update_aim_config({"run": {"lazy": True}})
+    parameters_yml = project_path / "conf" / "base" / "parameters.yml"
+    parameters_yml.write_text(yaml.dump({"ratio": 0.2}))
+    return project_path
+
+
+@pytest.mark.usefixtures("mock_lazy_pipelines")
+def test_lazy_run_is_not_created_if_unused(
+    monkeypatch: MonkeyPatch, kedro_project_with_lazy_run: Path
+) -> None:
+    """Check that no run is created if the run is never used."""
+    monkeypatch.chdir(kedro_project_with_lazy_run)
+
+    bootstrap_project(kedro_project_with_lazy_run)
+    with KedroSession.create(project_path=kedro_project_with_lazy_run) as session:
+        session.run()
+
+    assert not (kedro_project_with_lazy_run / ".aim").exists()
+
+
+@pytest.mark.usefixtures("mock_lazy_pipelines")
+def test_lazy_run_is_created_on_first_use(
+    monkeypatch: MonkeyPatch, kedro_project_with_lazy_run: Path
+) -> None:
+    """Check that the run is created on first use with all buffered parameters."""
+    monkeypatch.chdir(kedro_project_with_lazy_run)
+
+    bootstrap_project(kedro_project_with_lazy_run)
+    with KedroSession.create(project_path=kedro_project_with_lazy_run) as session:
+        session.run(pipeline_name="tracked")
+
+    repo = Repo(str(kedro_project_with_lazy_run))
+    runs = list(repo.iter_runs())
+    assert len(runs) == 1, "There should be only one run"
+    run = runs[0]
+
+    # check that the buffered values were written after the creation
+    assert run["kedro"]["pipeline_name"] == "tracked"
+    assert run["ratio"] == 0.2
+    assert StatusTag.SUCCESS in run.tags
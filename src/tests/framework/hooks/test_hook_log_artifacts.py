@@ -1,8 +1,9 @@
 import shutil
 from pathlib import Path
-from typing import Dict
+from typing import Any, Callable, Dict, Iterator, List
 
 import pytest
+import yaml
 from aim import Text
 from aim.sdk.repo import Repo
 from kedro.framework.project import _ProjectPipelines  # type: ignore
@@ -13,6 +14,8 @@
 from pytest_mock import MockerFixture
 
 from kedro_aim.aim.utils import list_metrics_in_run
+from kedro_aim.config import KedroAimConfig
+from kedro_aim.framework.hooks import AimHook
 
 
 @pytest.fixture
@@ -78,3 +81,172 @@ def test_logging_of_artifact(
     text_value = value_list[0]
     assert isinstance(text_value, Text)
     assert text_value.data == "A funny joke."
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_resumed_run_does_not_track_loaded_artifact_again(
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    kedro_project_with_aim_config: Path,
+    update_aim_config: Callable[[Dict[str, Dict[str, Any]]], Path],
+    datadir: Path,
+    lazy: bool,
+) -> None:
+    """Check that the artifacts of a resumed run are known without tracking again."""
+    monkeypatch.chdir(kedro_project_with_aim_config)
+    source_catalog = datadir / "catalog.yml"
+    dest_catalog = kedro_project_with_aim_config / "conf" / "base" / "catalog.yml"
+    shutil.copy(source_catalog, dest_catalog)
+
+    def artifact_generator() -> str:
+        return "A funny joke."
+
+    def artifact_reader(joke: str) -> None:
+        assert joke == "A funny joke."
+
+    mocker.patch.object(
+        _ProjectPipelines,
+        "_get_pipelines_registry_callable",
+        return_value=lambda: {
+            "__default__": Pipeline([node(artifact_generator, None, "text_artifact")]),
+            "reader": Pipeline([node(artifact_reader, "text_artifact", None)]),
+        },
+    )
+
+    # create the artifact in a first run
+    bootstrap_project(kedro_project_with_aim_config)
+    with KedroSession.create(project_path=kedro_project_with_aim_config) as session:
+        session.run()
+    repo = Repo(str(kedro_project_with_aim_config))
+    run_hash = next(repo.iter_runs()).hash
+
+    # resume the run and only load the artifact
+    update_aim_config({"run": {"run_hash": run_hash, "lazy": lazy}})
+    with KedroSession.create(project_path=kedro_project_with_aim_config) as session:
+        session.run(pipeline_name="reader")
+
+    # check that the artifact was tracked only once
+    runs = list(repo.iter_runs())
+    assert len(runs) == 1, "There should be only one run"
+    metrics = list(list_metrics_in_run(runs[0]))
+    text_artifact = next(metric for metric in metrics if metric.name == "funny_joke")
+    assert len(text_artifact.values.tolist()) == 1
+
+
+def test_deduplication_of_artifacts(
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    kedro_project_with_aim_config: Path,
+    update_aim_config: Callable[[Dict[str, Dict[str, Any]]], Path],
+    datadir: Path,
+) -> None:
+    """Check that unchanged artifacts are only stored by the first run."""
+    monkeypatch.chdir(kedro_project_with_aim_config)
+    source_catalog = datadir / "catalog.yml"
+    dest_catalog = kedro_project_with_aim_config / "conf" / "base" / "catalog.yml"
+    shutil.copy(source_catalog, dest_catalog)
+
+    update_aim_config({"tracking": {"deduplicate_artifacts": True}})
+
+    jokes = iter(["A funny joke.", "A funny joke.", "Another joke."])
+
+    def artifact_generator() -> str:
+        return next(jokes)
+
+    mocker.patch.object(
+        _ProjectPipelines,
+        "_get_pipelines_registry_callable",
+        return_value=lambda: {
+            "__default__": Pipeline([node(artifact_generator, None, "text_artifact")])
+        },
+    )
+
+    bootstrap_project(kedro_project_with_aim_config)
+    run_hashes: List[str] = []
+    for _ in range(3):
+        with KedroSession.create(project_path=kedro_project_with_aim_config) as session:
+            session.run()
+        repo = Repo(str(kedro_project_with_aim_config))
+        run_hashes.append(
+            next(run.hash for run in repo.iter_runs() if run.hash not in run_hashes)
+        )
+    first, second, third = (repo.get_run(run_hash) for run_hash in run_hashes)
+
+    # the first and the third run store their jokes
+    for run, joke in [(first, "A funny joke."), (third, "Another joke.")]:
+        metrics = list(list_metrics_in_run(run))
+        text_artifact = next(m for m in metrics if m.name == "funny_joke")
+        assert [value.data for value in text_artifact.values.tolist()] == [joke]
+
+    # the second run only references the joke of the first run
+    assert "funny_joke" not in [m.name for m in list_metrics_in_run(second)]
+    assert second["artifact_references"] == {
+        "funny_joke": {
+            "run_hash": first.hash,
+            "name": "funny_joke",
+            "context": {},
+            "step": None,
+        }
+    }
+
+
+def test_artifacts_of_remote_repository_are_not_deduplicated() -> None:
+    """Check that no index of the stored artifacts is used for remote repositories."""
+    hook = AimHook()
+    hook.aim_config = KedroAimConfig.parse_obj(
+        {"repository": {"path": "aim://localhost:53800"}}
+    )
+    assert hook._load_artifact_index() is None
+
+
+def test_logging_of_artifact_stream_from_generator_node(
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    kedro_project_with_aim_config: Path,
+) -> None:
+    """Check that the elements which a generator node yields are tracked as steps."""
+    monkeypatch.chdir(kedro_project_with_aim_config)
+    catalog = {
+        "joke_stream": {
+            "type": "kedro_aim.io.artifacts.AimArtifactStreamDataSet",
+            "artifact_type": "text",
+            "name": "joke_stream",
+            "data_set": {
+                "type": "PartitionedDataSet",
+                "path": "data/08_reporting/jokes",
+                "dataset": "kedro.extras.datasets.text.TextDataSet",
+                "filename_suffix": ".md",
+            },
+        }
+    }
+    catalog_yml = kedro_project_with_aim_config / "conf" / "base" / "catalog.yml"
+    catalog_yml.write_text(yaml.dump(catalog))
+
+    def tell_jokes() -> Iterator[str]:
+        for i in range(3):
+            yield f"Joke number {i}."
+
+    mocker.patch.object(
+        _ProjectPipelines,
+        "_get_pipelines_registry_callable",
+        return_value=lambda: {
+            "__default__": Pipeline([node(tell_jokes, None, "joke_stream")])
+        },
+    )
+
+    bootstrap_project(kedro_project_with_aim_config)
+    with KedroSession.create(project_path=kedro_project_with_aim_config) as session:
+        session.run()
+
+    repo = Repo(str(kedro_project_with_aim_config))
+    run = next(repo.iter_runs())
+    metrics = list(list_metrics_in_run(run))
+    stream = next(metric for metric in metrics if metric.name == "joke_stream")
+    tracked = {step: value.data for step, (value, *_) in stream.data.items()}
+    assert tracked == {i: f"Joke number {i}." for i in range(3)}
+    jokes = kedro_project_with_aim_config / "data" / "08_reporting" / "jokes"
+    assert sorted(path.name for path in jokes.iterdir()) == [
+        "00000.md",
+        "00001.md",
+        "00002.md",
+    ]
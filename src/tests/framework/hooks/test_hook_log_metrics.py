@@ -16,6 +16,7 @@
 
 from kedro_aim.aim.utils import list_metrics_in_run
 from kedro_aim.framework.hooks import AimHook
+from kedro_aim.io.metrics import AimMetricsDataSet
 
 
 @pytest.fixture
@@ -191,3 +192,47 @@ def test_aim_hook_logging_metrics(
     figure_list = figure_metric.values.tolist()
     assert len(figure_list) == 1, "There should be only one figure in the run"
     assert isinstance(figure_list[0], Figure), "Figure should be of type `aim.Figure`"
+
+
+def test_aim_hook_logging_metrics_dataset(
+    monkeypatch: MonkeyPatch,
+    kedro_project_with_aim_config: Path,
+    dummy_run_params: Dict[str, Any],
+) -> None:
+    """Check that a frame saved to a `AimMetricsDataSet` is tracked to the run."""
+
+    def train() -> pd.DataFrame:
+        return pd.DataFrame({"step": [0, 1, 2], "loss": [1.0, 0.5, 0.25]})
+
+    pipeline = Pipeline([node(func=train, inputs=None, outputs="curve")])
+    catalog = DataCatalog({"curve": AimMetricsDataSet(context={"subset": "train"})})
+
+    monkeypatch.chdir(kedro_project_with_aim_config)
+    bootstrap_project(kedro_project_with_aim_config)
+    with KedroSession.create(project_path=kedro_project_with_aim_config) as session:
+        aim_hook = AimHook()
+        aim_hook.after_context_created(session.load_context())
+        aim_hook.after_catalog_created(
+            catalog=catalog,
+            conf_catalog={},
+            conf_creds={},
+            feed_dict={},
+            save_version="",
+            load_versions="",
+        )
+        aim_hook.before_pipeline_run(
+            run_params=dummy_run_params, pipeline=pipeline, catalog=catalog
+        )
+        SequentialRunner().run(pipeline, catalog, hook_manager=None)  # type: ignore
+        aim_hook.after_pipeline_run(
+            run_params=dummy_run_params, pipeline=pipeline, catalog=catalog
+        )
+
+    logging_run = next(Repo(str(kedro_project_with_aim_config)).iter_runs())
+    loss = next(m for m in list_metrics_in_run(logging_run) if m.name == "loss")
+    assert loss.context.to_dict() == {"subset": "train"}
+    assert {step: value for step, (value, *_) in loss.data.items()} == {
+        0: 1.0,
+        1: 0.5,
+        2: 0.25,
+    }
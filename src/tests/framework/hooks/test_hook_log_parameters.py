@@ -1,3 +1,4 @@
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, Iterable
 
@@ -14,6 +15,8 @@
 from pytest import MonkeyPatch
 from pytest_mock import MockerFixture
 
+from kedro_aim.framework.hooks import AimHook
+
 
 class DummyProjectHooks:  # pragma: no cover
     """A dummy project hooks class to replace kedro hooks."""
@@ -171,3 +174,31 @@ def test_parameter_logging(
 
     # check that whole parameter config logged correctly
     assert logging_run["parameters"] == {"foo": "bar"}
+
+
+def test_parameter_logging_skips_logged_values(mocker: MockerFixture) -> None:
+    """Check that parameters are only written if their value changed."""
+    hook = AimHook()
+    hook.run = mocker.MagicMock()
+    run_node = partial(
+        hook.before_node_run,
+        node=mocker.Mock(),
+        catalog=DataCatalog(),
+        is_async=False,
+        session_id="",
+    )
+
+    # the same parameters are consumed by many nodes
+    for _ in range(10):
+        run_node(inputs={"parameters": {"foo": "bar"}, "params:foo": "bar"})
+    assert hook.run.__setitem__.call_count == 2
+
+    # a changed value is written again
+    run_node(inputs={"parameters": {"foo": "baz"}, "params:foo": "bar"})
+    assert hook.run.__setitem__.call_count == 3
+    hook.run.__setitem__.assert_called_with("parameters", {"foo": "baz"})
+
+    # values which can not be fingerprinted are always written
+    run_node(inputs={"params:fun": lambda: None})
+    run_node(inputs={"params:fun": lambda: None})
+    assert hook.run.__setitem__.call_count == 5
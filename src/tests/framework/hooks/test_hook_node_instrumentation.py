@@ -0,0 +1,115 @@
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pytest
+import yaml
+from aim.sdk.repo import Repo
+from kedro.framework.project import _ProjectPipelines  # type: ignore
+from kedro.framework.session import KedroSession
+from kedro.framework.startup import bootstrap_project
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node
+from pytest import MonkeyPatch
+from pytest_mock import MockerFixture
+
+from kedro_aim.aim.utils import list_metrics_in_run
+from kedro_aim.framework.hooks import AimHook
+from kedro_aim.framework.hooks.instrumentation import NodeProfiler
+
+
+@pytest.fixture
+def mock_instrumented_pipelines(mocker: MockerFixture) -> None:
+    """Mock the pipeline regestry to contain a pipeline with a namespace."""
+
+    def make_array(ratio: float) -> np.ndarray:
+        return np.full(100, ratio)
+
+    def total(x: np.ndarray) -> float:
+        return float(x.sum())
+
+    def mocked_register_pipelines() -> Dict[str, Pipeline]:
+        return {
+            "__default__": Pipeline(
+                [
+                    node(make_array, "params:ratio", "x", name="make_array"),
+                    node(total, "x", "total", name="total", namespace="eval"),
+                ]
+            )
+        }
+
+    mocker.patch.object(
+        _ProjectPipelines,
+        "_get_pipelines_registry_callable",
+        return_value=mocked_register_pipelines,
+    )
+
+
+@pytest.fixture
+def kedro_project_with_node_instrumentation(
+    update_aim_config: Callable[[Dict[str, Dict[str, Any]]], Path]
+) -> Path:
+    """Enable node instrumentation in the `aim.yml` of the project.
+
+    Args:
+        update_aim_config: Changes options of the `aim.yml` of a Kedro project.
+
+    Returns:
+        The path to the Kedro project.
+    """
+    project_path = update_aim_config({"instrumentation": {"nodes": True}})
+    parameters_yml = project_path / "conf" / "base" / "parameters.yml"
+    parameters_yml.write_text(yaml.dump({"ratio": 0.5}))
+    return project_path
+
+
+@pytest.mark.usefixtures("mock_instrumented_pipelines")
+def test_node_statistics_are_tracked(
+    monkeypatch: MonkeyPatch, kedro_project_with_node_instrumentation: Path
+) -> None:
+    """Check that the statistics of each node are tracked with the node as context."""
+    monkeypatch.chdir(kedro_project_with_node_instrumentation)
+
+    bootstrap_project(kedro_project_with_node_instrumentation)
+    with KedroSession.create(
+        project_path=kedro_project_with_node_instrumentation
+    ) as session:
+        session.run()
+
+    repo = Repo(str(kedro_project_with_node_instrumentation))
+    run = next(repo.iter_runs())
+    metrics = {
+        (m.name, m.context.to_dict().get("node")): m for m in list_metrics_in_run(run)
+    }
+
+    for node_name in ["make_array", "eval.total"]:
+        assert ("node_wall_time", node_name) in metrics
+        assert ("node_cpu_time", node_name) in metrics
+    output_bytes = metrics["node_output_bytes", "make_array"].data.items()
+    assert [value for _, (value, *_) in output_bytes] == [800]
+    context = metrics["node_inputs", "eval.total"].context.to_dict()
+    assert context["namespace"] == "eval"
+
+
+def test_node_statistics_of_worker_processes_are_sent_right_away(
+    mocker: MockerFixture,
+) -> None:
+    """Check that worker processes track the statistics through the run proxy."""
+    hook = AimHook()
+    hook.node_profiler = NodeProfiler()
+    hook._main_pid = os.getpid() + 1  # the hook runs in a worker process
+    run = mocker.MagicMock()
+    load_run_proxy = mocker.patch(
+        "kedro_aim.framework.hooks.aim_hook._load_run_proxy", return_value=run
+    )
+
+    kedro_node = node(np.sum, "x", "total", name="total")
+    catalog = DataCatalog()
+    hook.node_profiler.start()
+    hook.after_node_run(kedro_node, catalog, {"x": [1]}, {"total": 1}, False, "id")
+
+    load_run_proxy.assert_called_once_with(catalog)
+    names = {call.kwargs["name"] for call in run.track.call_args_list}
+    assert {"node_wall_time", "node_cpu_time", "node_output_bytes"} <= names
+    assert hook.node_profiler.pop_stats() == []
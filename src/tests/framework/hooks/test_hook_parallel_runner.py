@@ -0,0 +1,240 @@
+import pickle
+from multiprocessing import Manager
+from pathlib import Path
+from typing import Dict
+
+import pytest
+import yaml
+from aim.sdk.repo import Repo
+from kedro.framework.project import _ProjectPipelines  # type: ignore
+from kedro.framework.session import KedroSession
+from kedro.framework.startup import bootstrap_project
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+from kedro.runner import ParallelRunner
+from pytest import MonkeyPatch
+from pytest_mock import MockerFixture
+
+from kedro_aim.aim.proxy import RunProxy
+from kedro_aim.aim.utils import list_metrics_in_run
+from kedro_aim.aim.writer import AsyncRunWriter
+from kedro_aim.framework.hooks import AimHook
+from kedro_aim.framework.hooks.aim_hook import StatusTag
+
+
+def track_in_worker(run: RunProxy, ratio: float) -> int:
+    """Track values from a worker process.
+
+    The function is defined on module level, so that it can be pickled.
+
+    Args:
+        run: The proxy of the run.
+        ratio: A parameter.
+
+    Returns:
+        A dummy output.
+    """
+    for i in range(100):
+        run.track(i * ratio, name="worker_metric", context={"ratio": ratio})
+    return 0
+
+
+def tell_joke(ratio: float) -> str:
+    """Create a text artifact in a worker process.
+
+    Args:
+        ratio: A parameter.
+
+    Returns:
+        The text of the artifact.
+    """
+    return f"A joke with ratio {ratio}."
+
+
+def read_in_worker(run: RunProxy) -> None:
+    """Try to read from the run in a worker process.
+
+    Args:
+        run: The proxy of the run.
+    """
+    with pytest.raises(RuntimeError):
+        run["ratio"]
+
+
+@pytest.fixture
+def mock_parallel_pipeline(mocker: MockerFixture) -> None:
+    """Mock the pipeline regestry to contain nodes which track in parallel."""
+
+    def mocked_register_pipelines() -> Dict[str, Pipeline]:
+        parallel_pipeline = Pipeline(
+            [
+                node(func=track_in_worker, inputs=["run", "params:ratio"], outputs="a"),
+                node(func=track_in_worker, inputs=["run", "params:other"], outputs="b"),
+                node(func=read_in_worker, inputs=["run"], outputs=None),
+            ]
+        )
+        return {"__default__": parallel_pipeline}
+
+    mocker.patch.object(
+        _ProjectPipelines,
+        "_get_pipelines_registry_callable",
+        return_value=mocked_register_pipelines,
+    )
+
+
+@pytest.fixture
+def mock_parallel_artifact_pipeline(mocker: MockerFixture) -> None:
+    """Mock the pipeline regestry to contain nodes which save artifacts in parallel."""
+
+    def mocked_register_pipelines() -> Dict[str, Pipeline]:
+        parallel_pipeline = Pipeline(
+            [
+                node(func=tell_joke, inputs="params:ratio", outputs="joke_a"),
+                node(func=tell_joke, inputs="params:other", outputs="joke_b"),
+            ]
+        )
+        return {"__default__": parallel_pipeline}
+
+    mocker.patch.object(
+        _ProjectPipelines,
+        "_get_pipelines_registry_callable",
+        return_value=mocked_register_pipelines,
+    )
+
+
+@pytest.mark.usefixtures("mock_parallel_pipeline")
+def test_tracking_with_parallel_runner(
+    monkeypatch: MonkeyPatch, kedro_project_with_aim_config: Path
+) -> None:
+    """Check that nodes in worker processes can track to the run."""
+    monkeypatch.chdir(kedro_project_with_aim_config)
+
+    parameters_yml = kedro_project_with_aim_config / "conf" / "base" / "parameters.yml"
+    parameters_yml.write_text(yaml.dump({"ratio": 0.5, "other": 2.0}))
+
+    bootstrap_project(kedro_project_with_aim_config)
+    with KedroSession.create(project_path=kedro_project_with_aim_config) as session:
+        session.run(runner=ParallelRunner(max_workers=2))
+
+    repo = Repo(str(kedro_project_with_aim_config))
+    runs = list(repo.iter_runs())
+    assert len(runs) == 1, "There should be only one run"
+    run = runs[0]
+
+    # check that the writes of the worker processes were applied
+    assert run["ratio"] == 0.5
+    assert run["other"] == 2.0
+    metrics = [m for m in list_metrics_in_run(run) if m.name == "worker_metric"]
+    assert {m.context["ratio"] for m in metrics} == {0.5, 2.0}
+    for metric in metrics:
+        tracked = {step: value for step, (value, *_) in metric.data.items()}
+        assert tracked == {i: i * metric.context["ratio"] for i in range(100)}
+    assert StatusTag.SUCCESS in run.tags
+
+
+def test_spawned_worker_logs_parameters_through_catalog_proxy(
+    mocker: MockerFixture,
+) -> None:
+    """Check that a hook without a run uses the proxy of the catalog."""
+    run = mocker.MagicMock()
+    manager = Manager()
+    with manager:
+        writer = AsyncRunWriter(run, queue=manager.Queue())
+        proxy_copy = pickle.loads(pickle.dumps(RunProxy(writer)))
+
+        # a fresh hook like in a spawned worker process
+        hook = AimHook()
+        hook.before_node_run(
+            node=mocker.Mock(),
+            catalog=DataCatalog({"run": MemoryDataSet(proxy_copy, copy_mode="assign")}),
+            inputs={"params:ratio": 0.5},
+            is_async=False,
+            session_id="",
+        )
+        writer.close()
+
+    run.__setitem__.assert_called_once_with("ratio", 0.5)
+
+
+@pytest.mark.usefixtures("mock_parallel_artifact_pipeline")
+def test_artifacts_with_parallel_runner(
+    monkeypatch: MonkeyPatch, kedro_project_with_aim_config: Path
+) -> None:
+    """Check that artifacts saved in worker processes are tracked to the run."""
+    monkeypatch.chdir(kedro_project_with_aim_config)
+
+    conf_base = kedro_project_with_aim_config / "conf" / "base"
+    (conf_base / "parameters.yml").write_text(yaml.dump({"ratio": 0.5, "other": 2.0}))
+    catalog = {
+        name: {
+            "type": "kedro_aim.io.artifacts.AimArtifactDataSet",
+            "artifact_type": "text",
+            "name": name,
+            "data_set": {
+                "type": "kedro.extras.datasets.text.TextDataSet",
+                "filepath": f"data/08_reporting/{name}.md",
+            },
+        }
+        for name in ["joke_a", "joke_b"]
+    }
+    (conf_base / "catalog.yml").write_text(yaml.dump(catalog))
+
+    bootstrap_project(kedro_project_with_aim_config)
+    with KedroSession.create(project_path=kedro_project_with_aim_config) as session:
+        session.run(runner=ParallelRunner(max_workers=2))
+
+    repo = Repo(str(kedro_project_with_aim_config))
+    runs = list(repo.iter_runs())
+    assert len(runs) == 1, "There should be only one run"
+    run = runs[0]
+
+    # check that the artifacts were tracked once and saved by the wrapped dataset
+    metrics = {m.name: m for m in list_metrics_in_run(run)}
+    for name in ["joke_a", "joke_b"]:
+        assert len(metrics[name].values.tolist()) == 1
+        assert (
+            (kedro_project_with_aim_config / "data/08_reporting" / name)
+            .with_suffix(".md")
+            .exists()
+        )
+    assert StatusTag.SUCCESS in run.tags
+
+
+@pytest.mark.usefixtures("mock_parallel_artifact_pipeline")
+def test_sampled_artifacts_with_parallel_runner(
+    mocker: MockerFixture, monkeypatch: MonkeyPatch, kedro_project_with_aim_config: Path
+) -> None:
+    """Check that datasets with a reservoir are copied to workers with a warning."""
+    monkeypatch.chdir(kedro_project_with_aim_config)
+    logger = mocker.patch("kedro_aim.framework.hooks.aim_hook.LOGGER")
+
+    conf_base = kedro_project_with_aim_config / "conf" / "base"
+    (conf_base / "parameters.yml").write_text(yaml.dump({"ratio": 0.5, "other": 2.0}))
+    catalog = {
+        name: {
+            "type": "kedro_aim.io.artifacts.AimArtifactDataSet",
+            "artifact_type": "text",
+            "name": name,
+            "sampling": {"reservoir": 1},
+            "data_set": {
+                "type": "kedro.extras.datasets.text.TextDataSet",
+                "filepath": f"data/08_reporting/{name}.md",
+            },
+        }
+        for name in ["joke_a", "joke_b"]
+    }
+    (conf_base / "catalog.yml").write_text(yaml.dump(catalog))
+
+    bootstrap_project(kedro_project_with_aim_config)
+    with KedroSession.create(project_path=kedro_project_with_aim_config) as session:
+        session.run(runner=ParallelRunner(max_workers=2))
+
+    logger.warning.assert_called_once_with(
+        "The `reservoir` sampling of the datasets joke_a, joke_b only applies to "
+        "saves in the main process."
+    )
+    # the jokes are saved by the workers, but their reservoirs are not tracked
+    reporting = kedro_project_with_aim_config / "data" / "08_reporting"
+    assert (reporting / "joke_a.md").exists() and (reporting / "joke_b.md").exists()
+    run = next(Repo(str(kedro_project_with_aim_config)).iter_runs())
+    assert StatusTag.SUCCESS in run.tags
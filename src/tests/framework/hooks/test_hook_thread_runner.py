@@ -0,0 +1,120 @@
+from pathlib import Path
+from typing import Dict
+
+import pytest
+import yaml
+from aim.sdk.repo import Repo
+from kedro.framework.project import _ProjectPipelines  # type: ignore
+from kedro.framework.session import KedroSession
+from kedro.framework.startup import bootstrap_project
+from kedro.pipeline import Pipeline, node
+from kedro.runner import ThreadRunner
+from pytest import MonkeyPatch
+from pytest_mock import MockerFixture
+
+from kedro_aim.aim.proxy import RunProxy
+from kedro_aim.aim.utils import list_metrics_in_run
+from kedro_aim.framework.hooks.aim_hook import StatusTag
+
+N_NODES = 24
+N_STEPS = 200
+
+
+def track_in_thread(run: RunProxy, ratio: float) -> str:
+    """Track values and create a text artifact from a thread of the runner.
+
+    Args:
+        run: The proxy of the run.
+        ratio: A parameter.
+
+    Returns:
+        The text of the artifact.
+    """
+    for i in range(N_STEPS):
+        run.track(i * ratio, name="thread_metric", context={"ratio": ratio})
+    return f"A joke with ratio {ratio}."
+
+
+def read_joke(joke: str) -> None:
+    """Load a text artifact which was saved by another thread.
+
+    Args:
+        joke: The text of the artifact.
+    """
+    assert joke.startswith("A joke")
+
+
+@pytest.fixture
+def mock_threaded_pipeline(mocker: MockerFixture) -> None:
+    """Mock the pipeline regestry to contain many nodes which track concurrently."""
+
+    def mocked_register_pipelines() -> Dict[str, Pipeline]:
+        threaded_pipeline = Pipeline(
+            [
+                node(
+                    func=track_in_thread,
+                    inputs=["run", f"params:ratio_{i}"],
+                    outputs=f"joke_{i}",
+                )
+                for i in range(N_NODES)
+            ]
+            + [node(func=read_joke, inputs="joke_0", outputs=None)]
+        )
+        return {"__default__": threaded_pipeline}
+
+    mocker.patch.object(
+        _ProjectPipelines,
+        "_get_pipelines_registry_callable",
+        return_value=mocked_register_pipelines,
+    )
+
+
+@pytest.mark.usefixtures("mock_threaded_pipeline")
+def test_tracking_with_thread_runner(
+    monkeypatch: MonkeyPatch, kedro_project_with_aim_config: Path
+) -> None:
+    """Check that many nodes can track to the run concurrently."""
+    monkeypatch.chdir(kedro_project_with_aim_config)
+
+    conf_base = kedro_project_with_aim_config / "conf" / "base"
+    ratios = {f"ratio_{i}": float(i + 1) for i in range(N_NODES)}
+    (conf_base / "parameters.yml").write_text(yaml.dump(ratios))
+    catalog = {
+        f"joke_{i}": {
+            "type": "kedro_aim.io.artifacts.AimArtifactDataSet",
+            "artifact_type": "text",
+            "name": f"joke_{i}",
+            "data_set": {
+                "type": "kedro.extras.datasets.text.TextDataSet",
+                "filepath": f"data/08_reporting/joke_{i}.md",
+            },
+        }
+        for i in range(N_NODES)
+    }
+    (conf_base / "catalog.yml").write_text(yaml.dump(catalog))
+
+    bootstrap_project(kedro_project_with_aim_config)
+    with KedroSession.create(project_path=kedro_project_with_aim_config) as session:
+        session.run(runner=ThreadRunner(max_workers=8))
+
+    repo = Repo(str(kedro_project_with_aim_config))
+    runs = list(repo.iter_runs())
+    assert len(runs) == 1, "There should be only one run"
+    run = runs[0]
+
+    # check that all parameters and values of all nodes were written
+    for name, ratio in ratios.items():
+        assert run[name] == ratio
+    metrics = list(list_metrics_in_run(run))
+    thread_metrics = [m for m in metrics if m.name == "thread_metric"]
+    assert {m.context["ratio"] for m in thread_metrics} == set(ratios.values())
+    for metric in thread_metrics:
+        tracked = {step: value for step, (value, *_) in metric.data.items()}
+        assert tracked == {i: i * metric.context["ratio"] for i in range(N_STEPS)}
+
+    # check that every artifact was tracked once, also the one that was reloaded
+    jokes = {m.name: m for m in metrics if m.name.startswith("joke_")}
+    assert len(jokes) == N_NODES
+    for joke in jokes.values():
+        assert len(joke.values.tolist()) == 1
+    assert StatusTag.SUCCESS in run.tags
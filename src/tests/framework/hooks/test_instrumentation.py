@@ -0,0 +1,269 @@
+import sys
+from pathlib import Path
+from typing import Any, List
+
+import numpy as np
+import pandas as pd
+import pytest
+from kedro.extras.datasets.pickle import PickleDataSet
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import node
+from pytest_mock import MockerFixture
+
+from kedro_aim.framework.hooks import AimHook
+from kedro_aim.framework.hooks.instrumentation import (
+    DatasetProfiler,
+    NodeProfiler,
+    approximate_size,
+    file_size,
+    track_dataset_stats,
+    track_node_stats,
+)
+from kedro_aim.io.artifacts import make_run_dataset
+from kedro_aim.io.artifacts.aim_artifact_dataset import AimArtifactDataSet, ArtifactType
+
+
+def identity(x: Any) -> Any:
+    """Return the input.
+
+    Args:
+        x: The input.
+
+    Returns:
+        The input.
+    """
+    return x
+
+
+class RecordingRun:
+    """A stand-in for a run which records the tracked values."""
+
+    def __init__(self) -> None:
+        self.tracked: List[Any] = []
+
+    def track(self, value: Any, name: str, context: Any) -> None:
+        """Record a tracked value.
+
+        Args:
+            value: The value.
+            name: The name of the metric.
+            context: The context of the metric.
+        """
+        self.tracked.append((value, name, context))
+
+
+class UntraversableList(list):
+    """A list which fails if it is iterated over."""
+
+    def __iter__(self) -> Any:
+        """Fail to iterate over the list.
+
+        Raises:
+            AssertionError: Always.
+        """
+        raise AssertionError("The list was traversed.")
+
+
+class UnsizedObject:
+    """An object whose size is unknown."""
+
+    def __sizeof__(self) -> int:
+        """Fail to report the size.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError("unknown size")
+
+
+@pytest.mark.parametrize(
+    "data, size",
+    [
+        (np.zeros((10, 10), dtype=np.float64), 800),
+        (pd.Series(np.zeros(10, dtype=np.int32)), 40),
+        (b"12345", sys.getsizeof(b"12345")),
+        (UnsizedObject(), 0),
+    ],
+)
+def test_approximate_size(data: Any, size: int) -> None:
+    """Check that the size of buffers is used if the data exposes it."""
+    assert approximate_size(data) == size
+
+
+def test_approximate_size_of_dataframe(mocker: MockerFixture) -> None:
+    """Check that the size of a dataframe is the size of its blocks."""
+    df = pd.DataFrame({"a": np.zeros(10), "b": np.zeros(10), "c": np.zeros(10, "i4")})
+    memory_usage = mocker.spy(pd.DataFrame, "memory_usage")
+    assert approximate_size(df) == 2 * 80 + 40
+    memory_usage.assert_not_called()
+
+
+def test_profiler_measures_nodes() -> None:
+    """Check that the profiler buffers the statistics of the started nodes."""
+    profiler = NodeProfiler()
+    kedro_node = node(identity, "x", "y", name="identity", namespace="prep")
+
+    assert profiler.stop(kedro_node, {}, {}) is None, "The node was not started"
+    profiler.start()
+    stats = profiler.stop(kedro_node, {"x": 1}, {"y": np.zeros(4, dtype=np.int8)})
+
+    assert stats is not None
+    assert stats.node == "prep.identity"
+    assert stats.context == {"node": "prep.identity", "namespace": "prep"}
+    assert stats.wall_time >= 0 and stats.cpu_time >= 0
+    assert (stats.inputs, stats.outputs, stats.output_bytes) == (1, 1, 4)
+    assert profiler.pop_stats() == [stats]
+    assert profiler.pop_stats() == []
+
+
+def test_track_node_stats() -> None:
+    """Check that each statistic is tracked as a metric with the node as context."""
+    profiler = NodeProfiler()
+    profiler.start()
+    profiler.stop(node(identity, "x", "y", name="identity"), {"x": 1}, {"y": 1})
+
+    run = RecordingRun()
+    track_node_stats(run, profiler.pop_stats())
+
+    names = {name for _, name, _ in run.tracked}
+    assert {"node_wall_time", "node_cpu_time", "node_output_bytes"} <= names
+    assert all(
+        context == {"node": "identity", "namespace": None}
+        for _, _, context in run.tracked
+    )
+
+
+def test_profiler_does_not_traverse_outputs(mocker: MockerFixture) -> None:
+    """Check that measuring a node does not copy or iterate over its outputs."""
+    profiler = NodeProfiler()
+    kedro_node = node(identity, "x", "y", name="identity")
+    mocker.patch.object(pd.DataFrame, "memory_usage", side_effect=AssertionError)
+    items = UntraversableList(range(1000))
+    outputs = {"df": pd.DataFrame({"a": np.zeros(1000)}), "items": items}
+
+    profiler.start()
+    stats = profiler.stop(kedro_node, {"x": 1}, outputs)
+    assert stats is not None
+    assert stats.output_bytes == 8000 + sys.getsizeof(items)
+
+
+def test_profiler_overhead_per_node(mocker: MockerFixture) -> None:
+    """Check that the work per node does not depend on the size of its outputs."""
+    module = "kedro_aim.framework.hooks.instrumentation"
+    perf_counter = mocker.patch(f"{module}.perf_counter", return_value=1.0)
+    thread_time = mocker.patch(f"{module}.thread_time", return_value=1.0)
+    size = mocker.patch(f"{module}.approximate_size", wraps=approximate_size)
+    profiler = NodeProfiler()
+    kedro_node = node(identity, "x", "y", name="identity")
+
+    n_nodes = 50
+    for i in range(n_nodes):
+        outputs = {
+            "array": np.zeros(2 ** (i % 16)),
+            "items": UntraversableList(range(i)),
+            "df": pd.DataFrame({"a": np.zeros(i)}),
+        }
+        profiler.start()
+        profiler.stop(kedro_node, {"x": 1}, outputs)
+
+    # two reads of each clock per node and one size lookup per output
+    assert perf_counter.call_count == 2 * n_nodes
+    assert thread_time.call_count == 2 * n_nodes
+    assert size.call_count == 3 * n_nodes
+    assert len(profiler.pop_stats()) == n_nodes
+
+
+def test_file_size(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Check that the size of the file of a dataset is found."""
+    data_set = PickleDataSet((tmp_path / "data.pkl").as_posix())
+    data_set.save(b"12345")
+
+    size = (tmp_path / "data.pkl").stat().st_size
+    assert file_size(data_set, saved=True) == size
+    assert file_size(MemoryDataSet(1), saved=True) is None
+
+    # artifact datasets report the size of the file of the wrapped dataset
+    artifact = make_run_dataset(
+        AimHook(),
+        AimArtifactDataSet(
+            artifact_type=ArtifactType.TEXT,
+            name="text",
+            data_set=dict(type="pickle.PickleDataSet", filepath=str(tmp_path / "t")),
+        ),
+    )
+    assert file_size(artifact, saved=False) is None, "The file does not exist"
+    artifact._data_set = data_set
+    assert file_size(artifact, saved=False) == size
+
+    # a dataset with a filesystem but without a file path
+    mocker.patch.object(data_set, "_describe", return_value={})
+    assert file_size(data_set, saved=True) is None
+
+
+def test_dataset_profiler_aggregates_loads_and_saves(tmp_path: Path) -> None:
+    """Check that the durations and sizes are aggregated per dataset and operation."""
+    data_set = PickleDataSet((tmp_path / "data.pkl").as_posix())
+    catalog = DataCatalog({"data": data_set, "memory": MemoryDataSet()})
+    profiler = DatasetProfiler(catalog, sizes=True)
+
+    def save(data: List[int]) -> int:
+        profiler.start("data")
+        catalog.save("data", data)
+        profiler.stop("data", "save")
+        return (tmp_path / "data.pkl").stat().st_size
+
+    profiler.stop("data", "load")  # a load which was not started is ignored
+    small_size = save(list(range(10)))
+    for _ in range(3):
+        profiler.start("data")
+        catalog.load("data")
+        profiler.stop("data", "load")
+    large_size = save(list(range(1000)))
+    assert small_size < large_size
+    for name in ["memory", "unknown"]:
+        profiler.start(name)
+        profiler.stop(name, "save")
+
+    stats = {(s.dataset, s.operation): s for s in profiler.pop_stats()}
+    assert set(stats) == {
+        ("data", "save"),
+        ("data", "load"),
+        ("memory", "save"),
+        ("unknown", "save"),
+    }
+    assert stats["data", "load"].count == 3
+    assert stats["data", "load"].max_time <= stats["data", "load"].total_time
+    # every call adds the size of the file at the time of the call
+    assert stats["data", "save"].bytes == small_size + large_size
+    assert stats["data", "load"].bytes == 3 * small_size
+    assert stats["memory", "save"].bytes is None
+    assert stats["unknown", "save"].bytes is None
+    assert profiler.pop_stats() == []
+
+    run = RecordingRun()
+    track_dataset_stats(run, stats.values())
+    tracked = {
+        (name, context["dataset"]): value for value, name, context in run.tracked
+    }
+    assert tracked["dataset_load_count", "data"] == 3
+    assert tracked["dataset_load_bytes", "data"] == 3 * small_size
+    assert tracked["dataset_save_bytes", "data"] == small_size + large_size
+    assert ("dataset_save_bytes", "memory") not in tracked
+
+
+def test_dataset_profiler_skips_sizes_by_default(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Check that the filesystem is not asked for sizes unless they are enabled."""
+    data_set = PickleDataSet((tmp_path / "data.pkl").as_posix())
+    size = mocker.spy(data_set._fs, "size")
+    profiler = DatasetProfiler(DataCatalog({"data": data_set}))
+
+    profiler.start("data")
+    data_set.save([1, 2, 3])
+    profiler.stop("data", "save")
+
+    (stats,) = profiler.pop_stats()
+    assert stats.count == 1
+    assert stats.bytes is None
+    size.assert_not_called()
@@ -0,0 +1,74 @@
+import pytest
+from kedro.pipeline import node
+
+from kedro_aim.config.model import DisableOptions
+from kedro_aim.framework.hooks.utils import DisableMatcher, compile_patterns
+
+
+def identity(x: int) -> int:
+    """Return the input.
+
+    Args:
+        x: The input.
+
+    Returns:
+        The input.
+    """
+    return x
+
+
+def test_compile_patterns_without_patterns() -> None:
+    """Check that no expression is compiled for an empty list of patterns."""
+    assert compile_patterns([]) is None
+
+
+@pytest.mark.parametrize(
+    "patterns, name, matches",
+    [
+        (["train*"], "training", True),
+        (["train*"], "pretraining", False),
+        (["train", "eval"], "eval", True),
+        (["re:model_\\d+"], "model_12", True),
+        (["re:model_\\d+"], "model_12_final", False),
+        (["re:model_\\d+", "report"], "report", True),
+    ],
+)
+def test_compile_patterns(patterns: list, name: str, matches: bool) -> None:
+    """Check that names have to fully match a glob pattern or regular expression."""
+    pattern = compile_patterns(patterns)
+    assert pattern is not None
+    assert bool(pattern.fullmatch(name)) is matches
+
+
+def test_disable_matcher_matches_pipelines() -> None:
+    """Check that pipelines are disabled by their name."""
+    matcher = DisableMatcher(DisableOptions(pipelines=["data_*"]))
+    assert matcher.pipeline_disabled("data_processing")
+    assert not matcher.pipeline_disabled("__default__")
+    assert not DisableMatcher(DisableOptions()).pipeline_disabled("data_processing")
+
+
+@pytest.mark.parametrize(
+    "options, disabled",
+    [
+        (DisableOptions(), False),
+        (DisableOptions(pipelines=["*"]), False),
+        (DisableOptions(nodes=["outer.inner.*"]), True),
+        (DisableOptions(nodes=["identity*"]), False),
+        (DisableOptions(tags=["re:ho+t"]), True),
+        (DisableOptions(tags=["cold"]), False),
+        (DisableOptions(namespaces=["outer"]), True),
+        (DisableOptions(namespaces=["outer.inner"]), True),
+        (DisableOptions(namespaces=["inner"]), False),
+    ],
+)
+def test_disable_matcher_matches_nodes(options: DisableOptions, disabled: bool) -> None:
+    """Check that nodes are disabled by their name, tags or namespace."""
+    hot_node = node(
+        identity, "x", "y", name="identity", tags=["hot"], namespace="outer.inner"
+    )
+    matcher = DisableMatcher(options)
+    assert matcher.node_disabled(hot_node) is disabled
+    # the decision is cached by the name of the node
+    assert matcher._node_decisions == {hot_node.name: disabled}
+    assert matcher.node_disabled(hot_node) is disabled
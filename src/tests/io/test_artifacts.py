@@ -1,23 +1,38 @@
+import os
+import pickle
+from functools import partial
+from multiprocessing import Manager
 from pathlib import Path
-from typing import Any, Dict, Generator, Tuple
+from typing import Any, Dict, Generator, Iterator, List, Tuple
 
 import numpy as np
 import pytest
-from aim import Audio, Figure, Image, Text
+from aim import Audio, Distribution, Figure, Image, Text
 from kedro import __version__ as kedro_version
 from kedro.framework.session import KedroSession
 from kedro.framework.startup import bootstrap_project
-from kedro.io import DataCatalog
+from kedro.io import DataCatalog, DataSetError
 from kedro.pipeline import Pipeline, node
 from matplotlib import pyplot as plt
 from matplotlib.figure import Figure as MplFigure
 from pytest import MonkeyPatch
 from pytest_lazyfixture import lazy_fixture
+from pytest_mock import MockerFixture
 
-from kedro_aim.aim.utils import list_metrics_in_run
+from kedro_aim.aim.artifact_index import ArtifactIndex
+from kedro_aim.aim.lazy import LazyRun
+from kedro_aim.aim.proxy import RunProxy
+from kedro_aim.aim.utils import list_metrics_in_run, sequence_key
+from kedro_aim.aim.writer import AsyncRunWriter
 from kedro_aim.framework.hooks import AimHook
-from kedro_aim.io.artifacts import make_run_dataset
-from kedro_aim.io.artifacts.aim_artifact_dataset import AimArtifactDataSet, ArtifactType
+from kedro_aim.io.artifacts import AimArtifactPartitionedDataSetChild, make_run_dataset
+from kedro_aim.io.artifacts.aim_artifact_dataset import (
+    AimArtifactDataSet,
+    AimArtifactStreamDataSet,
+    ArtifactType,
+    FigureBackend,
+    _load_dataset_class,
+)
 
 
 @pytest.fixture
@@ -387,3 +402,795 @@ def test_aim_dataset_save_and_reload_without_run(
 
     # check that the data was logged
     assert aim_hook_after_catalog_created.run is None
+
+
+@pytest.mark.parametrize(
+    "datatuple",
+    [
+        lazy_fixture("text_datatuple"),
+    ],
+)
+def test_pickled_aim_dataset_tracks_through_run_proxy(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    mocker: MockerFixture,
+    datatuple: Tuple[AimArtifactDataSet, Any],
+) -> None:
+    """Check that a pickled aim dataset tracks its artifacts through the run proxy."""
+    monkeypatch.chdir(tmp_path)
+    dataset, data = datatuple
+    run = mocker.MagicMock()
+    manager = Manager()
+    with manager:
+        writer = AsyncRunWriter(run, queue=manager.Queue())
+        hook = AimHook()
+        hook.run_proxy = RunProxy(writer)
+
+        # copy the dataset like the `ParallelRunner` does for its worker processes
+        aim_data_set = pickle.loads(pickle.dumps(make_run_dataset(hook, dataset)))
+        aim_data_set.save(data)
+        assert aim_data_set.load() == data
+        writer.close()
+
+    # the copy has no access to the hook and only tracks the saved artifact
+    assert aim_data_set._hook is None
+    run.track.assert_called_once()
+    assert run.track.call_args.kwargs["name"] == dataset.name
+
+
+def test_pickled_aim_dataset_keeps_sampling(tmp_path: Path) -> None:
+    """Check that a dataset with sampling can be copied for worker processes."""
+    dataset = AimArtifactDataSet(
+        artifact_type=ArtifactType.TEXT,
+        name="sampled",
+        data_set=dict(type="text.TextDataSet", filepath=str(tmp_path / "joke.md")),
+        sampling={"every_n": 2, "reservoir": 1, "seed": 0},
+    )
+    aim_data_set = make_run_dataset(AimHook(), dataset)
+    assert aim_data_set._sampler is not None
+    aim_data_set._sampler.sample("first")
+
+    copy = pickle.loads(pickle.dumps(aim_data_set))
+    assert copy.uses_reservoir
+    assert copy._sampler is not aim_data_set._sampler
+    # the copy continues with the counters and the reservoir of the original
+    assert copy._sampler.sample("second") is None
+    copy._sampler.sample("third")
+    assert copy._sampler._candidates == 2
+    assert len(copy._sampler.drain()) == 1
+    assert aim_data_set._sampler.drain() == [(0, "first")]
+
+
+@pytest.mark.parametrize(
+    "datatuple",
+    [
+        lazy_fixture("text_datatuple"),
+    ],
+)
+def test_aim_dataset_delegates_to_wrapped_dataset(
+    aim_hook_after_catalog_created: AimHook,
+    datatuple: Tuple[AimArtifactDataSet, Any],
+) -> None:
+    """Check that the aim dataset delegates to the wrapped dataset."""
+    dataset, data = datatuple
+    aim_data_set = make_run_dataset(aim_hook_after_catalog_created, dataset)
+
+    assert not aim_data_set.exists()
+    aim_data_set.save(data)
+    assert aim_data_set.exists()
+    assert aim_data_set._describe() == aim_data_set._data_set._describe()
+    aim_data_set.release()
+
+    # without a proxy of the run, the copy does not track anything
+    assert pickle.loads(pickle.dumps(aim_data_set))._run is None
+
+
+def test_aim_dataset_shares_dataset_classes(
+    stream_dataset: AimArtifactStreamDataSet,
+) -> None:
+    """Check that the wrappers share dataset classes and survive pickling."""
+    hook = AimHook()
+    aim_data_set = make_run_dataset(hook, stream_dataset)
+    other = make_run_dataset(hook, stream_dataset)
+    assert isinstance(other._data_set, type(aim_data_set._data_set))
+    assert _load_dataset_class.cache_info().hits > 0
+
+    # the state of the stream dataset and of its base class survives pickling
+    aim_data_set._next_step = 3
+    copy = pickle.loads(pickle.dumps(aim_data_set))
+    assert copy._next_step == 3
+    assert copy._partition_format == stream_dataset.partition_format
+    assert copy._hook is None
+
+
+@pytest.mark.parametrize(
+    "datatuple",
+    [
+        lazy_fixture("text_datatuple"),
+    ],
+)
+def test_aim_dataset_load_does_not_scan_run(
+    mocker: MockerFixture,
+    aim_hook_during_run: AimHook,
+    datatuple: Tuple[AimArtifactDataSet, Any],
+) -> None:
+    """Check that loads look up tracked artifacts in the index of the hook."""
+    dataset, data = datatuple
+    aim_data_set = make_run_dataset(aim_hook_during_run, dataset)
+    aim_data_set.save(data)
+
+    assert sequence_key(dataset.name, dataset.context) in (
+        aim_hook_during_run.tracked_sequences
+    )
+    scan = mocker.spy(aim_hook_during_run.run, "iter_sequence_info_by_type")
+    for _ in range(3):
+        aim_data_set.load()
+    scan.assert_not_called()
+
+    # the artifact was only tracked once
+    assert aim_hook_during_run.run is not None
+    metrics = list(list_metrics_in_run(aim_hook_during_run.run))
+    artifact = next(metric for metric in metrics if metric.name == dataset.name)
+    assert len(artifact.values.tolist()) == 1
+
+
+@pytest.mark.parametrize(
+    "batch",
+    [
+        np.random.rand(10, 8, 8, 3),
+        [np.random.randint(0, 256, (8, 8), dtype=np.uint8) for _ in range(10)],
+    ],
+)
+def test_aim_dataset_tracks_image_batch_as_one_step(
+    aim_hook_during_run: AimHook, batch: Any
+) -> None:
+    """Check that a batch of images is tracked as one step with sampled images."""
+    dataset = AimArtifactDataSet(
+        artifact_type=ArtifactType.IMAGE,
+        name="image_batch",
+        data_set=dict(
+            type="kedro.extras.datasets.pickle.PickleDataSet", filepath="batch.pkl"
+        ),
+        max_items=4,
+    )
+    aim_data_set = make_run_dataset(aim_hook_during_run, dataset)
+    aim_data_set.save(batch)
+
+    assert aim_hook_during_run.run is not None
+    metrics = list(list_metrics_in_run(aim_hook_during_run.run))
+    artifact = next(metric for metric in metrics if metric.name == dataset.name)
+    steps = artifact.values.tolist()
+    assert len(steps) == 1
+    assert len(steps[0]) == 4
+    assert all(isinstance(image, Image) for image in steps[0])
+
+
+def test_aim_dataset_tracks_distribution_of_array(aim_hook_during_run: AimHook) -> None:
+    """Check that a distribution artifact tracks the histogram of an array."""
+    dataset = AimArtifactDataSet(
+        artifact_type=ArtifactType.DISTRIBUTION,
+        name="weights",
+        data_set=dict(
+            type="kedro.extras.datasets.pickle.PickleDataSet", filepath="weights.pkl"
+        ),
+        save_args=dict(bin_count=8, chunk_size=100),
+    )
+    weights = np.random.rand(50, 20)
+    aim_data_set = make_run_dataset(aim_hook_during_run, dataset)
+    aim_data_set.save(weights)
+
+    assert aim_hook_during_run.run is not None
+    metrics = list(list_metrics_in_run(aim_hook_during_run.run))
+    artifact = next(metric for metric in metrics if metric.name == dataset.name)
+    (distribution,) = artifact.values.tolist()
+    assert isinstance(distribution, Distribution)
+    assert distribution.weights.tolist() == np.histogram(weights, 8)[0].tolist()
+
+
+def test_aim_dataset_tracks_sampled_saves(
+    tmp_path: Path, aim_hook_during_run: AimHook
+) -> None:
+    """Check that only sampled saves are tracked and reservoirs at the end of a run."""
+
+    def make_dataset(name: str, sampling: Dict[str, Any]) -> Any:
+        dataset = AimArtifactDataSet(
+            artifact_type=ArtifactType.TEXT,
+            name=name,
+            data_set=dict(
+                type="kedro.extras.datasets.text.TextDataSet",
+                filepath=str(tmp_path / f"{name}.txt"),
+            ),
+            sampling=sampling,
+        )
+        return make_run_dataset(aim_hook_during_run, dataset)
+
+    every_second = make_dataset("every_second", {"every_n": 2})
+    reservoir = make_dataset("reservoir", {"reservoir": 2, "seed": 1})
+    for i in range(5):
+        every_second.save(f"text {i}")
+        reservoir.save(f"text {i}")
+
+    # every save is written to the wrapped dataset and loads do not track anything
+    assert every_second.load() == reservoir.load() == "text 4"
+
+    def tracked_steps(name: str) -> List[int]:
+        assert aim_hook_during_run.run is not None
+        metrics = list_metrics_in_run(aim_hook_during_run.run)
+        metric = next((m for m in metrics if m.name == name), None)
+        return [] if metric is None else list(metric.data.indices())
+
+    assert tracked_steps("every_second") == [0, 2, 4]
+    assert tracked_steps("reservoir") == []
+
+    catalog = DataCatalog({"every_second": every_second, "reservoir": reservoir})
+    aim_hook_during_run._track_sampled_artifacts(catalog)
+    assert len(tracked_steps("reservoir")) == 2
+
+
+def test_aim_dataset_tracks_raster_figures(aim_hook_during_run: AimHook) -> None:
+    """Check that the raster backend tracks matplotlib figures as images."""
+    dataset = AimArtifactDataSet(
+        artifact_type=ArtifactType.FIGURE,
+        name="raster_figure",
+        data_set=dict(
+            type="kedro.extras.datasets.matplotlib.MatplotlibWriter",
+            filepath="raster_figure.png",
+        ),
+        figure_backend=FigureBackend.RASTER,
+        dpi=20,
+    )
+    fig = plt.figure(figsize=(3, 2))
+    plt.plot([1, 2, 3])
+    make_run_dataset(aim_hook_during_run, dataset).save(fig)
+    plt.close(fig)
+
+    assert aim_hook_during_run.run is not None
+    metrics = list(list_metrics_in_run(aim_hook_during_run.run))
+    artifact = next(metric for metric in metrics if metric.name == dataset.name)
+    (image,) = artifact.values.tolist()
+    assert isinstance(image, Image)
+    assert image.size == (60, 40)
+
+
+@pytest.fixture
+def stream_dataset(tmp_path: Path) -> AimArtifactStreamDataSet:
+    """Create a stream artifact dataset which saves texts as partitions.
+
+    Args:
+        tmp_path: The path to a temporary directory.
+
+    Returns:
+        A stream artifact dataset.
+    """
+    return AimArtifactStreamDataSet(
+        artifact_type=ArtifactType.TEXT,
+        name="text_stream",
+        data_set=dict(
+            type="PartitionedDataSet",
+            path=str(tmp_path / "stream"),
+            dataset="kedro.extras.datasets.text.TextDataSet",
+            filename_suffix=".txt",
+        ),
+        partition_format="part_{step:03d}",
+    )
+
+
+def test_aim_stream_dataset_tracks_elements_as_steps(
+    tmp_path: Path,
+    aim_hook_during_run: AimHook,
+    stream_dataset: AimArtifactStreamDataSet,
+) -> None:
+    """Check that each element of a stream is tracked and saved as it arrives."""
+    aim_data_set = make_run_dataset(aim_hook_during_run, stream_dataset)
+
+    def stream() -> Generator[str, None, None]:
+        for i in range(5):
+            # the previous element was saved before the next one is created
+            if i > 0:
+                assert (tmp_path / "stream" / f"part_{i - 1:03d}.txt").exists()
+            yield f"element {i}"
+
+    # iterators and single elements, as saved by generator nodes, can be mixed
+    aim_data_set.save(stream())
+    aim_data_set.save("element 5")
+
+    assert aim_hook_during_run.run is not None
+    metrics = list(list_metrics_in_run(aim_hook_during_run.run))
+    artifact = next(metric for metric in metrics if metric.name == "text_stream")
+    tracked = {step: value.data for step, (value, *_) in artifact.data.items()}
+    assert tracked == {i: f"element {i}" for i in range(6)}
+
+    # loading returns the elements in order without tracking them again
+    loaded = aim_data_set.load()
+    assert isinstance(loaded, Iterator)
+    assert list(loaded) == [f"element {i}" for i in range(6)]
+    assert len(artifact.values.tolist()) == 6
+
+
+def test_aim_stream_dataset_tracks_elements_at_load(
+    tmp_path: Path,
+    aim_hook_during_run: AimHook,
+    stream_dataset: AimArtifactStreamDataSet,
+) -> None:
+    """Check that an untracked stream is tracked while it is loaded."""
+    (tmp_path / "stream").mkdir()
+    for i in range(3):
+        (tmp_path / "stream" / f"part_{i:03d}.txt").write_text(f"element {i}")
+
+    aim_data_set = make_run_dataset(aim_hook_during_run, stream_dataset)
+    assert list(aim_data_set.load()) == [f"element {i}" for i in range(3)]
+
+    assert aim_hook_during_run.run is not None
+    metrics = list(list_metrics_in_run(aim_hook_during_run.run))
+    artifact = next(metric for metric in metrics if metric.name == "text_stream")
+    tracked = {step: value.data for step, (value, *_) in artifact.data.items()}
+    assert tracked == {i: f"element {i}" for i in range(3)}
+
+
+def test_aim_stream_dataset_overwrites_previous_stream_once(
+    tmp_path: Path,
+    aim_hook_during_run: AimHook,
+    stream_dataset: AimArtifactStreamDataSet,
+) -> None:
+    """Check that `overwrite` only removes the elements of previous saves."""
+    stream_dataset.data_set["overwrite"] = True
+    (tmp_path / "stream").mkdir()
+    (tmp_path / "stream" / "part_007.txt").write_text("stale element")
+
+    aim_data_set = make_run_dataset(aim_hook_during_run, stream_dataset)
+    aim_data_set.save(iter(f"element {i}" for i in range(3)))
+
+    stream = sorted(path.name for path in (tmp_path / "stream").iterdir())
+    assert stream == ["part_000.txt", "part_001.txt", "part_002.txt"]
+    assert list(aim_data_set.load()) == [f"element {i}" for i in range(3)]
+
+
+@pytest.fixture
+def partitioned_dataset(tmp_path: Path) -> AimArtifactDataSet:
+    """Create an artifact dataset which wraps a partitioned dataset of texts.
+
+    Args:
+        tmp_path: The path to a temporary directory.
+
+    Returns:
+        An artifact dataset.
+    """
+    return AimArtifactDataSet(
+        artifact_type=ArtifactType.TEXT,
+        name="text_partitions",
+        context={"subset": "test"},
+        data_set=dict(
+            type="PartitionedDataSet",
+            path=str(tmp_path / "partitions"),
+            dataset="kedro.extras.datasets.text.TextDataSet",
+            filename_suffix=".txt",
+        ),
+        partition_workers=2,
+    )
+
+
+def test_aim_dataset_tracks_partitions_in_parallel(
+    aim_hook_during_run: AimHook, partitioned_dataset: AimArtifactDataSet
+) -> None:
+    """Check that each partition is tracked with its id as context."""
+    aim_data_set = make_run_dataset(aim_hook_during_run, partitioned_dataset)
+    assert isinstance(aim_data_set, AimArtifactPartitionedDataSetChild)
+
+    calls = []
+
+    def make_text(i: int) -> str:
+        calls.append(i)
+        return f"text {i}"
+
+    # callables are only called once, by the workers
+    aim_data_set.save({f"part_{i}": partial(make_text, i) for i in range(10)})
+    assert sorted(calls) == list(range(10))
+
+    partitions = aim_data_set.load()
+    assert partitions["part_3"]() == "text 3"
+
+    assert aim_hook_during_run.run is not None
+    metrics = [
+        metric
+        for metric in list_metrics_in_run(aim_hook_during_run.run)
+        if metric.name == partitioned_dataset.name
+    ]
+    contexts = sorted(metric.context.to_dict()["partition"] for metric in metrics)
+    assert contexts == [f"part_{i}" for i in range(10)]
+    assert all(metric.context.to_dict()["subset"] == "test" for metric in metrics)
+    assert all(len(metric.values.tolist()) == 1 for metric in metrics)
+
+
+def test_aim_dataset_tracks_partitions_at_load(
+    mocker: MockerFixture,
+    aim_hook_after_catalog_created: AimHook,
+    aim_hook_during_run: AimHook,
+    partitioned_dataset: AimArtifactDataSet,
+) -> None:
+    """Check that partitions which were saved without a run are tracked at load."""
+    without_run = make_run_dataset(aim_hook_after_catalog_created, partitioned_dataset)
+    without_run.save({"a": "text a", "b": "text b"})
+
+    aim_data_set = make_run_dataset(aim_hook_during_run, partitioned_dataset)
+    track = mocker.spy(aim_data_set, "_track_artifact")
+    assert set(aim_data_set.load()) == {"a", "b"}
+    assert track.call_count == 2
+
+    # the partitions are only tracked once
+    aim_data_set.load()
+    assert track.call_count == 2
+
+
+def test_aim_dataset_deduplicates_partitions(
+    tmp_path: Path, mocker: MockerFixture, partitioned_dataset: AimArtifactDataSet
+) -> None:
+    """Check that duplicated partitions are referenced by their partition id."""
+    hook = AimHook()
+    hook.run = mocker.MagicMock()
+    writer = hook.writer = mocker.MagicMock()
+    hook.artifact_index = ArtifactIndex(tmp_path / "index.json")
+    aim_data_set = make_run_dataset(hook, partitioned_dataset)
+    aim_data_set.save({"a": "same text", "b": "same text"})
+
+    hook.run.track.assert_called_once()
+    tracked = hook.run.track.call_args.kwargs["context"]["partition"]
+    referenced = "b" if tracked == "a" else "a"
+    key = hook.run.set.call_args.args[0]
+    assert key == ("artifact_references", partitioned_dataset.name, referenced)
+
+    # the writes of the worker threads are handed to the writer
+    assert writer.flush_thread.call_count == 2
+
+
+def test_aim_dataset_saves_partitions_at_once(
+    tmp_path: Path, aim_hook_during_run: AimHook
+) -> None:
+    """Check that an overwriting partitioned dataset keeps all partitions of a save."""
+    dataset = AimArtifactDataSet(
+        artifact_type=ArtifactType.TEXT,
+        name="overwritten_partitions",
+        data_set=dict(
+            type="PartitionedDataSet",
+            path=str(tmp_path / "partitions"),
+            dataset="kedro.extras.datasets.text.TextDataSet",
+            filename_suffix=".txt",
+            overwrite=True,
+        ),
+    )
+    aim_data_set = make_run_dataset(aim_hook_during_run, dataset)
+    aim_data_set.save({f"part_{i}": f"text {i}" for i in range(10)})
+    assert len(list((tmp_path / "partitions").iterdir())) == 10
+
+    # the next save replaces all partitions of the previous one
+    aim_data_set.save({"other": "other text"})
+    assert set(aim_data_set.load()) == {"other"}
+
+
+def test_aim_dataset_samples_and_references_partitions(
+    tmp_path: Path, aim_hook_during_run: AimHook
+) -> None:
+    """Check that partitions are sampled and large partitions reference their file."""
+    dataset = AimArtifactDataSet(
+        artifact_type=ArtifactType.TEXT,
+        name="sampled_partitions",
+        data_set=dict(
+            type="PartitionedDataSet",
+            path=str(tmp_path / "partitions"),
+            dataset="kedro.extras.datasets.text.TextDataSet",
+            filename_suffix=".txt",
+        ),
+        sampling={"every_n": 2},
+        max_embedded_size=10,
+        partition_workers=1,
+    )
+    make_run_dataset(aim_hook_during_run, dataset).save(
+        {"a": "x" * 100, "b": "x" * 100, "c": "short", "d": "short"}
+    )
+
+    run = aim_hook_during_run.run
+    assert run is not None
+    metrics = [m for m in list_metrics_in_run(run) if m.name == dataset.name]
+    assert sorted(m.context.to_dict()["partition"] for m in metrics) == ["a", "c"]
+    record = run["artifact_files", "sampled_partitions", "a", "0"]
+    assert record["path"] == str(tmp_path / "partitions" / "a.txt")
+    assert record["size"] == 100
+
+
+def test_aim_dataset_references_loaded_partitions(
+    tmp_path: Path,
+    aim_hook_after_catalog_created: AimHook,
+    aim_hook_during_run: AimHook,
+) -> None:
+    """Check that large partitions which are tracked at load reference their file."""
+    dataset = AimArtifactDataSet(
+        artifact_type=ArtifactType.TEXT,
+        name="loaded_partitions",
+        data_set=dict(
+            type="PartitionedDataSet",
+            path=str(tmp_path / "partitions"),
+            dataset="kedro.extras.datasets.text.TextDataSet",
+            filename_suffix=".txt",
+        ),
+        max_embedded_size=10,
+    )
+    without_run = make_run_dataset(aim_hook_after_catalog_created, dataset)
+    without_run.save({"a": "x" * 100})
+
+    partitions = make_run_dataset(aim_hook_during_run, dataset).load()
+    assert partitions["a"]() == "x" * 100
+
+    run = aim_hook_during_run.run
+    assert run is not None
+    record = run["artifact_files", "loaded_partitions", "a"]
+    assert record["path"] == str(tmp_path / "partitions" / "a.txt")
+    assert record["size"] == 100
+
+
+def test_aim_dataset_tracks_figure_partitions(
+    tmp_path: Path, aim_hook_during_run: AimHook
+) -> None:
+    """Check that figure partitions are tracked by the thread which saves them."""
+    dataset = AimArtifactDataSet(
+        artifact_type=ArtifactType.FIGURE,
+        name="figure_partitions",
+        data_set=dict(
+            type="PartitionedDataSet",
+            path=str(tmp_path / "figures"),
+            dataset="kedro.extras.datasets.matplotlib.MatplotlibWriter",
+            filename_suffix=".png",
+        ),
+        figure_backend=FigureBackend.RASTER,
+        dpi=20,
+    )
+    fig = plt.figure(figsize=(3, 2))
+    plt.plot([1, 2, 3])
+    make_run_dataset(aim_hook_during_run, dataset).save({"a": fig, "b": fig})
+    plt.close(fig)
+
+    assert aim_hook_during_run.run is not None
+    metrics = list(list_metrics_in_run(aim_hook_during_run.run))
+    assert len([m for m in metrics if m.name == dataset.name]) == 2
+
+
+def test_aim_dataset_references_steps_of_lazy_run(
+    tmp_path: Path, mocker: MockerFixture, stream_dataset: AimArtifactStreamDataSet
+) -> None:
+    """Check that references to a lazy run contain its hash and the step."""
+    hook = AimHook()
+    run = mocker.MagicMock(hash="lazy_run")
+
+    def create_run() -> Any:
+        hook.run = run
+        return run
+
+    hook.lazy_run = LazyRun(create_run)
+    hook._main_pid = os.getpid()
+    # the writes are queued, so the run is not created by tracking the first copy
+    proxy = hook.run_proxy = mocker.MagicMock()
+    hook.artifact_index = ArtifactIndex(tmp_path / "index.json")
+    aim_data_set = make_run_dataset(hook, stream_dataset)
+    aim_data_set.save(iter(["same text", "same text"]))
+
+    proxy.track.assert_called_once()
+    proxy.set.assert_called_once_with(
+        ("artifact_references", stream_dataset.name, "1"),
+        {"run_hash": "lazy_run", "name": "text_stream", "context": {}, "step": 0},
+    )
+
+
+def test_aim_dataset_references_known_artifacts_without_encoding(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Check that known artifacts are referenced before they are encoded."""
+    hook = AimHook()
+    run = hook.run = mocker.MagicMock()
+    hook.artifact_index = ArtifactIndex(tmp_path / "index.json")
+    dataset = AimArtifactDataSet(
+        artifact_type=ArtifactType.TEXT,
+        name="joke",
+        data_set=dict(type="text.TextDataSet", filepath=str(tmp_path / "joke.md")),
+    )
+    aim_data_set = make_run_dataset(hook, dataset)
+    encode = mocker.spy(aim_data_set, "_to_aim_object")
+    aim_data_set.save("same text")
+    aim_data_set.save("same text")
+
+    encode.assert_called_once()
+    run.track.assert_called_once()
+    run.set.assert_called_once()
+
+
+def test_aim_dataset_indexes_artifacts_after_tracking(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """Check that an artifact whose tracking failed is not indexed."""
+    hook = AimHook()
+    run = hook.run = mocker.MagicMock()
+    run.track.side_effect = [RuntimeError("write failed"), None]
+    hook.artifact_index = ArtifactIndex(tmp_path / "index.json")
+    dataset = AimArtifactDataSet(
+        artifact_type=ArtifactType.TEXT,
+        name="joke",
+        data_set=dict(type="text.TextDataSet", filepath=str(tmp_path / "joke.md")),
+    )
+    aim_data_set = make_run_dataset(hook, dataset)
+    with pytest.raises(DataSetError):
+        aim_data_set.save("same text")
+    assert hook.artifact_index._added == {}
+
+    # the next save tracks the artifact instead of referencing the failed one
+    aim_data_set.save("same text")
+    assert run.track.call_count == 2
+    run.set.assert_not_called()
+    assert len(hook.artifact_index._added) == 1
+
+
+@pytest.mark.parametrize(
+    "dataset",
+    [
+        AimArtifactDataSet(
+            artifact_type=ArtifactType.FIGURE,
+            name="figure",
+            data_set=dict(type="matplotlib.MatplotlibWriter", filepath="figure.png"),
+            figure_backend=FigureBackend.RASTER,
+            dpi=20,
+        ),
+        AimArtifactDataSet(
+            artifact_type=ArtifactType.TEXT,
+            name="spilled",
+            data_set=dict(type="text.TextDataSet", filepath="spilled.md"),
+            max_embedded_size=10,
+        ),
+    ],
+)
+def test_aim_dataset_deduplicates_encoded_and_spilled_artifacts(
+    tmp_path: Path,
+    mocker: MockerFixture,
+    monkeypatch: MonkeyPatch,
+    dataset: AimArtifactDataSet,
+) -> None:
+    """Check that figures and spilled artifacts are deduplicated as well."""
+    monkeypatch.chdir(tmp_path)
+    hook = AimHook()
+    run = hook.run = mocker.MagicMock()
+    hook.artifact_index = ArtifactIndex(tmp_path / "index.json")
+    aim_data_set = make_run_dataset(hook, dataset)
+    if dataset.artifact_type == ArtifactType.FIGURE:
+        data: Any = plt.figure(figsize=(3, 2))
+        plt.plot([1, 2, 3])
+    else:
+        data = "x" * 100
+    aim_data_set.save(data)
+    aim_data_set.save(data)
+    plt.close("all")
+
+    run.track.assert_called_once()
+    references = [
+        call.args[0]
+        for call in run.set.call_args_list
+        if call.args[0][0] == "artifact_references"
+    ]
+    assert references == [("artifact_references", dataset.name)]
+
+
+@pytest.mark.parametrize(
+    "artifact_type,data_set,data",
+    [
+        (ArtifactType.TEXT, "kedro.extras.datasets.text.TextDataSet", "x" * 5000),
+        (
+            ArtifactType.IMAGE,
+            "kedro.extras.datasets.pickle.PickleDataSet",
+            np.zeros((1000, 800, 3), dtype=np.uint8),
+        ),
+        (
+            ArtifactType.IMAGE,
+            "kedro.extras.datasets.pickle.PickleDataSet",
+            np.zeros((2, 1000, 800, 3), dtype=np.uint8),
+        ),
+        (ArtifactType.AUDIO, "kedro.extras.datasets.pickle.PickleDataSet", b"a" * 5000),
+    ],
+)
+def test_aim_dataset_references_large_artifacts(
+    tmp_path: Path,
+    aim_hook_during_run: AimHook,
+    artifact_type: ArtifactType,
+    data_set: str,
+    data: Any,
+) -> None:
+    """Check that large artifacts are referenced and only a preview is tracked."""
+    path = tmp_path / "large_artifact"
+    dataset = AimArtifactDataSet(
+        artifact_type=artifact_type,
+        name="large_artifact",
+        data_set=dict(type=data_set, filepath=str(path)),
+        max_embedded_size=1000,
+    )
+    make_run_dataset(aim_hook_during_run, dataset).save(data)
+    assert path.exists()
+
+    run = aim_hook_during_run.run
+    assert run is not None
+    record = run["artifact_files", "large_artifact"]
+    assert record["path"] == str(path) and record["version"] is None
+    assert record["size"] >= 5000
+
+    metrics = list(list_metrics_in_run(run))
+    (preview,) = next(m for m in metrics if m.name == dataset.name).values.tolist()
+    if artifact_type == ArtifactType.TEXT:
+        assert preview.data.endswith(f"({record['size']} bytes stored in {path})")
+        assert len(preview.data) < 2000
+    elif artifact_type == ArtifactType.IMAGE and data.ndim == 4:
+        assert [image.size for image in preview] == [(200, 250)] * 2
+    elif artifact_type == ArtifactType.IMAGE:
+        assert preview.size == (200, 250)
+    else:
+        assert preview.data.startswith("Audio with")
+
+
+def test_aim_dataset_references_loaded_large_artifacts(
+    tmp_path: Path,
+    aim_hook_after_catalog_created: AimHook,
+    aim_hook_during_run: AimHook,
+) -> None:
+    """Check that large artifacts are referenced when they are tracked at load."""
+    dataset = AimArtifactDataSet(
+        artifact_type=ArtifactType.TEXT,
+        name="large_text",
+        data_set=dict(
+            type="kedro.extras.datasets.text.TextDataSet",
+            filepath=str(tmp_path / "large.txt"),
+            versioned=True,
+        ),
+        max_embedded_size=10,
+    )
+    make_run_dataset(aim_hook_after_catalog_created, dataset).save("x" * 100)
+    make_run_dataset(aim_hook_during_run, dataset).load()
+
+    assert aim_hook_during_run.run is not None
+    record = aim_hook_during_run.run["artifact_files", "large_text"]
+    assert record["version"] is not None and record["size"] == 100
+
+    # small artifacts and datasets without a file are stored in the repository
+    small = make_run_dataset(aim_hook_during_run, dataset)
+    small._artifact_dataset.name = "small_text"
+    small.save("x")
+    memory = AimArtifactDataSet(
+        artifact_type=ArtifactType.TEXT,
+        name="memory_text",
+        data_set=dict(type="MemoryDataSet"),
+        max_embedded_size=10,
+    )
+    make_run_dataset(aim_hook_during_run, memory).save("x" * 100)
+    files = aim_hook_during_run.run["artifact_files"]
+    assert set(files) == {"large_text"}
+
+
+@pytest.mark.parametrize(
+    "dataset, data",
+    [
+        (lazy_fixture("prefilled_datatuple"), "text"),
+        (lazy_fixture("stream_dataset"), "text"),
+        (lazy_fixture("partitioned_dataset"), {"a": "text"}),
+    ],
+)
+def test_aim_dataset_skips_tracking_for_disabled_nodes(
+    mocker: MockerFixture, dataset: Any, data: Any
+) -> None:
+    """Check that artifacts of disabled nodes are only loaded and saved."""
+    if isinstance(dataset, tuple):
+        dataset = dataset[0]
+    hook = AimHook()
+    hook.run = mocker.MagicMock()
+    hook._node_scope.disabled = True
+    aim_data_set = make_run_dataset(hook, dataset)
+
+    aim_data_set.save(data)
+    loaded = aim_data_set.load()
+    if isinstance(loaded, Iterator):
+        assert list(loaded) == ["text"]
+    elif isinstance(loaded, dict):
+        assert loaded["a"]() == "text"
+    else:
+        assert loaded == "text"
+    hook.run.track.assert_not_called()
+    assert not hook.tracked_sequences
@@ -0,0 +1,160 @@
+import pickle
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+from kedro.io import DataSetError
+from pytest_mock import MockerFixture
+
+from kedro_aim.aim.utils import sequence_key
+from kedro_aim.framework.hooks import AimHook
+from kedro_aim.io.metrics import AimMetricsDataSet, make_metrics_dataset
+
+
+@pytest.fixture
+def hook(mocker: MockerFixture) -> AimHook:
+    """Create an AimHook with a mocked run.
+
+    Args:
+        mocker: The pytest mocker fixture.
+
+    Returns:
+        A AimHook object.
+    """
+    hook = AimHook()
+    hook.run = mocker.MagicMock()
+    return hook
+
+
+def tracked(hook: AimHook) -> Any:
+    """Collect the calls of `track` on the mocked run of the hook.
+
+    Args:
+        hook: The hook with the mocked run.
+
+    Returns:
+        A list of tuples with the tracked metrics, the step and the epoch of each call.
+    """
+    return [
+        (call.args[0], call.kwargs["step"], call.kwargs["epoch"])
+        for call in hook.run.track.call_args_list  # type: ignore
+    ]
+
+
+@pytest.mark.parametrize(
+    "data", [{"loss": 0.5, "acc": 0.9}, pd.Series({"loss": 0.5, "acc": 0.9})]
+)
+def test_metrics_dataset_tracks_scalars(hook: AimHook, data: Any) -> None:
+    """Check that dicts and series are tracked with one call for all metrics."""
+    dataset = make_metrics_dataset(hook, AimMetricsDataSet(context={"subset": "val"}))
+    dataset.save(data)
+
+    assert tracked(hook) == [({"loss": 0.5, "acc": 0.9}, None, None)]
+    assert hook.run is not None
+    assert hook.run.track.call_args.kwargs["context"] == {"subset": "val"}
+    assert sequence_key("loss", {"subset": "val"}) in hook.tracked_sequences
+
+
+def test_metrics_dataset_tracks_frame_columns(hook: AimHook) -> None:
+    """Check that the numeric columns of a frame are tracked with steps and epochs."""
+    frame = pd.DataFrame(
+        {
+            "step": [0, 10, 20],
+            "epoch": [0, 0, 1],
+            "loss": [1.0, np.nan, 0.25],
+            "acc": [1, 2, 3],
+            "note": ["a", "b", "c"],
+        }
+    )
+    dataset = make_metrics_dataset(hook, AimMetricsDataSet())
+    dataset.save(frame)
+
+    # one call per row without the missing values
+    assert tracked(hook) == [
+        ({"loss": 1.0, "acc": 1.0}, 0, 0),
+        ({"acc": 2.0}, 10, 0),
+        ({"loss": 0.25, "acc": 3.0}, 20, 1),
+    ]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"loss": 0.5, "note": "a", "missing": np.nan, "count": np.int64(3)},
+        pd.Series({"loss": 0.5, "note": "a", "missing": np.nan, "count": 3}),
+    ],
+)
+def test_metrics_dataset_skips_non_numeric_scalars(hook: AimHook, data: Any) -> None:
+    """Check that values of dicts and series which are no numbers are skipped."""
+    dataset = make_metrics_dataset(hook, AimMetricsDataSet())
+    dataset.save(data)
+
+    assert tracked(hook) == [({"loss": 0.5, "count": 3}, None, None)]
+
+
+def test_metrics_dataset_tracks_rows_with_missing_steps(hook: AimHook) -> None:
+    """Check that rows with a missing step or epoch are tracked without it."""
+    frame = pd.DataFrame(
+        {"step": [0, np.nan, 20], "epoch": [0, 1, np.nan], "loss": [1.0, 0.5, 0.25]}
+    )
+    dataset = make_metrics_dataset(hook, AimMetricsDataSet())
+    dataset.save(frame)
+
+    assert tracked(hook) == [
+        ({"loss": 1.0}, 0, 0),
+        ({"loss": 0.5}, None, 1),
+        ({"loss": 0.25}, 20, None),
+    ]
+
+
+def test_metrics_dataset_renames_and_selects_metrics(hook: AimHook) -> None:
+    """Check that only the mapped columns are tracked under their new names."""
+    frame = pd.DataFrame({"loss": [1.0, 0.5], "acc": [0.1, 0.2]})
+    dataset = make_metrics_dataset(
+        hook, AimMetricsDataSet(metrics={"loss": "train_loss", "missing": "x"})
+    )
+    dataset.save(frame)
+    dataset.save({"loss": 0.1, "acc": 0.3})
+
+    assert tracked(hook) == [
+        ({"train_loss": 1.0}, None, None),
+        ({"train_loss": 0.5}, None, None),
+        ({"train_loss": 0.1}, None, None),
+    ]
+
+    # rows without any tracked metric are skipped
+    dataset.save(pd.DataFrame({"acc": [0.1]}))
+    dataset.save({"acc": 0.3})
+    assert len(tracked(hook)) == 3
+
+
+def test_metrics_dataset_without_run_and_load(mocker: MockerFixture) -> None:
+    """Check that nothing is tracked without a run and that loading fails."""
+    dataset = make_metrics_dataset(AimHook(), AimMetricsDataSet(metrics={"a": "b"}))
+    dataset.save({"a": 1.0})
+
+    with pytest.raises(DataSetError, match="write-only"):
+        dataset.load()
+    assert dataset._describe() == {"context": {}, "metrics": {"a": "b"}}
+
+
+def test_metrics_dataset_rejects_unknown_data(hook: AimHook) -> None:
+    """Check that data which is no dict, series or frame is rejected."""
+    dataset = make_metrics_dataset(hook, AimMetricsDataSet())
+    with pytest.raises(DataSetError, match="Can not track metrics of type `list`"):
+        dataset.save([1.0])
+
+
+def test_pickled_metrics_dataset_tracks_through_run(mocker: MockerFixture) -> None:
+    """Check that a pickled dataset keeps no reference to the hook."""
+    hook = AimHook()
+    dataset = pickle.loads(
+        pickle.dumps(make_metrics_dataset(hook, AimMetricsDataSet()))
+    )
+    assert dataset._hook is None and dataset._run is None
+
+    # the copy tracks through the run it was given
+    dataset._run = mocker.MagicMock()
+    dataset.save({"loss": 1.0})
+    dataset._run.track.assert_called_once()
@@ -0,0 +1,80 @@
+from typing import Any, Dict, List, Optional
+
+import pytest
+from pydantic import ValidationError
+from pytest_mock import MockerFixture
+
+from kedro_aim.io.artifacts import SamplingOptions
+from kedro_aim.io.artifacts.sampling import ArtifactSampler
+
+
+def sample_all(sampler: ArtifactSampler, n_saves: int) -> List[Optional[int]]:
+    """Offer `n_saves` saves to a sampler.
+
+    Args:
+        sampler: The sampler.
+        n_saves: The number of saves.
+
+    Returns:
+        The steps with which the saves are tracked right away.
+    """
+    return [sampler.sample(f"data_{i}") for i in range(n_saves)]
+
+
+@pytest.mark.parametrize(
+    "options,expected",
+    [
+        ({}, [0, 1, 2, 3, 4, 5, 6]),
+        ({"every_n": 3}, [0, None, None, 3, None, None, 6]),
+    ],
+)
+def test_sampler_tracks_every_nth_save(
+    options: Dict[str, Any], expected: List[Optional[int]]
+) -> None:
+    """Check that every n-th save is tracked with the index of the save as step."""
+    sampler = ArtifactSampler(SamplingOptions(**options))
+    assert sample_all(sampler, 7) == expected
+
+
+def test_sampler_respects_min_interval(mocker: MockerFixture) -> None:
+    """Check that saves shortly after the last tracked save are skipped."""
+    clock = mocker.patch("kedro_aim.io.artifacts.sampling.time.monotonic")
+    sampler = ArtifactSampler(SamplingOptions(min_interval=10))
+
+    tracked = []
+    for now in [0, 5, 10, 19, 25]:
+        clock.return_value = now
+        tracked.append(sampler.sample("data"))
+    assert tracked == [0, None, 2, None, 4]
+
+
+def test_sampler_keeps_reservoir_of_candidates() -> None:
+    """Check that the reservoir keeps a fixed number of samples until it is drained."""
+    sampler = ArtifactSampler(SamplingOptions(every_n=2, reservoir=3, seed=0))
+    assert sample_all(sampler, 100) == [None] * 100
+
+    samples = sampler.drain()
+    steps = [step for step, _ in samples]
+    assert len(samples) == 3 and steps == sorted(steps)
+    assert all(step % 2 == 0 and data == f"data_{step}" for step, data in samples)
+    assert sampler.drain() == []
+
+    # the sample is reproducible with the same seed
+    again = ArtifactSampler(SamplingOptions(every_n=2, reservoir=3, seed=0))
+    sample_all(again, 100)
+    assert again.drain() == samples
+
+
+def test_sampler_uses_given_steps() -> None:
+    """Check that explicit steps, e.g. of streams, are kept."""
+    sampler = ArtifactSampler(SamplingOptions(every_n=2))
+    assert [sampler.sample("data", step) for step in [10, 11, 12]] == [10, None, 12]
+
+
+@pytest.mark.parametrize(
+    "options", [{"every_n": 0}, {"reservoir": -1}, {"min_interval": -1}, {"n": 1}]
+)
+def test_invalid_sampling_options(options: Dict[str, Any]) -> None:
+    """Check that invalid sampling options are rejected."""
+    with pytest.raises(ValidationError):
+        SamplingOptions(**options)
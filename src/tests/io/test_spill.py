@@ -0,0 +1,107 @@
+import hashlib
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from kedro.extras.datasets.text import TextDataSet
+from kedro.io import MemoryDataSet, Version
+from PIL import Image as PILImage
+
+from kedro_aim.io.artifacts.spill import (
+    SpilledArtifact,
+    exceeds_size,
+    file_location,
+    payload_hash,
+    payload_of,
+)
+
+
+def test_payload_of() -> None:
+    """Check that the raw bytes of the supported types are returned."""
+    assert bytes(payload_of("äb")) == "äb".encode()  # type: ignore
+    assert bytes(payload_of(b"ab")) == b"ab"  # type: ignore
+    array = np.arange(12, dtype=np.int16).reshape(3, 4)[:, ::2]
+    assert payload_of(array).nbytes == 12  # type: ignore
+    image = PILImage.new("RGB", (4, 2))
+    assert payload_of(image).nbytes == 24  # type: ignore
+    assert payload_of([1, 2]) is None
+
+
+def test_payload_hash() -> None:
+    """Check that the raw data, its layout and the settings are hashed."""
+    assert payload_hash("joke") == payload_hash("joke")
+    assert payload_hash("joke") != payload_hash("other joke")
+    assert payload_hash("joke", 256) != payload_hash("joke", 128)
+
+    array = np.zeros((2, 3), dtype=np.uint8)
+    assert payload_hash(array) == payload_hash(array.copy())
+    assert payload_hash(array) != payload_hash(array.reshape(3, 2))
+    image = PILImage.new("RGB", (4, 2))
+    assert payload_hash(image) != payload_hash(PILImage.new("RGB", (2, 4)))
+
+    # batches are hashed item by item
+    assert payload_hash([array, image]) == payload_hash([array.copy(), image])
+    assert payload_hash([array, object()]) is None
+    assert payload_hash(None) is None
+
+
+class EncodeCountingStr(str):
+    """A string which counts how often it is encoded."""
+
+    encodes = 0
+
+    def encode(self, *args: Any, **kwargs: Any) -> bytes:
+        """Encode the string and count the call.
+
+        Args:
+            args: The positional arguments of `str.encode`.
+            kwargs: The keyword arguments of `str.encode`.
+
+        Returns:
+            The encoded string.
+        """
+        EncodeCountingStr.encodes += 1
+        return super().encode(*args, **kwargs)
+
+
+def test_exceeds_size() -> None:
+    """Check that the size is estimated and strings are only encoded if necessary."""
+    long, short = EncodeCountingStr("a" * 11), EncodeCountingStr("a" * 2)
+    assert exceeds_size(long, 10) and not exceeds_size(short, 10)
+    assert EncodeCountingStr.encodes == 0
+    assert exceeds_size(EncodeCountingStr("ä" * 6), 10)
+    assert not exceeds_size(EncodeCountingStr("a" * 6), 10)
+    assert EncodeCountingStr.encodes == 2
+
+    assert exceeds_size(b"a" * 11, 10) and not exceeds_size(b"a" * 10, 10)
+    assert exceeds_size(np.zeros(3, dtype=np.int32), 10)
+    image = PILImage.new("RGB", (4, 2))
+    assert exceeds_size(image, 23) and not exceeds_size(image, 24)
+    assert not exceeds_size([1] * 100, 10)
+
+
+def test_file_location(tmp_path: Path) -> None:
+    """Check that the path and version of the written file are found."""
+    path = tmp_path / "text.txt"
+    location = file_location(TextDataSet(str(path)), saved=True)
+    assert location == {"path": str(path), "protocol": "file", "version": None}
+    assert file_location(MemoryDataSet(), saved=True) is None
+
+    versioned = TextDataSet(str(path), version=Version(None, None))
+    versioned.save("text")
+    saved = file_location(versioned, saved=True)
+    assert saved is not None and saved["version"] is not None
+    assert Path(saved["path"]).read_text() == "text"
+    assert file_location(versioned, saved=False) == saved
+
+
+def test_spilled_artifact_record() -> None:
+    """Check that the record contains the size and the hash of the payload."""
+    record = SpilledArtifact("content", {"path": "a.txt"}).record()
+    assert record == {
+        "path": "a.txt",
+        "size": 7,
+        "hash": hashlib.blake2b(b"content", digest_size=20).hexdigest(),
+    }
+    record = SpilledArtifact([1, 2], {"path": "a.pkl"}).record()
+    assert record == {"path": "a.pkl", "size": None, "hash": None}
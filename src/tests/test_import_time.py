@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+from aim.ext.resource import DEFAULT_SYSTEM_TRACKING_INT
+
+from kedro_aim.config import model
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """Import a module in a fresh interpreter with `python -X importtime`.
+
+    Args:
+        module: The name of the module.
+
+    Returns:
+        Mapping from the name of each imported module to its cumulative import time
+        in microseconds.
+    """
+    env = {**os.environ, "PYTHONWARNINGS": "ignore"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "kedro_aim.framework.hooks.aim_hook",
+        "kedro_aim.framework.cli.cli",
+        "kedro_aim.io.artifacts",
+        "kedro_aim.io.metrics",
+    ],
+)
+def test_entry_points_do_not_import_aim(module: str) -> None:
+    """Check that aim is only imported once a run is created or an artifact tracked."""
+    times = import_times(module)
+    assert module in times
+    aim_modules = [name for name in times if name.split(".")[0] == "aim"]
+    assert aim_modules == []
+
+
+def test_default_system_tracking_interval_matches_aim() -> None:
+    """Check that the copied default of the tracking interval is the one of aim."""
+    assert model.DEFAULT_SYSTEM_TRACKING_INT == DEFAULT_SYSTEM_TRACKING_INT